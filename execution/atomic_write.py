@@ -0,0 +1,48 @@
+"""
+atomic_write.py — Crash-safe file replacement shared by every pipeline stage.
+
+write_atomic() writes to a temp file in the target's directory, fsyncs it
+and os.replace()s it over the target. A reader (the live site, the next run,
+a concurrent cache lookup) sees either the old file or the new one, never a
+torn write, and a failed write leaves no temp file behind.
+
+mkstemp creates files 0600; most outputs are served by the site, so the
+default mode is 0644. Pass mode=None to keep mkstemp's private mode, or the
+target's current mode to preserve it.
+
+Used by data_bundles, poster_store, image_fetch, prerender_events,
+event_changes, response_cache, js_parser, git_publish and social_calendar.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+PUBLIC_MODE = 0o644
+
+
+def write_atomic(path: Path, data: bytes | str | Iterable[bytes | str], mode: int | None = PUBLIC_MODE,
+                 fsync: bool = True) -> Path:
+    """
+    Atomically replace `path` with `data`: bytes, a str, or an iterable of
+    str/bytes chunks (streamed, so a large file is never joined in memory).
+    Text is written as UTF-8 with no newline translation. Returns `path`.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            chunks = [data] if isinstance(data, (bytes, bytearray, str)) else data
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return path
@@ -0,0 +1,60 @@
+"""
+compression_stats.py — Best-case compressed sizes for the static data bundles.
+
+Firebase Hosting compresses js/data bundles on the fly and negotiates the
+encoding from Accept-Encoding, so the site serves only the plain JSON. This
+module measures what maximum compression (gzip level 9, Brotli quality 11
+in text mode) would make of each bundle, in memory, for the manifest and
+.tmp/run_metrics.json. Nothing is written to disk.
+
+Brotli is optional (pip install brotli); without it only gzip is measured.
+Bundles are measured in parallel — zlib and brotli release the GIL.
+"""
+
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def compressed_sizes(name: str, data: bytes) -> dict:
+    """Size stats for one bundle: bytes, gzipBytes/gzipRatio and (with brotli) brBytes/brRatio."""
+    stats = {"file": name, "bytes": len(data), "encodings": []}
+
+    outputs = {"gzip": lambda: gzip.compress(data, compresslevel=9, mtime=0)}
+    brotli = _brotli()
+    if brotli is not None:
+        outputs["br"] = lambda: brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+
+    for encoding, compress in outputs.items():
+        size = len(compress())
+        key = "brBytes" if encoding == "br" else "gzipBytes"
+        stats[key] = size
+        stats[key.replace("Bytes", "Ratio")] = round(size / len(data), 4) if data else 0.0
+        stats["encodings"].append(encoding)
+
+    return stats
+
+
+def measure(bundles: dict[str, bytes], workers: int | None = None) -> list[dict]:
+    """compressed_sizes() for every {name: data} in parallel. Returns stats in input order."""
+    if not bundles:
+        return []
+    with ThreadPoolExecutor(max_workers=workers or min(8, len(bundles))) as pool:
+        return list(pool.map(lambda item: compressed_sizes(*item), bundles.items()))
+
+
+def summarize(stats: list[dict]) -> dict:
+    """Run-metrics section: per-file sizes/ratios plus totals."""
+    total = sum(s["bytes"] for s in stats)
+    summary = {"files": stats, "totalBytes": total}
+    for key in ("gzipBytes", "brBytes"):
+        if stats and all(key in s for s in stats):
+            summary[f"total{key[0].upper()}{key[1:]}"] = sum(s[key] for s in stats)
+    return summary
@@ -0,0 +1,138 @@
+"""
+data_bundles.py — Emit content-hashed, per-dataset JSON bundles for the site.
+
+js/events-data.js stays the source of truth (the pipeline, admin seeding and
+validation all read it), but the public pages load each dataset from its own
+minified file named after a hash of its contents:
+
+    js/data/events.3f9c2a1b7d.json
+    js/data/dining.0be41c9a52.json
+    js/data/manifest.json   → {"datasets": {"events": {"file": ..., "bytes": ...}, ...}}
+
+A nightly event refresh therefore only changes events.<hash>.json; the dining,
+club and hotel bundles keep their URLs and stay cached (immutable) in the
+browser, the CDN and the service worker.
+
+Hosting compresses the bundles itself. The manifest records what maximum
+gzip/Brotli compression would make of each one (compression_stats.py,
+measured in memory only for new bundles), and sizes and ratios go to
+.tmp/run_metrics.json.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import run_metrics
+from atomic_write import write_atomic
+from js_parser import extract_js_array
+from compression_stats import measure, summarize
+
+# ---------- Configuration ----------
+REPO_ROOT = Path(__file__).resolve().parent.parent
+EVENTS_DATA_FILE = REPO_ROOT / "js" / "events-data.js"
+BUNDLES_DIR = REPO_ROOT / "js" / "data"
+MANIFEST_NAME = "manifest.json"
+
+# Bundle name → exported array in events-data.js
+DATASETS = {
+    "events": "LOCAL_EVENTS",
+    "clubs": "LOCAL_CLUBS",
+    "restaurants": "LOCAL_RESTAURANTS",
+    "dining": "DINING_RESTAURANTS",
+    "hotels": "LOCAL_HOTELS",
+    "venues": "VENUE_VENDORS",
+}
+
+HASH_LENGTH = 10
+
+
+def serialize_dataset(items: list) -> bytes:
+    """Minified, key-order-preserving JSON — stable for identical input."""
+    return json.dumps(items, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_datasets(source: Path = EVENTS_DATA_FILE) -> dict[str, list]:
+    """Parse every bundled array out of events-data.js."""
+    content = source.read_text(encoding="utf-8")
+    return {name: extract_js_array(content, array) for name, array in DATASETS.items()}
+
+
+def write_bundles(datasets: dict[str, list], out_dir: Path = BUNDLES_DIR) -> tuple[dict, list[Path]]:
+    """
+    Write each dataset to `<name>.<hash>.json` and refresh the manifest.
+
+    Bundles are content-addressed, so an existing file is never rewritten.
+    Superseded bundles are deleted once the new manifest is in place.
+
+    Returns (manifest, paths written or deleted).
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+    try:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8")).get("datasets", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        previous = {}
+    manifest = {"datasets": {}}
+    touched = []
+    to_measure = {}
+
+    for name, items in datasets.items():
+        data = serialize_dataset(items)
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        filename = f"{name}.{digest}.json"
+        path = out_dir / filename
+        if not path.exists():
+            write_atomic(path, data)
+            touched.append(path)
+        manifest["datasets"][name] = {"file": filename, "bytes": len(data), "count": len(items)}
+        earlier = previous.get(name, {})
+        if earlier.get("file") == filename and "encodings" in earlier:
+            manifest["datasets"][name]["encodings"] = earlier["encodings"]  # Same content, same sizes
+        else:
+            to_measure[name] = data
+
+    for name, stats in zip(to_measure, measure(to_measure)):
+        manifest["datasets"][name]["encodings"] = {
+            encoding: stats["brBytes" if encoding == "br" else "gzipBytes"] for encoding in stats["encodings"]
+        }
+
+    manifest_bytes = json.dumps(manifest, indent=2).encode("utf-8") + b"\n"
+    if not manifest_path.exists() or manifest_path.read_bytes() != manifest_bytes:
+        write_atomic(manifest_path, manifest_bytes)
+        touched.append(manifest_path)
+
+    current = {entry["file"] for entry in manifest["datasets"].values()}
+    for stale in out_dir.glob("*.*.json"):
+        if stale.name not in current and stale.name.split(".", 1)[0] in datasets:
+            stale.unlink()
+            touched.append(stale)
+
+    return manifest, touched
+
+
+def build_bundles(source: Path = EVENTS_DATA_FILE, out_dir: Path = BUNDLES_DIR) -> list[Path]:
+    """Regenerate js/data/ from events-data.js. Returns the paths that changed."""
+    manifest, touched = write_bundles(load_datasets(source), out_dir)
+    run_metrics.record("compression", compression_metrics(manifest))
+    return touched
+
+
+def compression_metrics(manifest: dict) -> dict:
+    """Per-bundle sizes and compression ratios, in compression_stats.summarize() shape."""
+    files = []
+    for entry in manifest["datasets"].values():
+        stats = {"file": entry["file"], "bytes": entry["bytes"], "encodings": list(entry.get("encodings", {}))}
+        for encoding, size in entry.get("encodings", {}).items():
+            key = "brBytes" if encoding == "br" else "gzipBytes"
+            stats[key] = size
+            stats[key.replace("Bytes", "Ratio")] = round(size / entry["bytes"], 4) if entry["bytes"] else 0.0
+        files.append(stats)
+    return summarize(files)
+
+
+if __name__ == "__main__":
+    changed = build_bundles()
+    for path in changed:
+        print(f"  [OK] {path.relative_to(REPO_ROOT)}")
+    print(f"[OK] {len(changed)} bundle file(s) changed in {BUNDLES_DIR.relative_to(REPO_ROOT)}")
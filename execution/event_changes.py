@@ -0,0 +1,168 @@
+"""
+event_changes.py — Changeset between two pipeline runs, as a JSON-lines feed.
+
+update_dtxent compares the run's merged events with the previous run's
+snapshot in the event store and writes one record per change:
+
+    .tmp/changes/<run_id>.jsonl
+
+    {"runId": "...", "previousRunId": "...", "type": "rescheduled", "key": "...",
+     "previousKey": "...", "changes": {"eventDate": ["2027-02-20T20:00:00", "2027-02-27T20:00:00"]},
+     "event": {...}}
+
+Change types:
+    added, removed          — key only in the current / previous snapshot
+    rescheduled             — same artist + venue, different date (key changed)
+    venue_changed           — same artist + date, different venue (key changed)
+    ticket_url_changed      — same key, different ticketUrl
+    image_changed           — same key, different imageName / imageUrl
+
+Keys are event_keys.event_id (artist + date + venue), so a reschedule or a
+venue move shows up as one removed and one added key; those pairs are folded
+into a single rescheduled / venue_changed record.
+
+Downstream stages subscribe with a named cursor:
+
+    for run_id, changes in pending("social_posts"):
+        ...
+        ack("social_posts", run_id)
+"""
+
+import json
+import re
+from pathlib import Path
+
+from atomic_write import write_atomic
+from event_keys import event_id
+
+# ---------- Configuration ----------
+DTXENT_DIR = Path(__file__).resolve().parent.parent
+CHANGES_DIR = DTXENT_DIR / ".tmp" / "changes"
+
+IMAGE_FIELDS = ("imageName", "imageUrl")
+
+
+def _norm(value) -> str:
+    return re.sub(r"[^a-z0-9]", "", (value or "").lower())
+
+
+def _pair(removed: dict[str, dict], added: dict[str, dict], match_key) -> list[tuple[str, str]]:
+    """Greedily pair removed/added keys that agree on `match_key`, in date order."""
+    waiting: dict[str, list[str]] = {}
+    for key in sorted(removed, key=lambda k: removed[k].get("eventDate") or ""):
+        waiting.setdefault(match_key(removed[key]), []).append(key)
+
+    pairs = []
+    for key in sorted(added, key=lambda k: added[k].get("eventDate") or ""):
+        candidates = waiting.get(match_key(added[key]))
+        if candidates:
+            pairs.append((candidates.pop(0), key))
+    for old_key, new_key in pairs:
+        del removed[old_key]
+        del added[new_key]
+    return pairs
+
+
+def _record(change_type: str, key: str, event: dict, fields: dict | None = None, previous_key: str | None = None) -> dict:
+    record = {"type": change_type, "key": key}
+    if previous_key is not None:
+        record["previousKey"] = previous_key
+    if fields:
+        record["changes"] = fields
+    record["event"] = event
+    return record
+
+
+def _changed(before: dict, after: dict, fields: tuple[str, ...]) -> dict:
+    return {f: [before.get(f), after.get(f)] for f in fields if before.get(f) != after.get(f)}
+
+
+def diff_snapshots(previous: dict[str, dict], current: dict[str, dict]) -> list[dict]:
+    """
+    Change records between two {key: event} snapshots. A key whose ticket URL
+    and image both changed yields two records, so each subscriber can filter
+    on the types it cares about.
+    """
+    removed = {k: previous[k] for k in previous.keys() - current.keys()}
+    added = {k: current[k] for k in current.keys() - previous.keys()}
+
+    changes = []
+    for old_key, new_key in _pair(removed, added, lambda e: (_norm(e.get("artistName")), _norm(e.get("venueName")))):
+        fields = _changed(previous[old_key], current[new_key], ("eventDate",))
+        changes.append(_record("rescheduled", new_key, current[new_key], fields, old_key))
+    for old_key, new_key in _pair(removed, added, lambda e: (_norm(e.get("artistName")), (e.get("eventDate") or "")[:10])):
+        fields = _changed(previous[old_key], current[new_key], ("venueName", "venueCity", "venueState"))
+        changes.append(_record("venue_changed", new_key, current[new_key], fields, old_key))
+
+    for key in sorted(current.keys() & previous.keys()):
+        before, after = previous[key], current[key]
+        if before == after:
+            continue
+        if fields := _changed(before, after, ("ticketUrl",)):
+            changes.append(_record("ticket_url_changed", key, after, fields))
+        if fields := _changed(before, after, IMAGE_FIELDS):
+            changes.append(_record("image_changed", key, after, fields))
+
+    changes.extend(_record("added", key, added[key]) for key in sorted(added))
+    changes.extend(_record("removed", key, removed[key]) for key in sorted(removed))
+    return changes
+
+
+def diff_events(previous: list[dict], current: list[dict]) -> list[dict]:
+    """diff_snapshots for plain event lists (keys computed with event_id)."""
+    return diff_snapshots({event_id(e): e for e in previous}, {event_id(e): e for e in current})
+
+
+def write_changeset(changes: list[dict], run_id: str, previous_run_id: str | None,
+                    changes_dir: Path = CHANGES_DIR) -> Path:
+    """
+    Write .tmp/changes/<run_id>.jsonl atomically. An empty file is still
+    written so subscribers can tell "no changes" from "run not processed".
+    """
+    changes_dir.mkdir(parents=True, exist_ok=True)
+    path = changes_dir / f"{run_id}.jsonl"
+    lines = [
+        json.dumps({"runId": run_id, "previousRunId": previous_run_id, **change}, ensure_ascii=False)
+        for change in changes
+    ]
+    return write_atomic(path, (line + "\n" for line in lines), mode=None)
+
+
+def read_changeset(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(changes: list[dict]) -> dict:
+    """Counts per change type (run metrics / log line)."""
+    counts: dict[str, int] = {}
+    for change in changes:
+        counts[change["type"]] = counts.get(change["type"], 0) + 1
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Subscribers
+# ---------------------------------------------------------------------------
+
+def _cursor_file(consumer: str, changes_dir: Path) -> Path:
+    return changes_dir / f".cursor-{consumer}"
+
+
+def pending(consumer: str, changes_dir: Path = CHANGES_DIR) -> list[tuple[str, list[dict]]]:
+    """Changesets newer than the consumer's cursor, oldest first: [(run_id, changes)]."""
+    if not changes_dir.exists():
+        return []
+    cursor_file = _cursor_file(consumer, changes_dir)
+    cursor = cursor_file.read_text(encoding="utf-8").strip() if cursor_file.exists() else ""
+    return [
+        (path.stem, read_changeset(path))
+        for path in sorted(changes_dir.glob("*.jsonl"))
+        if path.stem > cursor
+    ]
+
+
+def ack(consumer: str, run_id: str, changes_dir: Path = CHANGES_DIR):
+    """Move the consumer's cursor past `run_id`."""
+    changes_dir.mkdir(parents=True, exist_ok=True)
+    _cursor_file(consumer, changes_dir).write_text(run_id + "\n", encoding="utf-8")
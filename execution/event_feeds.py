@@ -0,0 +1,188 @@
+"""
+event_feeds.py — Materialized read-model documents for the public events grid.
+
+The landing page (js/events-public.js) and the /events index (eventIndexSSR)
+used to filter, sort and regroup the raw event list on every visit. The sync
+scripts now publish the finished result once per run:
+
+    feeds/upcoming             → next FEED_LIMIT grouped events (+ city/month directory)
+    feeds/by-city-<citySlug>   → upcoming events in one city
+    feeds/by-month-<yyyy-mm>   → upcoming events starting in one month
+
+Firestore document paths need an even number of segments, so the city and
+month feeds are sibling documents with a prefixed id rather than nested
+collections.
+
+Each feed holds display-ready summaries: multi-date runs of the same artist
+at the same venue are merged into one entry with a sorted `dates` list,
+exactly like processEventsForDisplay(). Feeds are only rewritten when their
+content changes, and feeds for cities/months that emptied out are deleted.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from event_keys import lookup_keys, parse_event_datetime, to_slug
+from firestore_client import SERVER_TIMESTAMP
+
+# ---------- Configuration ----------
+FEEDS_COLLECTION = "feeds"
+FEED_LIMIT = 60                     # eventIndexSSR / landing grid size
+PAST_GRACE = timedelta(hours=6)     # Same cutoff as the landing page filter
+
+MONTHS_SHORT = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+# Event fields the cards and the detail modal read
+SUMMARY_FIELDS = (
+    "artistName", "eventName", "eventDate", "venueName", "venueCity", "venueState",
+    "ticketUrl", "imageAlt", "imagePosition", "schedule", "description", "tmEventId", "dates",
+)
+
+
+def _image_url(event: dict) -> str:
+    """
+    Same precedence as processEventsForDisplay (page-relative asset paths):
+    migrated ../assets/ imageUrl, then any other imageUrl, then imageName.
+    """
+    image_url = event.get("imageUrl", "")
+    if image_url.startswith("../assets/"):
+        return image_url[len("../"):]
+    if image_url:
+        return image_url
+    if event.get("imageName"):
+        name = event["imageName"]
+        return name if name.startswith("http") else f"assets/{name}"
+    return "assets/dtxent-logo.png"
+
+
+def build_summaries(events: list[dict], doc_ids: list[str], now: datetime | None = None) -> list[dict]:
+    """
+    Upcoming published events as display-ready summaries, grouped by
+    artist + venue and sorted by first date.
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    cutoff = now - PAST_GRACE
+
+    dated = []
+    for event, doc_id in zip(events, doc_ids):
+        if event.get("isPublished") is False:
+            continue
+        dt = parse_event_datetime(event.get("eventDate", ""))
+        if dt is None or dt < cutoff:
+            continue
+        dated.append((dt, doc_id, event))
+    dated.sort(key=lambda item: item[0])
+
+    groups: dict[str, dict] = {}
+    for dt, doc_id, event in dated:
+        key = f"{event.get('artistName', '').lower().strip()}|{event.get('venueName', '').lower().strip()}"
+        existing = groups.get(key)
+        if existing is None:
+            summary = {field: event[field] for field in SUMMARY_FIELDS if event.get(field)}
+            if len(summary.get("dates", [])) < 2:
+                summary.pop("dates", None)
+            summary.update({
+                "id": doc_id,
+                "slug": lookup_keys(event).get("slug", ""),
+                "imageUrl": _image_url(event),
+                "displayMonth": MONTHS_SHORT[dt.month - 1],
+                "displayDay": dt.day,
+                "_dt": dt,
+            })
+            groups[key] = summary
+            continue
+
+        if "dates" not in existing:
+            existing["dates"] = [{"eventDate": existing["eventDate"], "ticketUrl": existing.get("ticketUrl", "")}]
+        if all(parse_event_datetime(d["eventDate"]) != dt for d in existing["dates"]):
+            existing["dates"].append({"eventDate": event["eventDate"], "ticketUrl": event.get("ticketUrl", "")})
+
+    return list(groups.values())
+
+
+def build_feeds(events: list[dict], doc_ids: list[str], now: datetime | None = None) -> dict[str, dict]:
+    """Map feed document id → feed content (without generatedAt)."""
+    summaries = build_summaries(events, doc_ids, now)
+
+    by_city: dict[str, list[dict]] = {}
+    by_month: dict[str, list[dict]] = {}
+    city_labels: dict[str, str] = {}
+    for summary in summaries:
+        city = summary.get("venueCity", "")
+        city_slug = to_slug(city)
+        if city_slug:
+            by_city.setdefault(city_slug, []).append(summary)
+            city_labels.setdefault(city_slug, city)
+        by_month.setdefault(f"{summary['_dt']:%Y-%m}", []).append(summary)
+
+    def feed(items: list[dict], label: str, limit: int | None = None) -> dict:
+        trimmed = items[:limit] if limit else items
+        return {
+            "label": label,
+            "count": len(trimmed),
+            "total": len(items),
+            "events": [{k: v for k, v in s.items() if not k.startswith("_")} for s in trimmed],
+        }
+
+    feeds = {}
+    upcoming = feed(summaries, "Upcoming Events", FEED_LIMIT)
+    upcoming["cities"] = [{"slug": slug, "label": city_labels[slug], "count": len(items)}
+                          for slug, items in sorted(by_city.items())]
+    upcoming["months"] = [{"key": key, "label": f"{MONTHS[int(key[5:]) - 1]} {key[:4]}", "count": len(items)}
+                          for key, items in sorted(by_month.items())]
+    feeds["upcoming"] = upcoming
+
+    for slug, items in by_city.items():
+        feeds[f"by-city-{slug}"] = feed(items, city_labels[slug])
+    for key, items in by_month.items():
+        feeds[f"by-month-{key}"] = feed(items, f"{MONTHS[int(key[5:]) - 1]} {key[:4]}")
+    return feeds
+
+
+def publish_feeds(db, events: list[dict], doc_ids: list[str], now: datetime | None = None) -> dict:
+    """
+    Write changed feed documents and delete feeds that no longer have events.
+
+    Existing feeds are read in one get_all round trip; all writes go out in
+    a single batch (feed count is bounded by cities + months + 1).
+
+    Returns {"written": N, "unchanged": N, "deleted": N}. Raises ValueError
+    on an empty event list — that's a failed load, not a site with no
+    events, and publishing it would delete every city and month feed.
+    """
+    if not events:
+        raise ValueError("Refusing to publish feeds from an empty event list")
+    feeds = build_feeds(events, doc_ids, now)
+    feeds_ref = db.collection(FEEDS_COLLECTION)
+
+    # The upcoming feed's directory tells us which city/month feeds exist today
+    upcoming_snap = feeds_ref.document("upcoming").get()
+    previous_ids = {"upcoming"}
+    if upcoming_snap.exists:
+        previous = upcoming_snap.to_dict() or {}
+        previous_ids |= {f"by-city-{c['slug']}" for c in previous.get("cities", [])}
+        previous_ids |= {f"by-month-{m['key']}" for m in previous.get("months", [])}
+
+    refs = [feeds_ref.document(feed_id) for feed_id in feeds if feed_id != "upcoming"]
+    existing = {snap.id: snap.to_dict() for snap in db.get_all(refs) if snap.exists} if refs else {}
+    if upcoming_snap.exists:
+        existing["upcoming"] = upcoming_snap.to_dict()
+
+    stats = {"written": 0, "unchanged": 0, "deleted": 0}
+    batch = db.batch()
+    for feed_id, content in feeds.items():
+        current = existing.get(feed_id)
+        if current is not None and {k: v for k, v in current.items() if k != "generatedAt"} == content:
+            stats["unchanged"] += 1
+            continue
+        batch.set(feeds_ref.document(feed_id), {**content, "generatedAt": SERVER_TIMESTAMP})
+        stats["written"] += 1
+
+    for feed_id in previous_ids - feeds.keys():
+        batch.delete(feeds_ref.document(feed_id))
+        stats["deleted"] += 1
+
+    if stats["written"] or stats["deleted"]:
+        batch.commit()
+    return stats
@@ -0,0 +1,109 @@
+"""
+event_keys.py — Denormalized lookup keys for event documents.
+
+eventPageSSR resolves /events/<artist>-<venue>-<yyyy-mm-dd> to an event. With
+the keys below stored on each document (and a slugs/{slug} pointer), that is
+a direct document get instead of a day-range query filtered in JavaScript:
+
+    slug       "cafe-tacvba-payne-arena-2026-05-09"
+    artistSlug "cafe-tacvba"
+    venueSlug  "payne-arena"
+    dateKey    "2026-05-09"
+
+to_slug() must stay identical to toSlug() in functions/ssr/helpers.js.
+"""
+
+import re
+import unicodedata
+from datetime import datetime, timezone
+from itertools import islice
+
+RELATED_LIMIT = 4  # "More shows" cards per section on the event page
+
+
+def to_slug(value: str) -> str:
+    """Same rules as helpers.toSlug: NFD, strip combining marks, lowercase, hyphenate."""
+    if not value:
+        return ""
+    folded = "".join(ch for ch in unicodedata.normalize("NFD", value) if not "\u0300" <= ch <= "\u036f")
+    return re.sub(r"[^a-z0-9]+", "-", folded.lower()).strip("-")
+
+
+def event_id(event: dict) -> str:
+    """Normalized event key — same rules as sync_firestore.generate_event_id (the Firestore doc id)."""
+    artist = re.sub(r"[^a-z0-9]", "", (event.get("artistName") or "").lower())
+    venue = re.sub(r"[^a-z0-9]", "", (event.get("venueName") or "").lower())
+    return f"{artist}_{(event.get('eventDate') or '')[:10]}_{venue}"
+
+
+def parse_event_datetime(value: str) -> datetime | None:
+    """Parse an events-data.js date. Naive wall-clock times are stored as UTC in Firestore."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            dt = datetime.strptime(value[:10], "%Y-%m-%d")
+        except ValueError:
+            return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def lookup_keys(event: dict) -> dict:
+    """
+    Slug fields for one event. Empty dict if the event has no page
+    (missing artist, venue or date) — helpers.buildEventCard links need all three.
+    """
+    dt = parse_event_datetime(event.get("eventDate", ""))
+    artist_slug = to_slug(event.get("artistName", ""))
+    venue_slug = to_slug(event.get("venueName", ""))
+    if dt is None or not artist_slug or not venue_slug:
+        return {}
+    date_key = f"{dt:%Y-%m-%d}"
+    return {
+        "slug": f"{artist_slug}-{venue_slug}-{date_key}",
+        "artistSlug": artist_slug,
+        "venueSlug": venue_slug,
+        "dateKey": date_key,
+    }
+
+
+def related_ids(events: list[dict], doc_ids: list[str], now: datetime | None = None) -> list[dict]:
+    """
+    Precompute eventPageSSR's "More <artist> shows" / "More events at <venue>"
+    lists as document ids, aligned with `events`.
+
+    Same selection as the old queries: upcoming published events with the same
+    artistName / venueName in date order, excluding the event itself, capped
+    at RELATED_LIMIT. The venue list also drops the event's own artist.
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    dated = [(parse_event_datetime(e.get("eventDate", "")), doc_id, e) for e, doc_id in zip(events, doc_ids)]
+    upcoming = sorted(
+        ((dt, doc_id, e) for dt, doc_id, e in dated if dt is not None and dt >= now and e.get("isPublished", True)),
+        key=lambda item: item[0],
+    )
+
+    # Slug each artist once; the scans below stop as soon as a list is full
+    by_artist: dict[str, list[str]] = {}
+    by_venue: dict[str, list[tuple[str, str]]] = {}
+    for _, doc_id, e in upcoming:
+        by_artist.setdefault(e.get("artistName", ""), []).append(doc_id)
+        by_venue.setdefault(e.get("venueName", ""), []).append((doc_id, to_slug(e.get("artistName", ""))))
+
+    related = []
+    for event, doc_id in zip(events, doc_ids):
+        artist_slug = to_slug(event.get("artistName", ""))
+        same_artist = (i for i in by_artist.get(event.get("artistName", ""), []) if i != doc_id)
+        same_venue = (
+            i for i, other_slug in by_venue.get(event.get("venueName", ""), [])
+            if i != doc_id and other_slug != artist_slug
+        )
+        related.append({
+            "relatedByArtist": list(islice(same_artist, RELATED_LIMIT)),
+            "relatedByVenue": list(islice(same_venue, RELATED_LIMIT)),
+        })
+    return related
@@ -0,0 +1,339 @@
+"""
+event_store.py — SQLite system of record for the pipeline (.tmp/dtxent.db).
+
+Every update_dtxent run used to leave nothing behind but the scrapers' JSON
+dumps in .tmp/, which the check scripts re-parsed from scratch. The store
+keeps the whole history queryable:
+
+    runs            one row per pipeline run (start/finish time, source status)
+    raw_events      every scraped row, per run and source, before dedupe
+    events          merged events, upserted by normalized key (event_keys.event_id)
+    event_versions  distinct merged payloads, keyed by content hash
+    run_events      per-run snapshot: which key had which version in that run
+    images          poster assets (name → source URL, content hash, size)
+
+Indexed on date, venue, city, source and key. The database runs in WAL mode
+so the check scripts can read while a run is writing. All writes are batched
+with executemany inside one transaction per call.
+
+Usage:
+    python event_store.py stats
+    python event_store.py import ../.tmp/tixplug_events.json --source tixplug
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from event_keys import event_id
+
+# ---------- Configuration ----------
+DTXENT_DIR = Path(__file__).resolve().parent.parent
+DB_PATH = DTXENT_DIR / ".tmp" / "dtxent.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      TEXT PRIMARY KEY,
+    started_at  TEXT NOT NULL,
+    finished_at TEXT,
+    sources     TEXT
+);
+
+CREATE TABLE IF NOT EXISTS raw_events (
+    run_id      TEXT NOT NULL REFERENCES runs(run_id),
+    source      TEXT NOT NULL,
+    event_key   TEXT NOT NULL,
+    artist_name TEXT,
+    event_date  TEXT,
+    venue_name  TEXT,
+    venue_city  TEXT,
+    ticket_url  TEXT,
+    data        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS raw_events_run_source ON raw_events(run_id, source);
+CREATE INDEX IF NOT EXISTS raw_events_key ON raw_events(event_key);
+CREATE INDEX IF NOT EXISTS raw_events_date ON raw_events(event_date);
+CREATE INDEX IF NOT EXISTS raw_events_venue ON raw_events(venue_name);
+CREATE INDEX IF NOT EXISTS raw_events_city ON raw_events(venue_city);
+
+CREATE TABLE IF NOT EXISTS events (
+    event_key     TEXT PRIMARY KEY,
+    artist_name   TEXT,
+    event_date    TEXT,
+    venue_name    TEXT,
+    venue_city    TEXT,
+    source        TEXT,
+    ticket_url    TEXT,
+    image_name    TEXT,
+    content_hash  TEXT NOT NULL,
+    first_seen    TEXT NOT NULL,
+    last_seen     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_date ON events(event_date);
+CREATE INDEX IF NOT EXISTS events_venue ON events(venue_name);
+CREATE INDEX IF NOT EXISTS events_city ON events(venue_city);
+CREATE INDEX IF NOT EXISTS events_source ON events(source);
+
+CREATE TABLE IF NOT EXISTS event_versions (
+    content_hash TEXT PRIMARY KEY,
+    data         TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS run_events (
+    run_id       TEXT NOT NULL REFERENCES runs(run_id),
+    event_key    TEXT NOT NULL,
+    content_hash TEXT NOT NULL REFERENCES event_versions(content_hash),
+    PRIMARY KEY (run_id, event_key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS images (
+    image_name  TEXT PRIMARY KEY,
+    source_url  TEXT,
+    sha256      TEXT,
+    bytes       INTEGER,
+    updated_at  TEXT NOT NULL
+);
+"""
+
+
+def connect(path: Path = DB_PATH) -> sqlite3.Connection:
+    """Open (and create if needed) the store in WAL mode."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _canonical(event: dict) -> str:
+    return json.dumps(event, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def _columns(event: dict) -> tuple:
+    return (
+        event.get("artistName"),
+        event.get("eventDate"),
+        event.get("venueName"),
+        event.get("venueCity"),
+        event.get("ticketUrl"),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Writes
+# ---------------------------------------------------------------------------
+
+def start_run(conn: sqlite3.Connection, run_id: str | None = None) -> str:
+    """Register a new run. Run ids sort chronologically (ISO timestamps)."""
+    started = _now()
+    run_id = run_id or datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    with conn:
+        conn.execute("INSERT INTO runs (run_id, started_at) VALUES (?, ?)", (run_id, started))
+    return run_id
+
+
+def finish_run(conn: sqlite3.Connection, run_id: str, sources_status: list[dict] | None = None):
+    with conn:
+        conn.execute(
+            "UPDATE runs SET finished_at = ?, sources = ? WHERE run_id = ?",
+            (_now(), json.dumps(sources_status or []), run_id),
+        )
+
+
+def record_raw_events(conn: sqlite3.Connection, run_id: str, events: list[dict]) -> int:
+    """Store the run's scraped rows as-is (before filtering/dedupe)."""
+    rows = [
+        (run_id, e.get("source", "manual"), event_id(e), *_columns(e), _canonical(e))
+        for e in events
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT INTO raw_events (run_id, source, event_key, artist_name, event_date,"
+            " venue_name, venue_city, ticket_url, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    return len(rows)
+
+
+def upsert_events(conn: sqlite3.Connection, run_id: str, events: list[dict]) -> dict:
+    """
+    Upsert the run's merged events and record the run snapshot.
+
+    Returns {"events": N, "newVersions": N} — newVersions counts payloads the
+    store had never seen before (new or changed events).
+    """
+    seen_at = _now()
+    versions, merged, snapshot = {}, {}, {}
+    for e in events:
+        data = _canonical(e)
+        content_hash = hashlib.sha256(data.encode("utf-8")).hexdigest()
+        key = event_id(e)
+        versions[content_hash] = data
+        # Later duplicates of a key win, like a dict update
+        merged[key] = (key, *_columns(e)[:4], e.get("source", "manual"), e.get("ticketUrl"),
+                       e.get("imageName"), content_hash, seen_at, seen_at)
+        snapshot[key] = (run_id, key, content_hash)
+
+    with conn:
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO event_versions (content_hash, data) VALUES (?, ?)",
+            versions.items(),
+        )
+        new_versions = conn.total_changes - before
+        conn.executemany(
+            """
+            INSERT INTO events (event_key, artist_name, event_date, venue_name, venue_city, source,
+                                ticket_url, image_name, content_hash, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(event_key) DO UPDATE SET
+                artist_name = excluded.artist_name,
+                event_date = excluded.event_date,
+                venue_name = excluded.venue_name,
+                venue_city = excluded.venue_city,
+                source = excluded.source,
+                ticket_url = excluded.ticket_url,
+                image_name = excluded.image_name,
+                content_hash = excluded.content_hash,
+                last_seen = excluded.last_seen
+            """,
+            merged.values(),
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO run_events (run_id, event_key, content_hash) VALUES (?, ?, ?)",
+            snapshot.values(),
+        )
+    return {"events": len(merged), "newVersions": new_versions}
+
+
+def record_images(conn: sqlite3.Connection, images: list[tuple[str, str, Path]]) -> int:
+    """Upsert (image_name, source_url, local_path) rows; hashes the local files."""
+    rows = []
+    for name, source_url, path in images:
+        if not path.exists():
+            continue
+        data = path.read_bytes()
+        rows.append((name, source_url, hashlib.sha256(data).hexdigest(), len(data), _now()))
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO images (image_name, source_url, sha256, bytes, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(image_name) DO UPDATE SET
+                source_url = excluded.source_url,
+                sha256 = excluded.sha256,
+                bytes = excluded.bytes,
+                updated_at = excluded.updated_at
+            WHERE images.sha256 IS NOT excluded.sha256 OR images.source_url IS NOT excluded.source_url
+            """,
+            rows,
+        )
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+def latest_run_id(conn: sqlite3.Connection, source: str | None = None) -> str | None:
+    """Most recent run (optionally: most recent run that has raw rows from `source`)."""
+    if source:
+        row = conn.execute(
+            "SELECT run_id FROM raw_events WHERE source = ? ORDER BY run_id DESC LIMIT 1", (source,)
+        ).fetchone()
+    else:
+        row = conn.execute("SELECT run_id FROM runs ORDER BY run_id DESC LIMIT 1").fetchone()
+    return row["run_id"] if row else None
+
+
+def previous_run_id(conn: sqlite3.Connection, run_id: str) -> str | None:
+    """The latest run before `run_id` that recorded a snapshot."""
+    row = conn.execute(
+        "SELECT MAX(run_id) AS run_id FROM run_events WHERE run_id < ?", (run_id,)
+    ).fetchone()
+    return row["run_id"] if row else None
+
+
+def snapshot(conn: sqlite3.Connection, run_id: str) -> dict[str, dict]:
+    """Merged events of one run, keyed by normalized key."""
+    rows = conn.execute(
+        "SELECT r.event_key, v.data FROM run_events r"
+        " JOIN event_versions v ON v.content_hash = r.content_hash WHERE r.run_id = ?",
+        (run_id,),
+    )
+    return {row["event_key"]: json.loads(row["data"]) for row in rows}
+
+
+def raw_events(conn: sqlite3.Connection, source: str | None = None, city: str | None = None,
+               missing_venue: bool = False, run_id: str | None = None) -> list[dict]:
+    """
+    Scraped rows from one run (default: the latest run that has `source`),
+    filtered on the indexed columns, in date order.
+    """
+    run_id = run_id or latest_run_id(conn, source)
+    if run_id is None:
+        return []
+    clauses, params = ["run_id = ?"], [run_id]
+    if source:
+        clauses.append("source = ?")
+        params.append(source)
+    if city:
+        clauses.append("venue_city = ?")
+        params.append(city)
+    if missing_venue:
+        clauses.append("(COALESCE(venue_name, '') = '' OR COALESCE(venue_city, '') = '')")
+    rows = conn.execute(
+        f"SELECT data FROM raw_events WHERE {' AND '.join(clauses)} ORDER BY event_date", params
+    )
+    return [json.loads(row["data"]) for row in rows]
+
+
+def stats(conn: sqlite3.Connection) -> dict:
+    counts = {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+              for table in ("runs", "raw_events", "events", "event_versions", "run_events", "images")}
+    counts["latestRun"] = latest_run_id(conn)
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or seed the SQLite event store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Row counts per table")
+    imp = sub.add_parser("import", help="Record a scraper JSON dump as a run")
+    imp.add_argument("json_file", type=Path)
+    imp.add_argument("--source", help="Source name for rows without a 'source' field")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if args.command == "stats":
+        print(json.dumps(stats(conn), indent=2))
+        return
+
+    with open(args.json_file, encoding="utf-8") as f:
+        events = json.load(f)
+    if args.source:
+        events = [{"source": args.source, **e} for e in events]
+    run_id = start_run(conn)
+    count = record_raw_events(conn, run_id, events)
+    finish_run(conn, run_id)
+    print(f"[OK] Imported {count} rows from {args.json_file} as run {run_id}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""
+firestore_client.py — Pluggable Firestore client for the sync scripts.
+
+sync_firestore.py and sync_firestore_ci.py normally talk to the real project
+through the Firebase Admin SDK. This module lets them run against:
+
+- An in-process fake (DTXENT_FIRESTORE=fake) that counts reads, writes and
+  round trips and can inject per-round-trip latency
+  (DTXENT_FIRESTORE_LATENCY_MS), for offline load tests.
+- The Firestore emulator, when FIRESTORE_EMULATOR_HOST is set.
+- Any client object passed to set_client() (tests, scripts).
+
+The fake implements only the subset of the google-cloud-firestore API the
+pipeline uses: collection/document refs, get/set/update/delete, batches,
+add(), where()/order_by()/limit() queries, stream() and get_all().
+"""
+
+import copy
+import os
+import time
+from datetime import datetime
+
+try:
+    from google.cloud.firestore import SERVER_TIMESTAMP
+except ImportError:  # firebase-admin not installed — fake-only environments
+    class _ServerTimestamp:
+        def __repr__(self):
+            return "SERVER_TIMESTAMP"
+
+    SERVER_TIMESTAMP = _ServerTimestamp()
+
+# Firestore rejects batches with more than 500 operations
+MAX_BATCH_SIZE = 500
+
+_override = None
+
+
+class NotFound(Exception):
+    """Raised by the fake when updating a document that does not exist."""
+
+
+# ---------------------------------------------------------------------------
+# Client Selection
+# ---------------------------------------------------------------------------
+
+
+def set_client(client):
+    """Force every subsequent configured_client() call to return `client` (None to reset)."""
+    global _override
+    _override = client
+
+
+def configured_client():
+    """
+    Return a non-production client if one is configured, else None.
+
+    Callers fall back to their normal Firebase Admin initialization on None.
+    """
+    if _override is not None:
+        return _override
+
+    if os.getenv("DTXENT_FIRESTORE", "").lower() == "fake":
+        latency_ms = float(os.getenv("DTXENT_FIRESTORE_LATENCY_MS", "0"))
+        return FakeFirestore(latency=latency_ms / 1000)
+
+    if os.getenv("FIRESTORE_EMULATOR_HOST"):
+        from google.auth.credentials import AnonymousCredentials
+        from google.cloud import firestore
+
+        project = os.getenv("GCLOUD_PROJECT", "dtxent-web")
+        print(f"  [INFO] Using Firestore emulator at {os.environ['FIRESTORE_EMULATOR_HOST']}")
+        return firestore.Client(project=project, credentials=AnonymousCredentials())
+
+    return None
+
+
+# ---------------------------------------------------------------------------
+# In-Process Fake
+# ---------------------------------------------------------------------------
+
+
+class FakeStats:
+    """Operation counters, mirroring what Firestore bills and what costs latency."""
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.deletes = 0
+        self.round_trips = 0
+        self.commits = 0
+        self.batch_sizes = []
+        self.redundant_writes = 0  # Writes that left the stored fields unchanged
+
+    def as_dict(self) -> dict:
+        return {
+            "reads": self.reads,
+            "writes": self.writes,
+            "deletes": self.deletes,
+            "roundTrips": self.round_trips,
+            "commits": self.commits,
+            "maxBatchSize": max(self.batch_sizes, default=0),
+            "redundantWrites": self.redundant_writes,
+        }
+
+
+class FakeSnapshot:
+    def __init__(self, reference, data: dict | None):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self) -> dict | None:
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field: str):
+        return (self._data or {}).get(field)
+
+
+class FakeDocumentRef:
+    def __init__(self, db, path: str):
+        self._db = db
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def collection(self, name: str):
+        return FakeCollection(self._db, f"{self.path}/{name}")
+
+    def get(self) -> FakeSnapshot:
+        self._db._round_trip()
+        self._db.stats.reads += 1
+        return FakeSnapshot(self, self._db._docs.get(self.path))
+
+    def set(self, data: dict, merge: bool = False):
+        self._db._round_trip()
+        self._db._apply("set", self, data, merge)
+
+    def update(self, data: dict):
+        self._db._round_trip()
+        self._db._apply("update", self, data)
+
+    def delete(self):
+        self._db._round_trip()
+        self._db._apply("delete", self)
+
+
+class FakeQuery:
+    _OPS = {
+        "==": lambda a, b: a == b,
+        "!=": lambda a, b: a != b,
+        "<": lambda a, b: a < b,
+        "<=": lambda a, b: a <= b,
+        ">": lambda a, b: a > b,
+        ">=": lambda a, b: a >= b,
+        "in": lambda a, b: a in b,
+        "array_contains": lambda a, b: isinstance(a, list) and b in a,
+    }
+
+    def __init__(self, collection, filters=None, order=None, limit_count=None):
+        self._collection = collection
+        self._filters = filters or []
+        self._order = order
+        self._limit = limit_count
+
+    def where(self, field: str, op: str, value):
+        return FakeQuery(self._collection, self._filters + [(field, op, value)], self._order, self._limit)
+
+    def order_by(self, field: str, direction: str = "ASCENDING"):
+        return FakeQuery(self._collection, self._filters, (field, direction), self._limit)
+
+    def limit(self, count: int):
+        return FakeQuery(self._collection, self._filters, self._order, count)
+
+    def _matches(self, data: dict) -> bool:
+        for field, op, value in self._filters:
+            actual = data.get(field)
+            if actual is None:
+                return False
+            try:
+                if not self._OPS[op](actual, value):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    def stream(self):
+        db = self._collection._db
+        db._round_trip()
+        prefix = self._collection.path + "/"
+        results = [
+            (path, data) for path, data in db._docs.items()
+            if path.startswith(prefix) and "/" not in path[len(prefix):] and self._matches(data)
+        ]
+        if self._order:
+            field, direction = self._order
+            results.sort(key=lambda item: item[1].get(field) or 0, reverse=direction == "DESCENDING")
+        if self._limit is not None:
+            results = results[:self._limit]
+        # Firestore bills a minimum of one read per query, even when empty
+        db.stats.reads += max(1, len(results))
+        for path, data in results:
+            yield FakeSnapshot(FakeDocumentRef(db, path), data)
+
+    def get(self) -> list[FakeSnapshot]:
+        return list(self.stream())
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, db, path: str):
+        self._db = db
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+        super().__init__(self)
+
+    def document(self, doc_id: str | None = None) -> FakeDocumentRef:
+        if doc_id is None:
+            self._db._auto_id += 1
+            doc_id = f"auto{self._db._auto_id:08d}"
+        return FakeDocumentRef(self._db, f"{self.path}/{doc_id}")
+
+    def add(self, data: dict):
+        ref = self.document()
+        ref.set(data)
+        return datetime.now(), ref
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self._db = db
+        self._ops = []
+
+    def set(self, ref, data: dict, merge: bool = False):
+        self._ops.append(("set", ref, data, merge))
+
+    def update(self, ref, data: dict):
+        self._ops.append(("update", ref, data, False))
+
+    def delete(self, ref):
+        self._ops.append(("delete", ref, None, False))
+
+    def commit(self):
+        if len(self._ops) > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch exceeds {MAX_BATCH_SIZE} operations ({len(self._ops)})")
+        self._db._round_trip()
+        self._db.stats.commits += 1
+        self._db.stats.batch_sizes.append(len(self._ops))
+        # Batches are atomic: validate every update target before applying anything
+        for op, ref, _, _ in self._ops:
+            if op == "update" and ref.path not in self._db._docs:
+                raise NotFound(f"No document to update: {ref.path}")
+        for op, ref, data, merge in self._ops:
+            self._db._apply(op, ref, data, merge)
+        self._ops = []
+
+
+class FakeFirestore:
+    """In-memory Firestore stand-in with operation counters and injectable latency."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.stats = FakeStats()
+        self._docs = {}
+        self._auto_id = 0
+
+    def collection(self, name: str) -> FakeCollection:
+        return FakeCollection(self, name)
+
+    def document(self, path: str) -> FakeDocumentRef:
+        return FakeDocumentRef(self, path)
+
+    def batch(self) -> FakeBatch:
+        return FakeBatch(self)
+
+    def get_all(self, refs):
+        """Fetch many documents in a single round trip."""
+        refs = list(refs)
+        self._round_trip()
+        self.stats.reads += len(refs)
+        for ref in refs:
+            yield FakeSnapshot(ref, self._docs.get(ref.path))
+
+    def reset_stats(self):
+        self.stats = FakeStats()
+
+    def _round_trip(self):
+        self.stats.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _apply(self, op: str, ref: FakeDocumentRef, data: dict | None = None, merge: bool = False):
+        if op == "delete":
+            self.stats.deletes += 1
+            self._docs.pop(ref.path, None)
+            return
+
+        self.stats.writes += 1
+        resolved = {k: datetime.now() if v is SERVER_TIMESTAMP else copy.deepcopy(v) for k, v in data.items()}
+        existing = self._docs.get(ref.path)
+        if op == "update":
+            if existing is None:
+                raise NotFound(f"No document to update: {ref.path}")
+            new = {**existing, **resolved}
+        elif merge and existing is not None:
+            new = {**existing, **resolved}
+        else:
+            new = resolved
+
+        if existing is not None and _without_timestamps(existing, data) == _without_timestamps(new, data):
+            self.stats.redundant_writes += 1
+        self._docs[ref.path] = new
+
+
+def _without_timestamps(doc: dict, written: dict) -> dict:
+    """Strip fields the write set to SERVER_TIMESTAMP (they always change)."""
+    return {k: v for k, v in doc.items() if written.get(k) is not SERVER_TIMESTAMP}
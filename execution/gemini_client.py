@@ -0,0 +1,368 @@
+"""
+gemini_client.py — Shared Gemini wrapper for the research and social tools.
+
+One GeminiClient holds one genai.Client and is safe to share across threads.
+generate_json():
+  - requests structured output (application/json + response schema) when
+    the model supports it for the request — search grounding only allows it
+    on SCHEMA_WITH_TOOLS models; otherwise the prompt asks for JSON
+  - streams the response; with a top-level array, each element is parsed
+    (ArrayStreamParser) and handed to `on_item` as soon as it is complete
+  - parses the final text leniently: markdown fences are stripped and
+    truncated JSON is repaired (repair_json) instead of being thrown away
+  - retries transient errors (429 / 5xx / connection) with backoff
+
+Every call is recorded in `calls` (label, latency, retries, token counts,
+items streamed, whether the JSON needed repair); metrics() totals them for
+reports and .tmp/run_metrics.json, summary() is the one-line version.
+
+The parsing helpers are pure and don't need google-genai installed.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+# ---------- Configuration ----------
+MAX_RETRIES = 2
+RETRY_BACKOFF = 2.0         # Seconds, doubled per retry
+SCHEMA_WITH_TOOLS = ("gemini-3",)  # Model prefixes that accept a response schema alongside tools
+TRANSIENT_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class ResponseParseError(ValueError):
+    """The response was neither valid nor repairable JSON; `text` holds what the model sent."""
+
+    def __init__(self, message: str, text: str):
+        super().__init__(message)
+        self.text = text
+
+
+def make_client(timeout: float | None = None):
+    """genai.Client for GEMINI_API_KEY (or GOOGLE_API_KEY); `timeout` applies to every HTTP request, in seconds."""
+    from google import genai
+    from google.genai import types
+
+    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        raise EnvironmentError("GEMINI_API_KEY or GOOGLE_API_KEY not set in .env")
+    http_options = types.HttpOptions(timeout=int(timeout * 1000)) if timeout else None
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
+# ---------------------------------------------------------------------------
+# Lenient JSON parsing
+# ---------------------------------------------------------------------------
+
+def strip_fences(text: str) -> str:
+    """Drop ```json fences and any chatter before the first JSON bracket."""
+    text = re.sub(r"```\w*\n?", "", text or "").strip()
+    starts = [i for i in (text.find("["), text.find("{")) if i >= 0]
+    return text[min(starts):] if starts else text
+
+
+def repair_json(text: str):
+    """
+    Parse JSON that may be truncated mid-stream: cut back to the last
+    complete top-level element (array item or object member) and close the
+    container, so a half-written item is dropped rather than half-kept.
+    Raises ValueError if nothing usable is left.
+    """
+    text = strip_fences(text)
+    stack: list[str] = []
+    cut = 0
+    in_string = escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "[{":
+            stack.append("]" if ch == "[" else "}")
+            if len(stack) == 1:
+                cut = i + 1
+        elif ch in "]}":
+            if not stack:
+                break
+            stack.pop()
+            if not stack:
+                return json.loads(text[:i + 1])  # Complete after all; trailing text dropped
+            if len(stack) == 1:
+                cut = i + 1
+        elif ch == "," and len(stack) == 1:
+            cut = i
+    if not stack:
+        raise ValueError("No JSON container found")
+    candidate = text[:cut] + stack[0]
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unrepairable JSON: {e}") from e
+
+
+def parse_json(text: str) -> tuple[object, bool]:
+    """(value, repaired) — plain json.loads first, repair_json as the fallback."""
+    cleaned = strip_fences(text)
+    try:
+        return json.loads(cleaned), False
+    except json.JSONDecodeError:
+        return repair_json(cleaned), True
+
+
+class ArrayStreamParser:
+    """
+    Incremental parser for a streamed top-level JSON array: feed() text
+    chunks, get back the elements completed by each chunk. Text before the
+    opening bracket (fences, preamble) is ignored; a top-level object
+    yields nothing.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.items: list = []
+        self._pos = 0
+        self._depth = 0
+        self._start = None
+        self._in_string = self._escaped = False
+        self._done = False
+
+    def _emit(self, end: int, out: list):
+        segment = self.buffer[self._start:end].strip()
+        self._start = None
+        if not segment:
+            return
+        try:
+            item = json.loads(segment)
+        except json.JSONDecodeError:
+            return
+        self.items.append(item)
+        out.append(item)
+
+    def feed(self, chunk: str) -> list:
+        self.buffer += chunk
+        out = []
+        while self._pos < len(self.buffer) and not self._done:
+            ch = self.buffer[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif self._depth == 0:
+                if ch == "[":
+                    self._depth = 1
+                elif ch == "{":
+                    self._done = True  # Not an array
+            elif ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._start is None:
+                    self._start = self._pos
+            elif ch in "[{":
+                if self._depth == 1 and self._start is None:
+                    self._start = self._pos
+                self._depth += 1
+            elif ch in "]}":
+                self._depth -= 1
+                if self._depth == 1 and self._start is not None:
+                    self._emit(self._pos + 1, out)
+                elif self._depth == 0:
+                    if self._start is not None:
+                        self._emit(self._pos, out)
+                    self._done = True
+            elif ch == "," and self._depth == 1:
+                if self._start is not None:
+                    self._emit(self._pos, out)
+            elif self._depth == 1 and self._start is None and not ch.isspace():
+                self._start = self._pos  # Number / true / false / null
+            self._pos += 1
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+class RateLimiter:
+    """Thread-safe: start at most `rate` calls per second across all workers."""
+
+    def __init__(self, rate: float | None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _is_transient(error: Exception) -> bool:
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    if isinstance(code, int):
+        return code in TRANSIENT_CODES
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+def _usage(response) -> dict:
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return {}
+    return {
+        "promptTokens": getattr(usage, "prompt_token_count", None) or 0,
+        "outputTokens": getattr(usage, "candidates_token_count", None) or 0,
+        "totalTokens": getattr(usage, "total_token_count", None) or 0,
+    }
+
+
+class GeminiClient:
+    def __init__(self, client=None, max_retries: int = MAX_RETRIES, backoff: float = RETRY_BACKOFF,
+                 timeout: float | None = None):
+        self._client = client
+        self.timeout = timeout
+        self._client_lock = threading.Lock()
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.calls: list[dict] = []
+        self._calls_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """The underlying genai.Client, created on first use."""
+        with self._client_lock:
+            if self._client is None:
+                self._client = make_client(self.timeout)
+            return self._client
+
+    def _record(self, call: dict):
+        with self._calls_lock:
+            self.calls.append(call)
+
+    def _with_retries(self, label: str, model: str, attempt_call) -> tuple[object, dict]:
+        """Run attempt_call() with retries; returns (result, call record). The record is already in `calls`."""
+        call = {"label": label, "model": model, "retries": 0, "ok": False}
+        start = time.monotonic()
+        for attempt in range(self.max_retries + 1):
+            try:
+                result, usage = attempt_call()
+                call.update(usage, ok=True, latencyMs=round((time.monotonic() - start) * 1000))
+                self._record(call)
+                return result, call
+            except Exception as e:
+                if attempt == self.max_retries or not _is_transient(e):
+                    call["error"] = str(e) or repr(e)
+                    call["latencyMs"] = round((time.monotonic() - start) * 1000)
+                    self._record(call)
+                    raise
+                call["retries"] += 1
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def generate_json(
+        self,
+        prompt: str,
+        model: str,
+        schema: dict | None = None,
+        tools: list | None = None,
+        label: str = "",
+        on_item=None,
+        stream: bool = True,
+    ):
+        """
+        Generate and parse a JSON response. Array elements are passed to
+        `on_item` as they stream in. Raises ResponseParseError if the
+        response can't be parsed or repaired.
+
+        A stream that fails after `on_item` has seen an element is not
+        retried (a second response would deliver its elements again); the
+        error is raised instead.
+        """
+        from google.genai import types
+
+        config = {}
+        if tools:
+            config["tools"] = tools
+        if not tools or model.startswith(SCHEMA_WITH_TOOLS):
+            config["response_mime_type"] = "application/json"
+            if schema:
+                config["response_schema"] = schema
+        config = types.GenerateContentConfig(**config)
+
+        def attempt():
+            if not stream:
+                response = self.client.models.generate_content(model=model, contents=prompt, config=config)
+                return (response.text or "", None), _usage(response)
+            parser, usage = ArrayStreamParser(), {}
+            try:
+                for chunk in self.client.models.generate_content_stream(model=model, contents=prompt, config=config):
+                    for item in parser.feed(chunk.text or ""):
+                        if on_item:
+                            on_item(item)
+                    usage = _usage(chunk) or usage
+            except Exception as e:
+                if on_item and parser.items:
+                    raise RuntimeError(f"stream failed after {len(parser.items)} item(s): {e}") from e
+                raise
+            return (parser.buffer, parser), usage
+
+        (text, parser), call = self._with_retries(label, model, attempt)
+        call["streamedItems"] = len(parser.items) if parser else 0
+        try:
+            value, call["repaired"] = parse_json(text)
+        except ValueError as e:
+            if not parser or not parser.items:
+                call.update(ok=False, error="unparseable JSON")
+                raise ResponseParseError(str(e), text) from e
+            value, call["repaired"] = list(parser.items), True
+        return value
+
+    def generate_image(self, prompt: str, model: str, label: str = "") -> bytes | None:
+        """First inline image of the response, or None if the model returned none."""
+        from google.genai import types
+
+        config = types.GenerateContentConfig(response_modalities=["IMAGE", "TEXT"])
+
+        def attempt():
+            response = self.client.models.generate_content(model=model, contents=prompt, config=config)
+            for part in response.candidates[0].content.parts:
+                if part.inline_data and part.inline_data.mime_type.startswith("image/"):
+                    return part.inline_data.data, _usage(response)
+            return None, _usage(response)
+
+        data, call = self._with_retries(label, model, attempt)
+        call["imageBytes"] = len(data) if data else 0
+        return data
+
+    def metrics(self) -> dict:
+        """Totals over every call made through this client, plus the per-call records."""
+        with self._calls_lock:
+            calls = list(self.calls)
+        return {
+            "calls": len(calls),
+            "failed": sum(1 for c in calls if not c.get("ok")),
+            "retries": sum(c.get("retries", 0) for c in calls),
+            "repaired": sum(1 for c in calls if c.get("repaired")),
+            "latencyMs": sum(c.get("latencyMs", 0) for c in calls),
+            "promptTokens": sum(c.get("promptTokens", 0) for c in calls),
+            "outputTokens": sum(c.get("outputTokens", 0) for c in calls),
+            "totalTokens": sum(c.get("totalTokens", 0) for c in calls),
+            "perCall": calls,
+        }
+
+    def summary(self) -> str:
+        m = self.metrics()
+        return (f"{m['calls']} call(s), {m['failed']} failed, {m['retries']} retried, {m['repaired']} repaired, "
+                f"{m['latencyMs'] / 1000:.1f}s, {m['promptTokens']} in / {m['outputTokens']} out tokens")
@@ -6,26 +6,41 @@ Uses Google Gemini (gemini-3-pro-preview / Nano Banan Pro) for both:
   - Promotional image generation (native image gen)
 
 Reads event data from dtxent-site/js/events-data.js.
-Outputs to .tmp/social_posts/.
+Outputs to .tmp/social_posts/, including platform crops and sizes of the
+promo image (social_images.py) listed in {date}_images.json.
+
+Captions and images are cached in .tmp/social_posts/cache/, keyed on the
+featured events, platform, model and prompt, so re-running for the same
+lineup costs nothing; --regenerate asks for fresh ones. Every post is
+appended to history.jsonl — --history lists the earlier variants for the
+current lineup and --variant N re-saves one of them instead of generating.
 
 Usage:
     python execution/generate_social_post.py
     python execution/generate_social_post.py --days 14
     python execution/generate_social_post.py --platform instagram
+    python execution/generate_social_post.py --platform all        # twitter, instagram, facebook, tiktok
     python execution/generate_social_post.py --dry-run
+    python execution/generate_social_post.py --regenerate          # ignore cached captions/image
+    python execution/generate_social_post.py --history             # list earlier variants
+    python execution/generate_social_post.py --variant 2           # re-save variant #2
 """
 
 import argparse
 import json
-import os
-import re
 import sys
 import base64
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from event_keys import event_id
+from gemini_client import GeminiClient, ResponseParseError
+from response_cache import ResponseCache, fingerprint
+from social_images import build_derivatives
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -35,6 +50,8 @@ WORKSPACE_ROOT = REPO_ROOT.parent               # dtxent-builder/
 
 EVENTS_DATA_PATH = REPO_ROOT / "js" / "events-data.js"
 OUTPUT_DIR = REPO_ROOT / ".tmp" / "social_posts"
+CACHE_DIR = OUTPUT_DIR / "cache"
+HISTORY_PATH = OUTPUT_DIR / "history.jsonl"
 ENV_PATH = REPO_ROOT / ".env"
 
 MODEL = "gemini-3-flash-preview"
@@ -49,6 +66,29 @@ PLATFORM_LIMITS = {
     "general": 2200,
 }
 
+# --platform all
+MULTI_PLATFORMS = ["twitter", "instagram", "facebook", "tiktok"]
+
+CALL_TIMEOUT = 120  # Seconds per Gemini call (captions and image run concurrently)
+
+# Calendar post types (social_calendar.py) → what the caption should lead with
+POST_ANGLES = {
+    "announcement": "JUST ANNOUNCED — this is the first post about this show. Break the news and push early ticket sales.",
+    "reminder": "REMINDER — the show is only days away. Countdown energy, last chance to grab tickets.",
+    "day-of": "TONIGHT — it's show day. Doors, showtime, and last-minute tickets.",
+}
+
+# Structured-output schema for captions
+CAPTION_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "caption": {"type": "STRING"},
+        "short_caption": {"type": "STRING"},
+        "hashtags": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": ["caption", "short_caption", "hashtags"],
+}
+
 load_dotenv(ENV_PATH)
 
 # ---------------------------------------------------------------------------
@@ -95,21 +135,8 @@ def load_upcoming_events(days_ahead: int = 7) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
-def generate_post_text(
-    events: list[dict], platform: str = "general"
-) -> dict:
-    """
-    Use Gemini to generate a clickbait social media caption for upcoming events.
-    Returns dict with 'caption', 'hashtags', 'short_caption'.
-    """
-    from google import genai
-
-    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        raise EnvironmentError("GEMINI_API_KEY or GOOGLE_API_KEY not set in .env")
-
-    client = genai.Client(api_key=api_key)
-
+def build_caption_prompt(events: list[dict], platform: str = "general", angle: str | None = None) -> str:
+    """Caption prompt for the featured events on one platform; `angle` is a POST_ANGLES key (calendar posts)."""
     char_limit = PLATFORM_LIMITS.get(platform, 2200)
 
     # Build event summary for the prompt
@@ -128,6 +155,8 @@ def generate_post_text(
         )
 
     events_text = "\n".join(event_lines)
+    if angle:
+        events_text += f"\n\nPOST TYPE: {POST_ANGLES[angle]}"
 
     prompt = f"""You are a social media manager for Dynamic TX Entertainment (DTXENT), 
 a company that promotes live concerts and events in Texas.
@@ -155,26 +184,31 @@ Return your response as JSON with these exact keys:
 }}
 
 Return ONLY the JSON, no markdown fences or extra text."""
+    return prompt
 
-    response = client.models.generate_content(
-        model=MODEL,
-        contents=prompt,
-    )
 
-    # Parse the response
-    response_text = response.text.strip()
-    # Strip markdown fences if present
-    if response_text.startswith("```"):
-        response_text = re.sub(r"```\w*\n?", "", response_text).strip()
+def generate_post_text(
+    events: list[dict], platform: str = "general", client: GeminiClient | None = None, angle: str | None = None
+) -> dict:
+    """
+    Use Gemini to generate a clickbait social media caption for upcoming events.
+    Returns dict with 'caption', 'hashtags', 'short_caption'. If the response
+    couldn't be parsed, the raw text is used as the caption and the dict has
+    'fallback': True — usable for today's post, but not worth caching.
+    """
+    client = client or GeminiClient()
+    prompt = build_caption_prompt(events, platform, angle)
 
     try:
-        result = json.loads(response_text)
-    except json.JSONDecodeError:
+        result = client.generate_json(prompt, model=MODEL, schema=CAPTION_SCHEMA, label=f"caption {platform}")
+    except ResponseParseError as e:
         # Fallback: treat the whole response as the caption
+        response_text = e.text.strip()
         result = {
             "caption": response_text,
             "short_caption": response_text[:280],
             "hashtags": ["#DTXENT", "#LiveMusic", "#Texas"],
+            "fallback": True,
         }
 
     return result
@@ -185,22 +219,8 @@ Return ONLY the JSON, no markdown fences or extra text."""
 # ---------------------------------------------------------------------------
 
 
-def generate_promo_image(events: list[dict]) -> bytes | None:
-    """
-    Use Gemini (gemini-3-pro-preview / Nano Banan Pro) to generate
-    a promotional image for the featured events.
-    Returns PNG image bytes or None on failure.
-    """
-    from google import genai
-    from google.genai import types
-
-    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        raise EnvironmentError("GEMINI_API_KEY or GOOGLE_API_KEY not set in .env")
-
-    client = genai.Client(api_key=api_key)
-
-    # Build a descriptive prompt for the image
+def build_image_prompt(events: list[dict]) -> str:
+    """Promo image prompt: a single-show poster or a lineup graphic."""
     if len(events) == 1:
         e = events[0]
         artist = e.get("artistName", "Live Event")
@@ -228,23 +248,23 @@ def generate_promo_image(events: list[dict]) -> bytes | None:
             f"Square format 1080x1080, no watermarks, professional quality. "
             f"The design should feel premium like a festival lineup poster."
         )
+    return image_prompt
 
-    try:
-        response = client.models.generate_content(
-            model=MODEL,
-            contents=image_prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["IMAGE", "TEXT"],
-            ),
-        )
 
-        # Extract image from response parts
-        for part in response.candidates[0].content.parts:
-            if part.inline_data and part.inline_data.mime_type.startswith("image/"):
-                return part.inline_data.data
+def generate_promo_image(events: list[dict], client: GeminiClient | None = None) -> bytes | None:
+    """
+    Use Gemini (gemini-3-pro-preview / Nano Banan Pro) to generate
+    a promotional image for the featured events.
+    Returns PNG image bytes or None on failure.
+    """
+    client = client or GeminiClient()
+    image_prompt = build_image_prompt(events)
 
-        print("WARNING: No image found in Gemini response")
-        return None
+    try:
+        image = client.generate_image(image_prompt, model=MODEL, label="promo image")
+        if image is None:
+            print("WARNING: No image found in Gemini response")
+        return image
 
     except Exception as e:
         print(f"WARNING: Image generation failed: {e}")
@@ -256,22 +276,48 @@ def generate_promo_image(events: list[dict]) -> bytes | None:
 # ---------------------------------------------------------------------------
 
 
+def save_image(image_bytes: bytes, derivatives: bool = True) -> Path:
+    """
+    Save the promo image to .tmp/social_posts/ (shared by every platform's
+    post), plus its platform crops and sizes and their {date}_images.json
+    manifest (social_images.build_derivatives).
+    """
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    image_path = OUTPUT_DIR / f"{datetime.now().strftime('%Y-%m-%d')}_image.png"
+    image_path.write_bytes(image_bytes)
+    print(f"✅ Image saved: {image_path}")
+    if derivatives:
+        try:
+            manifest = build_derivatives(image_path)
+        except Exception as e:
+            print(f"WARNING: Platform image derivatives failed: {e}")
+        else:
+            total = sum(f["bytes"] for f in manifest["files"])
+            print(f"✅ {len(manifest['files'])} platform image(s) saved ({total / 1024:.0f} KB total)")
+    return image_path
+
+
 def save_output(
     post_data: dict,
-    image_bytes: bytes | None,
+    image_path: Path | None,
     events: list[dict],
+    metrics: dict | None = None,
+    platform: str = "general",
 ) -> dict:
     """
-    Save the generated post and image to .tmp/social_posts/.
+    Save the generated post to .tmp/social_posts/ ({date}_post.json, or
+    {date}_{platform}_post.json for a specific platform).
     Returns a summary dict.
     """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     today = datetime.now().strftime("%Y-%m-%d")
+    derivatives_path = OUTPUT_DIR / f"{today}_images.json"
 
     # Save post JSON
     output = {
         "generated_at": datetime.now().isoformat(),
         "model": MODEL,
+        "platform": platform,
         "caption": post_data.get("caption", ""),
         "short_caption": post_data.get("short_caption", ""),
         "hashtags": post_data.get("hashtags", []),
@@ -285,18 +331,14 @@ def save_output(
             }
             for e in events
         ],
-        "image_path": None,
+        "image_path": str(image_path) if image_path else None,
+        "image_derivatives": str(derivatives_path) if image_path and derivatives_path.exists() else None,
+        "gemini": metrics,
     }
 
-    # Save image if available
-    if image_bytes:
-        image_path = OUTPUT_DIR / f"{today}_image.png"
-        image_path.write_bytes(image_bytes)
-        output["image_path"] = str(image_path)
-        print(f"✅ Image saved: {image_path}")
-
     # Save JSON
-    json_path = OUTPUT_DIR / f"{today}_post.json"
+    suffix = "" if platform == "general" else f"_{platform}"
+    json_path = OUTPUT_DIR / f"{today}{suffix}_post.json"
     json_path.write_text(json.dumps(output, indent=2, ensure_ascii=False), encoding="utf-8")
     print(f"✅ Post saved: {json_path}")
 
@@ -308,17 +350,7 @@ def save_output(
 # ---------------------------------------------------------------------------
 
 
-def generate_filler_post() -> dict:
-    """Generate a generic 'stay tuned' post when no events are upcoming."""
-    from google import genai
-
-    api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        raise EnvironmentError("GEMINI_API_KEY or GOOGLE_API_KEY not set in .env")
-
-    client = genai.Client(api_key=api_key)
-
-    prompt = """You are a social media manager for Dynamic TX Entertainment (DTXENT),
+FILLER_PROMPT = """You are a social media manager for Dynamic TX Entertainment (DTXENT),
 a company that promotes live concerts and events in Texas.
 
 There are no shows in the immediate future, but we want to keep engagement up.
@@ -336,21 +368,160 @@ Return as JSON:
 
 Return ONLY the JSON."""
 
-    response = client.models.generate_content(model=MODEL, contents=prompt)
-    response_text = response.text.strip()
-    if response_text.startswith("```"):
-        response_text = re.sub(r"```\w*\n?", "", response_text).strip()
+
+def generate_filler_post(client: GeminiClient | None = None) -> dict:
+    """Generate a generic 'stay tuned' post when no events are upcoming ('fallback': True if canned)."""
+    client = client or GeminiClient()
 
     try:
-        return json.loads(response_text)
-    except json.JSONDecodeError:
+        return client.generate_json(FILLER_PROMPT, model=MODEL, schema=CAPTION_SCHEMA, label="filler caption")
+    except ResponseParseError:
         return {
             "caption": "🔥 Big things coming to Texas! Stay tuned for our next lineup drop. Who do YOU want to see live? Drop your picks below! 👇🎶 #DTXENT #LiveMusic",
             "short_caption": "🔥 Big things coming! Who do you want to see live in TX? Drop names below! 👇🎶 #DTXENT",
             "hashtags": ["#DTXENT", "#LiveMusic", "#Texas", "#ConcertVibes"],
+            "fallback": True,
         }
 
 
+# ---------------------------------------------------------------------------
+# Cache Keys & History
+# ---------------------------------------------------------------------------
+
+
+def caption_key(events: list[dict], platform: str, angle: str | None = None) -> str:
+    """
+    Cache key for a caption. With no events the filler post is shared by
+    every platform and keyed on today's date, so quiet stretches don't
+    repeat the same filler every day.
+    """
+    if not events:
+        return fingerprint(kind="caption", model=MODEL, events=[], prompt=FILLER_PROMPT,
+                           day=datetime.now().date().isoformat())
+    return fingerprint(kind="caption", model=MODEL, platform=platform,
+                       events=[event_id(e) for e in events], prompt=build_caption_prompt(events, platform, angle))
+
+
+def image_key(events: list[dict]) -> str:
+    return fingerprint(kind="image", model=MODEL, events=[event_id(e) for e in events],
+                       prompt=build_image_prompt(events))
+
+
+def append_history(entries: list[dict], path: Path = HISTORY_PATH):
+    """Append one JSON line per generated post."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def load_history(path: Path = HISTORY_PATH) -> list[dict]:
+    if not path.exists():
+        return []
+    history = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            history.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue  # Torn last line from an interrupted run
+    return history
+
+
+def find_variants(history: list[dict], events: list[dict], platform: str) -> list[dict]:
+    """Distinct earlier posts for this lineup and platform, oldest first."""
+    ids = [event_id(e) for e in events]
+    variants, seen = [], set()
+    for entry in history:
+        if entry.get("events") != ids or entry.get("platform") != platform:
+            continue
+        key = (entry["post"].get("caption"), entry.get("imageBlob"))
+        if key not in seen:
+            seen.add(key)
+            variants.append(entry)
+    return variants
+
+
+# ---------------------------------------------------------------------------
+# Concurrent Generation
+# ---------------------------------------------------------------------------
+
+
+def generate_posts(
+    events: list[dict],
+    platforms: list[str],
+    client: GeminiClient,
+    with_image: bool = True,
+    timeout: float = CALL_TIMEOUT,
+    cache: ResponseCache | None = None,
+) -> tuple[dict[str, dict], bytes | None]:
+    """
+    Captions for every platform plus one promo image, all in flight at once
+    on the shared client, so the run takes about as long as the slowest call.
+    With no events, one filler caption is generated and used for every
+    platform. A call still running after `timeout` seconds is abandoned:
+    its platform is left out (or there is no image).
+
+    With a `cache`, captions and the image found there (caption_key /
+    image_key) are returned without a call, and fresh results are stored.
+    Fallback captions (unparseable responses) are returned but not stored,
+    so the next run asks again.
+
+    Returns ({platform: post_data}, image_bytes).
+    """
+    ids = [event_id(e) for e in events]
+    keys = {p: caption_key(events, p) for p in platforms}
+    posts, pending = {}, {}
+    for platform, key in keys.items():
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            posts[platform] = cached
+        else:
+            pending.setdefault(key, platform)
+
+    image_bytes = None
+    want_image = with_image
+    if with_image and cache:
+        cached = cache.get(image_key(events))
+        if cached is not None and cache.blob_path(cached["blob"]).exists():
+            image_bytes = cache.blob_path(cached["blob"]).read_bytes()
+            want_image = False
+
+    pool = ThreadPoolExecutor(max_workers=len(pending) + 1)
+    calls = {
+        key: pool.submit(generate_post_text, events, platform, client) if events
+        else pool.submit(generate_filler_post, client)
+        for key, platform in pending.items()
+    }
+    image = pool.submit(generate_promo_image, events, client) if want_image else None
+
+    futures = set(calls.values()) | ({image} if image else set())
+    done, _ = wait(futures, timeout=timeout)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    for key, future in calls.items():
+        waiting = [p for p in platforms if keys[p] == key]
+        if future not in done:
+            print(f"WARNING: {', '.join(waiting)} caption timed out after {timeout}s")
+        elif future.exception() is not None:
+            print(f"WARNING: {', '.join(waiting)} caption failed: {future.exception()}")
+        else:
+            for platform in waiting:
+                posts[platform] = future.result()
+            if cache and not future.result().get("fallback"):
+                cache.put(key, future.result(), meta={"kind": "caption", "platform": pending[key], "events": ids})
+    posts = {p: posts[p] for p in platforms if p in posts}
+
+    if image is not None:
+        if image in done:
+            image_bytes = image.result()  # generate_promo_image handles its own errors
+            if image_bytes and cache:
+                blob = cache.put_blob(image_bytes, ".png")
+                cache.put(image_key(events), {"blob": blob}, meta={"kind": "image", "events": ids, "blobs": [blob]})
+        else:
+            print(f"WARNING: Image generation timed out after {timeout}s")
+    return posts, image_bytes
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -365,66 +536,127 @@ def main():
         help="Look ahead N days for upcoming events (default: 7)"
     )
     parser.add_argument(
-        "--platform", type=str, default="general",
-        choices=list(PLATFORM_LIMITS.keys()),
-        help="Optimize for a specific platform (default: general)"
+        "--platform", type=str, nargs="+", default=["general"],
+        choices=list(PLATFORM_LIMITS.keys()) + ["all"],
+        help=f"Optimize for one or more platforms; 'all' = {', '.join(MULTI_PLATFORMS)} (default: general)"
     )
     parser.add_argument(
         "--dry-run", action="store_true",
         help="Skip image generation, text only"
     )
+    parser.add_argument(
+        "--timeout", type=float, default=CALL_TIMEOUT,
+        help=f"Seconds to wait for each Gemini call (default: {CALL_TIMEOUT})"
+    )
+    parser.add_argument(
+        "--no-derivatives", action="store_true",
+        help="Save only the source image, without the platform crops and sizes"
+    )
+    parser.add_argument(
+        "--regenerate", action="store_true",
+        help="Generate fresh captions/image even if this lineup is cached"
+    )
+    parser.add_argument(
+        "--history", action="store_true",
+        help="List earlier variants for the current lineup and exit"
+    )
+    parser.add_argument(
+        "--variant", type=int, metavar="N",
+        help="Re-save earlier variant N (see --history) instead of generating"
+    )
     args = parser.parse_args()
+    platforms = MULTI_PLATFORMS if "all" in args.platform else list(dict.fromkeys(args.platform))
 
     print("=" * 60)
     print("🎤 DTXENT Social Media Post Generator")
     print(f"   Model: {MODEL}")
     print(f"   Looking ahead: {args.days} days")
-    print(f"   Platform: {args.platform}")
+    print(f"   Platform(s): {', '.join(platforms)}")
     print("=" * 60)
 
+    client = GeminiClient(timeout=args.timeout)  # One client (and connection pool) for every call
+    cache = ResponseCache(CACHE_DIR, refresh=args.regenerate)
+
     # 1. Load upcoming events
     events = load_upcoming_events(days_ahead=args.days)
     print(f"\n📅 Found {len(events)} upcoming event(s)")
 
     if not events:
         print("   No upcoming events — generating filler post...")
-        post_data = generate_filler_post()
-        image_bytes = None
-        if not args.dry_run:
-            image_bytes = generate_promo_image([])  # Will use generic prompt
-        events_for_output = []
+    for e in events:
+        date_obj = datetime.fromisoformat(e["eventDate"])
+        print(f"   • {e.get('artistName', 'TBA')} — {date_obj.strftime('%b %d, %Y')} @ {e.get('venueName', 'TBA')}")
+
+    if args.history or args.variant:
+        history = load_history()
+        variants = {platform: find_variants(history, events, platform) for platform in platforms}
+        if args.history:
+            for platform, entries in variants.items():
+                print(f"\n📚 {platform}: {len(entries)} earlier variant(s)")
+                for n, entry in enumerate(entries, 1):
+                    image = "🖼️ " if entry.get("imageBlob") else "   "
+                    print(f"   {n}. {entry['generatedAt'][:16]} {image} {entry['post'].get('short_caption', '')[:70]}")
+            return
+        print(f"\n♻️  Re-saving variant {args.variant}...")
+        saved, images = 0, {}
+        for platform, entries in variants.items():
+            if not 1 <= args.variant <= len(entries):
+                print(f"WARNING: {platform} has no variant {args.variant} ({len(entries)} available)")
+                continue
+            entry = entries[args.variant - 1]
+            blob = entry.get("imageBlob")
+            image_path = images.get(blob)
+            if blob and image_path is None and cache.blob_path(blob).exists():
+                image_path = images[blob] = save_image(cache.blob_path(blob).read_bytes(),
+                                                       derivatives=not args.no_derivatives)
+            save_output(entry["post"], image_path, events, platform=platform)
+            saved += 1
+        sys.exit(0 if saved else 1)
+
+    # 2. Generate captions and image concurrently
+    if args.dry_run:
+        print("\n✍️  Generating caption(s)... (⏭️  skipping image generation: dry-run)")
     else:
-        for e in events:
-            date_obj = datetime.fromisoformat(e["eventDate"])
-            print(f"   • {e.get('artistName', 'TBA')} — {date_obj.strftime('%b %d, %Y')} @ {e.get('venueName', 'TBA')}")
-
-        # 2. Generate caption
-        print("\n✍️  Generating caption...")
-        post_data = generate_post_text(events, platform=args.platform)
-        print(f"   Caption length: {len(post_data.get('caption', ''))} chars")
-
-        # 3. Generate image
-        image_bytes = None
-        if not args.dry_run:
-            print("\n🎨 Generating promo image (Nano Banan Pro)...")
-            image_bytes = generate_promo_image(events)
-        else:
-            print("\n⏭️  Skipping image generation (dry-run)")
-
-        events_for_output = events
-
-    # 4. Save output
+        print("\n✍️  Generating caption(s) and 🎨 promo image (Nano Banan Pro) concurrently...")
+    posts, image_bytes = generate_posts(events, platforms, client, with_image=not args.dry_run,
+                                        timeout=args.timeout, cache=cache)
+    print(f"   Cache: {cache.summary()}")
+    if not posts:
+        print("\n❌ No captions were generated.")
+        sys.exit(1)
+
+    # 3. Save output
     print("\n💾 Saving output...")
-    output = save_output(post_data, image_bytes, events_for_output)
-
-    # 5. Print summary
-    print("\n" + "=" * 60)
-    print("📱 GENERATED POST")
-    print("=" * 60)
-    print(f"\n{output['caption']}")
-    print(f"\n{' '.join(output['hashtags'])}")
-    if output.get("image_path"):
-        print(f"\n🖼️  Image: {output['image_path']}")
+    image_path = save_image(image_bytes, derivatives=not args.no_derivatives) if image_bytes else None
+    outputs = {
+        platform: save_output(post_data, image_path, events, metrics=client.metrics(), platform=platform)
+        for platform, post_data in posts.items()
+    }
+    print(f"   Gemini: {client.summary()}")
+    image_blob = cache.put_blob(image_bytes, ".png") if image_bytes else None
+    generated_at = datetime.now().isoformat()
+    append_history([
+        {
+            "generatedAt": generated_at,
+            "platform": platform,
+            "events": [event_id(e) for e in events],
+            "captionKey": caption_key(events, platform),
+            "imageKey": image_key(events) if image_bytes else None,
+            "imageBlob": image_blob,
+            "post": post_data,
+        }
+        for platform, post_data in posts.items()
+    ])
+
+    # 4. Print summary
+    for platform, output in outputs.items():
+        print("\n" + "=" * 60)
+        print(f"📱 GENERATED POST — {platform}")
+        print("=" * 60)
+        print(f"\n{output['caption']}")
+        print(f"\n{' '.join(output['hashtags'])}")
+    if image_path:
+        print(f"\n🖼️  Image: {image_path}")
     print("\n" + "=" * 60)
     print("✅ Done!")
 
@@ -0,0 +1,234 @@
+"""
+geo_index.py — In-process spatial index over site vendors (restaurants,
+hotels, clubs, dining) for duplicate detection and nearest-vendor queries.
+
+Entries are bucketed into a lat/lng grid of roughly `cell_m` meters; a
+query only visits the cells its radius can reach, then refines candidates
+with the haversine distance. Every entry is also keyed by its normalized
+name, so entries without coordinates (LOCAL_CLUBS and DINING_RESTAURANTS
+carry none today) still take part in "same place" checks.
+
+Two entries are the same place when:
+- both are located within `radius_m` meters and their names are at least
+  `min_similarity` alike (difflib ratio) with the same numbers in them
+  ("Spot 41" is not "Spot 49"); only grid neighbours are compared, or
+- they have the exact same normalized name and the same city (coordinates
+  from the model can be off), or
+- they have the exact same name, one city is blank, and they are not both
+  located and far apart (a different branch).
+
+Usage:
+    index = GeoIndex(existing)
+    index.find_duplicate(new_entry)           # matching entry or None
+    index.nearest(26.18, -98.19, k=5)          # [(meters, entry), ...]
+    load_vendor_indexes(events_data_path)      # {"LOCAL_HOTELS": GeoIndex, ...}
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# ---------- Configuration ----------
+EARTH_RADIUS_M = 6_371_008.8
+METERS_PER_DEGREE = EARTH_RADIUS_M * math.pi / 180
+DEFAULT_CELL_M = 500
+SAME_PLACE_M = 150          # Same-place radius for duplicate detection
+NAME_SIMILARITY = 0.85      # Minimum normalized-name ratio for a fuzzy match
+
+# load_events_data key → events-data.js array
+VENDOR_ARRAYS = {
+    "restaurants": "LOCAL_RESTAURANTS",
+    "dining": "DINING_RESTAURANTS",
+    "hotels": "LOCAL_HOTELS",
+    "clubs": "LOCAL_CLUBS",
+}
+
+_STATE_OR_ZIP = re.compile(r"^(?:[A-Z]{2}|\d{5}(?:-\d{4})?|[A-Z]{2}\s+\d{5}(?:-\d{4})?)$")
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in meters."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def coords(entry: dict) -> tuple[float, float] | None:
+    """(lat, lng) if the entry has real coordinates (0/blank means unknown)."""
+    try:
+        lat, lng = float(entry.get("lat") or 0), float(entry.get("lng") or 0)
+    except (TypeError, ValueError):
+        return None
+    if not lat or not lng or not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return None
+    return lat, lng
+
+
+def normalize_name(name: str) -> str:
+    """Lower-case, accent-free, '&' → 'and', punctuation and a leading 'the' dropped."""
+    text = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode("ascii").lower()
+    text = text.replace("&", " and ").replace("'", "")
+    text = re.sub(r"[^a-z0-9]+", " ", text).strip()
+    return re.sub(r"^the ", "", text)
+
+
+def _numbers(normalized: str) -> list[str]:
+    return re.findall(r"\d+", normalized)
+
+
+def entry_city(entry: dict) -> str:
+    """Normalized city: the `city` field, else the city part of `address`."""
+    city = (entry.get("city") or "").strip()
+    if not city and entry.get("address"):
+        parts = [p.strip() for p in entry["address"].split(",") if p.strip()]
+        while parts and _STATE_OR_ZIP.match(parts[-1]):
+            parts.pop()
+        city = parts[-1] if parts else ""
+    return normalize_name(city)
+
+
+class GeoIndex:
+    def __init__(self, entries: list[dict] | None = None, cell_m: float = DEFAULT_CELL_M):
+        self.cell_m = cell_m
+        self.cell_deg = cell_m / METERS_PER_DEGREE
+        self.entries: list[dict] = []
+        self._points: list[tuple[float, float] | None] = []
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._by_name: dict[str, list[int]] = {}
+        self._bounds: list[int] | None = None  # min_i, max_i, min_j, max_j over occupied cells
+        for entry in entries or []:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _cell(self, lat: float, lng: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lng / self.cell_deg)
+
+    def add(self, entry: dict):
+        i = len(self.entries)
+        point = coords(entry)
+        self.entries.append(entry)
+        self._points.append(point)
+        if point:
+            cell = self._cell(*point)
+            self._cells.setdefault(cell, []).append(i)
+            if self._bounds is None:
+                self._bounds = [cell[0], cell[0], cell[1], cell[1]]
+            else:
+                b = self._bounds
+                b[:] = [min(b[0], cell[0]), max(b[1], cell[0]), min(b[2], cell[1]), max(b[3], cell[1])]
+        self._by_name.setdefault(normalize_name(entry.get("name", "")), []).append(i)
+
+    def _ring(self, lat: float, lng: float, ring: int) -> list[int]:
+        """Indices of located entries in the cells exactly `ring` cells from (lat, lng)'s cell."""
+        ci, cj = self._cell(lat, lng)
+        if ring == 0:
+            return list(self._cells.get((ci, cj), ()))
+        found = []
+        for di in range(-ring, ring + 1):
+            edge = abs(di) == ring
+            for dj in (range(-ring, ring + 1) if edge else (-ring, ring)):
+                found.extend(self._cells.get((ci + di, cj + dj), ()))
+        return found
+
+    def _ring_reach_m(self, lat: float, ring: int) -> float:
+        """Every entry closer than this is inside rings 0..ring (lng cells shrink with latitude)."""
+        return ring * self.cell_m * math.cos(math.radians(min(abs(lat) + self.cell_deg * (ring + 1), 89.9)))
+
+    def within(self, lat: float, lng: float, radius_m: float) -> list[tuple[float, dict]]:
+        """(meters, entry) for located entries within radius_m, nearest first."""
+        scale = max(math.cos(math.radians(min(abs(lat) + radius_m / METERS_PER_DEGREE, 89.9))), 1e-6)
+        span_i = math.ceil(radius_m / self.cell_m)
+        span_j = math.ceil(radius_m / (self.cell_m * scale))
+        ci, cj = self._cell(lat, lng)
+        max_dlat = radius_m / METERS_PER_DEGREE
+        hits = []
+        for di in range(-span_i, span_i + 1):
+            for dj in range(-span_j, span_j + 1):
+                for i in self._cells.get((ci + di, cj + dj), ()):
+                    plat, plng = self._points[i]
+                    if abs(plat - lat) > max_dlat:
+                        continue  # Cheap reject before the trig
+                    d = haversine_m(lat, lng, plat, plng)
+                    if d <= radius_m:
+                        hits.append((d, i))
+        return [(d, self.entries[i]) for d, i in sorted(hits)]
+
+    def nearest(self, lat: float, lng: float, k: int = 5, max_m: float | None = None) -> list[tuple[float, dict]]:
+        """k nearest located entries as (meters, entry), expanding rings of cells until settled."""
+        if self._bounds is None or k <= 0:
+            return []
+        ci, cj = self._cell(lat, lng)
+        min_i, max_i, min_j, max_j = self._bounds
+        max_ring = max(ci - min_i, max_i - ci, cj - min_j, max_j - cj, 0)
+        best: list[tuple[float, int]] = []  # max-heap of the k nearest so far, as (-d, i)
+
+        def consider(indices):
+            for i in indices:
+                d = haversine_m(lat, lng, *self._points[i])
+                if max_m is not None and d > max_m:
+                    continue
+                if len(best) < k:
+                    heapq.heappush(best, (-d, i))
+                elif d < -best[0][0]:
+                    heapq.heapreplace(best, (-d, i))
+
+        for ring in range(max_ring + 1):
+            if 8 * ring > len(self._cells):
+                # Rings now hold more (mostly empty) cells than are occupied: scan the rest directly
+                consider(i for (cell_i, cell_j), members in self._cells.items()
+                         if max(abs(cell_i - ci), abs(cell_j - cj)) >= ring for i in members)
+                break
+            consider(self._ring(lat, lng, ring))
+            reach = self._ring_reach_m(lat, ring)
+            if len(best) == k and -best[0][0] <= reach:
+                break
+            if max_m is not None and reach > max_m:
+                break
+        return [(d, self.entries[i]) for d, i in sorted((-nd, i) for nd, i in best)]
+
+    def find_duplicate(self, entry: dict, radius_m: float = SAME_PLACE_M,
+                       min_similarity: float = NAME_SIMILARITY) -> dict | None:
+        """The indexed entry describing the same place as `entry`, or None."""
+        norm = normalize_name(entry.get("name", ""))
+        if not norm:
+            return None
+        point, city = coords(entry), entry_city(entry)
+
+        for i in self._by_name.get(norm, ()):
+            other_city = entry_city(self.entries[i])
+            if city and other_city:
+                if city == other_city:
+                    return self.entries[i]
+                continue
+            if point and self._points[i] and haversine_m(*point, *self._points[i]) > radius_m:
+                continue  # Same name, different branch
+            return self.entries[i]
+
+        if not point:
+            return None
+        best, best_score, digits = None, 0.0, _numbers(norm)
+        for _, other in self.within(*point, radius_m):
+            other_norm = normalize_name(other.get("name", ""))
+            if not other_norm or _numbers(other_norm) != digits:
+                continue
+            matcher = SequenceMatcher(None, norm, other_norm)
+            if matcher.real_quick_ratio() < min_similarity or matcher.quick_ratio() < min_similarity:
+                continue
+            score = matcher.ratio()
+            if score >= min_similarity and score > best_score:
+                best, best_score = other, score
+        return best
+
+
+def load_vendor_indexes(events_data_path: Path, cell_m: float = DEFAULT_CELL_M) -> dict[str, GeoIndex]:
+    """One GeoIndex per vendor array in events-data.js, keyed by array name."""
+    from js_parser import load_events_data
+
+    data = load_events_data(events_data_path)
+    return {array: GeoIndex(data[key], cell_m) for key, array in VENDOR_ARRAYS.items()}
@@ -0,0 +1,128 @@
+"""
+git_publish.py — Commit and push exactly the files a pipeline run wrote.
+
+The image and data stages record every path they create, rewrite or delete
+in a publish manifest (.tmp/publish_manifest.json):
+
+    {"runStartedAt": "...", "paths": ["assets/bronco.webp", "js/events-data.js", ...]}
+
+publish() stages only those paths, so git never re-scans assets/ (160+
+posters) or anything else in the tree. Nightly runs that changed nothing
+leave the manifest empty and publish() returns without touching git at all
+— no fetch, no stash, no pull. When there is something to push it does one
+`pull --rebase --autostash` and one push.
+
+A run whose publish failed (or was skipped with --ci) leaves its manifest
+unmarked, and start_run() carries those paths into the next run. If they
+were already committed but never pushed, publish() finds nothing to commit
+but sees the branch ahead of the remote and pushes the earlier commit.
+"""
+
+import json
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+from atomic_write import write_atomic
+
+# ---------- Configuration ----------
+DTXENT_DIR = Path(__file__).resolve().parent.parent
+MANIFEST_FILE = DTXENT_DIR / ".tmp" / "publish_manifest.json"
+REMOTE = "origin"
+BRANCH = "main"
+
+
+def _relative(path: Path, repo_dir: Path) -> str:
+    path = Path(path)
+    if path.is_absolute():
+        path = path.resolve().relative_to(repo_dir.resolve())
+    return path.as_posix()
+
+
+def load(path: Path = MANIFEST_FILE) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"paths": []}
+
+
+def _save(manifest: dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, json.dumps(manifest, indent=2) + "\n", mode=None)  # Crash-recovery state: never torn
+
+
+def start_run(path: Path = MANIFEST_FILE) -> int:
+    """
+    Reset the manifest for a new run. Paths from a previous run that was
+    never marked published are carried over. Returns how many.
+    """
+    previous = load(path)
+    carried = [] if previous.get("published") else previous.get("paths", [])
+    _save({"runStartedAt": datetime.now().isoformat(timespec="seconds"), "paths": carried}, path)
+    return len(carried)
+
+
+def mark_published(path: Path = MANIFEST_FILE):
+    """Record that this run's paths reached the remote (or had nothing to publish)."""
+    manifest = load(path)
+    manifest["published"] = True
+    _save(manifest, path)
+
+
+def record(paths: list[Path], path: Path = MANIFEST_FILE, repo_dir: Path = DTXENT_DIR) -> int:
+    """Add written/deleted files to the manifest. Returns the manifest size."""
+    manifest = load(path)
+    known = set(manifest["paths"])
+    for written in paths:
+        rel = _relative(written, repo_dir)
+        if rel not in known:
+            known.add(rel)
+            manifest["paths"].append(rel)
+    manifest.pop("published", None)
+    _save(manifest, path)
+    return len(manifest["paths"])
+
+
+def _git(repo_dir: Path, *args, **kwargs) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", "-C", str(repo_dir), *args], **kwargs)
+
+
+def _ahead(repo_dir: Path, remote: str, branch: str) -> bool:
+    """True if HEAD has commits the remote branch doesn't (or the remote ref is unknown)."""
+    result = _git(repo_dir, "rev-list", "--count", f"{remote}/{branch}..HEAD", capture_output=True, text=True)
+    return result.returncode != 0 or result.stdout.strip() != "0"
+
+
+def publish(paths: list[str], message: str, repo_dir: Path = DTXENT_DIR,
+            remote: str = REMOTE, branch: str = BRANCH, push: bool = True) -> dict:
+    """
+    Stage, commit and push `paths` (relative to repo_dir).
+
+    Returns {"status": "noop" | "committed" | "pushed", "files": N}.
+    Raises subprocess.CalledProcessError if a git command fails.
+    """
+    if not paths:
+        return {"status": "noop", "files": 0}
+
+    present = [p for p in paths if (repo_dir / p).exists()]
+    missing = [p for p in paths if p not in present]
+    if present:
+        _git(repo_dir, "add", "--", *present, check=True)
+    if missing:
+        _git(repo_dir, "rm", "--cached", "--quiet", "--ignore-unmatch", "--", *missing, check=True)
+
+    # Only the manifest paths that really differ from HEAD (rewrites can be byte-identical)
+    staged = _git(repo_dir, "diff", "--cached", "--name-only", "-z", "--", *paths,
+                  check=True, capture_output=True, text=True).stdout.split("\0")
+    staged = [p for p in staged if p]
+    if staged:
+        _git(repo_dir, "commit", "--quiet", "-m", message, "--", *staged, check=True)
+        if not push:
+            return {"status": "committed", "files": len(staged)}
+    elif not push or not _ahead(repo_dir, remote, branch):
+        return {"status": "noop", "files": 0}
+    # else: an earlier run committed these paths but its pull or push failed
+
+    _git(repo_dir, "pull", "--rebase", "--autostash", "--quiet", remote, branch, check=True)
+    _git(repo_dir, "push", "--quiet", remote, branch, check=True)
+    return {"status": "pushed", "files": len(staged)}
@@ -0,0 +1,367 @@
+"""
+http_replay.py — Record/replay HTTP layer for offline scraper runs and benchmarks.
+
+Captures real responses from TixPlug, Payne Arena, Ticketmaster and the image
+CDNs into a JSON "cassette" and serves them back through a requests transport
+adapter, so the scrapers and update_dtxent.py run without network access.
+
+A cassette can also be scaled synthetically (10×, 100×, ...) to benchmark the
+pipeline against larger catalogs than the real sources currently list.
+
+Usage:
+    # Record the live sources into a cassette
+    python execution/http_replay.py record tests/fixtures/live.json -- execution/scrape_tixplug.py
+
+    # Replay a cassette (optionally scaled) through any pipeline script
+    python execution/http_replay.py replay tests/fixtures/scrapers.json --scale 10 -- execution/scrape_paynearena.py
+
+Scripts opt in via install_from_env(), which reads:
+    DTXENT_HTTP_CASSETTE  — path to the cassette file
+    DTXENT_HTTP_MODE      — "replay" (default) or "record"
+    DTXENT_HTTP_SCALE     — integer catalog multiplier for replay (default: 1)
+"""
+
+import argparse
+import atexit
+import base64
+import copy
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# ---------- Configuration ----------
+CASSETTE_VERSION = 1
+
+# Query parameters that must never be written to a cassette or used for matching
+SECRET_PARAMS = {"apikey", "api_key", "key", "token"}
+
+# Response headers worth keeping (the rest is CDN noise)
+KEPT_HEADERS = {
+    "content-type",
+    "etag",
+    "last-modified",
+    "x-wp-total",
+    "x-wp-totalpages",
+}
+
+# Offset applied to synthetic TixPlug product / media IDs per scale copy
+SCALE_ID_OFFSET = 1_000_000
+
+_TEXT_TYPES = ("text/", "application/json", "application/xml", "application/javascript")
+
+
+# ---------------------------------------------------------------------------
+# Cassette I/O
+# ---------------------------------------------------------------------------
+
+
+def request_key(method: str, url: str) -> str:
+    """Normalize a request into a stable matching key (method + URL, sorted query)."""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in SECRET_PARAMS
+    )
+    base = f"{parts.scheme}://{parts.netloc.lower()}{parts.path or '/'}"
+    if query:
+        base += "?" + urlencode(query)
+    return f"{method.upper()} {base}"
+
+
+def _encode_body(body: bytes, content_type: str) -> dict:
+    if any(content_type.startswith(t) for t in _TEXT_TYPES):
+        try:
+            return {"encoding": "utf-8", "body": body.decode("utf-8")}
+        except UnicodeDecodeError:
+            pass
+    return {"encoding": "base64", "body": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(response: dict) -> bytes:
+    if response.get("encoding") == "base64":
+        return base64.b64decode(response.get("body", ""))
+    return response.get("body", "").encode("utf-8")
+
+
+def load_cassette(path: Path) -> list[dict]:
+    """Load the interaction list from a cassette file."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette version in {path}: {data.get('version')}")
+    return data.get("interactions", [])
+
+
+def save_cassette(path: Path, interactions: list[dict]):
+    """Write interactions to a cassette file (one entry per unique request key)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    unique = {}
+    for interaction in interactions:
+        req = interaction["request"]
+        unique[request_key(req["method"], req["url"])] = interaction
+    data = {"version": CASSETTE_VERSION, "interactions": list(unique.values())}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# ---------------------------------------------------------------------------
+# Transport Adapters
+# ---------------------------------------------------------------------------
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serve responses from recorded interactions; unknown requests fail like a dead network."""
+
+    def __init__(self, interactions: list[dict]):
+        super().__init__()
+        self.interactions = {}
+        for interaction in interactions:
+            req = interaction["request"]
+            self.interactions[request_key(req["method"], req["url"])] = interaction["response"]
+        self.hits = 0
+        self.misses = []
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = request_key(request.method, request.url)
+        recorded = self.interactions.get(key)
+        if recorded is None:
+            self.misses.append(key)
+            raise requests.ConnectionError(f"No recorded response for {key}", request=request)
+
+        self.hits += 1
+        body = _decode_body(recorded)
+        resp = requests.Response()
+        resp.status_code = recorded.get("status", 200)
+        resp.reason = recorded.get("reason", "OK")
+        resp.headers = CaseInsensitiveDict(recorded.get("headers", {}))
+        resp.headers["Content-Length"] = str(len(body))
+        resp.raw = io.BytesIO(body)
+        resp.url = request.url
+        resp.request = request
+        resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+        return resp
+
+    def close(self):
+        pass
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Pass requests through to the network and keep a copy of every response."""
+
+    def __init__(self):
+        super().__init__()
+        self.interactions = []
+
+    def send(self, request, **kwargs):
+        resp = super().send(request, **kwargs)
+        body = resp.content  # Buffer once; requests serves .content/.iter_content from the buffer
+        content_type = resp.headers.get("Content-Type", "")
+        self.interactions.append({
+            "request": {
+                "method": request.method,
+                "url": request_key(request.method, request.url).split(" ", 1)[1],
+            },
+            "response": {
+                "status": resp.status_code,
+                "reason": resp.reason,
+                "headers": {k: v for k, v in resp.headers.items() if k.lower() in KEPT_HEADERS},
+                **_encode_body(body, content_type),
+            },
+        })
+        return resp
+
+
+@contextmanager
+def use_cassette(path: Path, mode: str = "replay", scale: int = 1):
+    """
+    Route every requests.Session through a replay or recording adapter.
+
+    Covers module-level requests.get() calls too, since those build a
+    throwaway Session internally.
+    """
+    path = Path(path)
+    if mode == "record":
+        adapter = RecordingAdapter()
+    elif mode == "replay":
+        interactions = load_cassette(path)
+        if scale > 1:
+            interactions = scale_interactions(interactions, scale)
+        adapter = ReplayAdapter(interactions)
+    else:
+        raise ValueError(f"Unknown cassette mode: {mode}")
+
+    original = requests.Session.get_adapter
+    requests.Session.get_adapter = lambda self, url: adapter
+    try:
+        yield adapter
+    finally:
+        requests.Session.get_adapter = original
+        if mode == "record":
+            save_cassette(path, adapter.interactions)
+            print(f"  [OK] Recorded {len(adapter.interactions)} responses to {path}")
+
+
+def install_from_env():
+    """Activate a cassette for the rest of the process if DTXENT_HTTP_CASSETTE is set."""
+    cassette = os.getenv("DTXENT_HTTP_CASSETTE")
+    if not cassette:
+        return None
+
+    mode = os.getenv("DTXENT_HTTP_MODE", "replay")
+    scale = int(os.getenv("DTXENT_HTTP_SCALE", "1"))
+    ctx = use_cassette(Path(cassette), mode=mode, scale=scale)
+    adapter = ctx.__enter__()
+    atexit.register(ctx.__exit__, None, None, None)
+    print(f"  [INFO] HTTP {mode} via {cassette}" + (f" (x{scale})" if scale > 1 else ""))
+    return adapter
+
+
+# ---------------------------------------------------------------------------
+# Synthetic Scaling
+# ---------------------------------------------------------------------------
+
+
+def _scale_tixplug_products(interaction: dict, factor: int) -> dict:
+    products = json.loads(_decode_body(interaction["response"]))
+    scaled = list(products)
+    for k in range(1, factor):
+        for product in products:
+            clone = copy.deepcopy(product)
+            clone["id"] = product.get("id", 0) + k * SCALE_ID_OFFSET
+            if product.get("featured_media"):
+                clone["featured_media"] = product["featured_media"] + k * SCALE_ID_OFFSET
+            clone["slug"] = f"{product.get('slug', '')}-x{k}"
+            clone["link"] = product.get("link", "").rstrip("/") + f"-x{k}/"
+            title = clone.get("title", {}).get("rendered", "")
+            clone["title"] = {"rendered": f"{title} x{k}"}
+            scaled.append(clone)
+
+    result = copy.deepcopy(interaction)
+    result["response"].update(_encode_body(json.dumps(scaled).encode("utf-8"), "application/json"))
+    headers = result["response"].setdefault("headers", {})
+    for name, value in list(headers.items()):
+        if name.lower() == "x-wp-total":
+            headers[name] = str(int(value) * factor)
+    return result
+
+
+def _scale_tixplug_media(interaction: dict, factor: int) -> list[dict]:
+    media_id = int(urlsplit(interaction["request"]["url"]).path.rstrip("/").rsplit("/", 1)[-1])
+    copies = []
+    for k in range(1, factor):
+        clone = copy.deepcopy(interaction)
+        new_id = media_id + k * SCALE_ID_OFFSET
+        clone["request"]["url"] = re.sub(r"/media/\d+", f"/media/{new_id}", clone["request"]["url"])
+        copies.append(clone)
+    return copies
+
+
+def _scale_paynearena_html(interaction: dict, factor: int) -> dict:
+    html = _decode_body(interaction["response"]).decode("utf-8")
+    cards = re.findall(r'<article class="Index-gallery-item[^"]*".*?</article>', html, re.DOTALL)
+    if not cards:
+        return interaction
+
+    extra = []
+    for k in range(1, factor):
+        for card in cards:
+            # Prefix the Ticketmaster slug so each copy parses as a distinct artist
+            extra.append(re.sub(r"(ticketmaster\.com/)", rf"\1x{k}-", card))
+
+    anchor = html.rfind(cards[-1]) + len(cards[-1])
+    scaled = html[:anchor] + "".join(extra) + html[anchor:]
+
+    result = copy.deepcopy(interaction)
+    result["response"].update(_encode_body(scaled.encode("utf-8"), "text/html"))
+    return result
+
+
+def _scale_ticketmaster_events(interaction: dict, factor: int) -> dict:
+    data = json.loads(_decode_body(interaction["response"]))
+    events = data.get("_embedded", {}).get("events", [])
+    scaled = list(events)
+    for k in range(1, factor):
+        for ev in events:
+            clone = copy.deepcopy(ev)
+            clone["id"] = f"{ev.get('id', '')}x{k}"
+            clone["name"] = f"{ev.get('name', '')} x{k}"
+            for attraction in clone.get("_embedded", {}).get("attractions", []):
+                attraction["name"] = f"{attraction.get('name', '')} x{k}"
+            scaled.append(clone)
+
+    if events:
+        data["_embedded"]["events"] = scaled
+    if "totalElements" in data.get("page", {}):
+        data["page"]["totalElements"] *= factor
+
+    result = copy.deepcopy(interaction)
+    result["response"].update(_encode_body(json.dumps(data).encode("utf-8"), "application/json"))
+    return result
+
+
+def scale_interactions(interactions: list[dict], factor: int) -> list[dict]:
+    """
+    Multiply the event catalogs in a cassette by `factor`.
+
+    Each copy gets distinct IDs, slugs and artist names so it survives
+    deduplication; poster image responses are shared across copies.
+    """
+    scaled = []
+    for interaction in interactions:
+        url = interaction["request"]["url"]
+        parts = urlsplit(url)
+        if parts.netloc.endswith("tixplug.com") and parts.path.rstrip("/").endswith("/wp/v2/product"):
+            scaled.append(_scale_tixplug_products(interaction, factor))
+        elif parts.netloc.endswith("tixplug.com") and re.search(r"/wp/v2/media/\d+$", parts.path):
+            scaled.append(interaction)
+            scaled.extend(_scale_tixplug_media(interaction, factor))
+        elif parts.netloc.endswith("paynearena.com") and parts.path in ("", "/"):
+            scaled.append(_scale_paynearena_html(interaction, factor))
+        elif parts.netloc.endswith("ticketmaster.com") and parts.path.endswith("/events.json"):
+            scaled.append(_scale_ticketmaster_events(interaction, factor))
+        else:
+            scaled.append(interaction)
+    return scaled
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record or replay HTTP traffic for a pipeline script."
+    )
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("cassette", type=Path, help="Cassette JSON file")
+    parser.add_argument(
+        "--scale", type=int, default=1,
+        help="Multiply event catalogs N times when replaying (default: 1)"
+    )
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="-- script.py [args...]")
+    args = parser.parse_args()
+
+    command = [c for c in args.command if c != "--"]
+    if not command:
+        parser.error("missing script to run after --")
+
+    env = dict(os.environ)
+    env["DTXENT_HTTP_CASSETTE"] = str(args.cassette.resolve())
+    env["DTXENT_HTTP_MODE"] = args.mode
+    env["DTXENT_HTTP_SCALE"] = str(args.scale)
+    sys.exit(subprocess.call([sys.executable, *command], env=env))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+image_fetch.py — Streaming, size-capped poster downloads with HTTP revalidation.
+
+download_image used to pull every poster fully into memory (resp.content)
+with no size limit. fetch() streams the body in chunks into a spooled temp
+file (memory up to SPOOL_BYTES, disk beyond), hashes it on the way and
+aborts as soon as MAX_IMAGE_BYTES is exceeded, so a 30 MB flyer costs a
+chunk of RAM rather than 30 MB plus the decoded bitmap.
+
+A URL index (.tmp/image_fetch_index.json) remembers each source's
+validators and content hash:
+
+    {"https://cdn.example/bronco.jpg": {"etag": "\"abc\"", "lastModified": "...", "hash": "3f9c2a1b7d...",
+                                        "checkedAt": 1767225600.0}}
+
+Known URLs are requested with If-None-Match / If-Modified-Since; a 304 means
+the stored poster is still current and nothing is downloaded or decoded.
+A URL checked less than REVALIDATE_AFTER ago (is_fresh) isn't requested at
+all — that also covers servers that send no validators, whose posters would
+otherwise be downloaded in full on every run.
+"""
+
+import hashlib
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+from atomic_write import write_atomic
+
+# ---------- Configuration ----------
+DTXENT_DIR = Path(__file__).resolve().parent.parent
+INDEX_FILE = DTXENT_DIR / ".tmp" / "image_fetch_index.json"
+MAX_IMAGE_BYTES = 40 * 1024 * 1024   # Reject anything bigger outright
+CHUNK_SIZE = 64 * 1024
+SPOOL_BYTES = 1024 * 1024            # Bodies beyond this spill to a temp file
+HASH_LENGTH = 16                     # Same digest length as poster_store
+REVALIDATE_AFTER = 24 * 3600         # Seconds before a known URL is checked again
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+class ImageTooLarge(ValueError):
+    """Raised when a response exceeds MAX_IMAGE_BYTES."""
+
+
+def load_index(path: Path = INDEX_FILE) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_index(index: dict, path: Path = INDEX_FILE):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, json.dumps(dict(sorted(index.items())), indent=2) + "\n", mode=None)
+
+
+def is_fresh(entry: dict, max_age: float | None = None) -> bool:
+    """True if the index entry was fetched or revalidated within max_age (default REVALIDATE_AFTER) seconds."""
+    max_age = REVALIDATE_AFTER if max_age is None else max_age
+    return bool(entry.get("hash")) and time.time() - entry.get("checkedAt", 0) < max_age
+
+
+def fetch(url: str, index: dict, conditional: bool = True, max_bytes: int = MAX_IMAGE_BYTES,
+          timeout: int = 10, session: requests.Session | None = None) -> dict:
+    """
+    Download `url` unless the server confirms the indexed copy is current.
+
+    Returns {"status": "not_modified", "hash": ...} or
+            {"status": "fetched", "hash": ..., "bytes": N, "file": <spooled file at offset 0>}.
+    The caller closes "file". Updates index[url] on success.
+    Raises ImageTooLarge or requests.RequestException.
+    """
+    entry = index.get(url) or {}
+    headers = dict(HEADERS)
+    revalidating = conditional and bool(entry.get("hash")) and bool(entry.get("etag") or entry.get("lastModified"))
+    if revalidating:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("lastModified"):
+            headers["If-Modified-Since"] = entry["lastModified"]
+
+    http = session or requests
+    with http.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+        if resp.status_code == 304 and revalidating:
+            entry["checkedAt"] = time.time()
+            return {"status": "not_modified", "hash": entry["hash"]}
+        resp.raise_for_status()
+
+        declared = resp.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > max_bytes:
+            raise ImageTooLarge(f"{url} is {int(declared)} bytes (limit {max_bytes})")
+
+        digest = hashlib.sha256()
+        size = 0
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+        try:
+            for chunk in resp.iter_content(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ImageTooLarge(f"{url} exceeded {max_bytes} bytes")
+                digest.update(chunk)
+                spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+        spool.seek(0)
+
+        content_hash = digest.hexdigest()[:HASH_LENGTH]
+        index[url] = {
+            "etag": resp.headers.get("ETag"),
+            "lastModified": resp.headers.get("Last-Modified"),
+            "hash": content_hash,
+            "checkedAt": time.time(),
+        }
+    return {"status": "fetched", "hash": content_hash, "bytes": size, "file": spool}
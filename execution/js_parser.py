@@ -1,16 +1,60 @@
 """
-js_parser.py — Shared utility to parse JavaScript data files into Python dicts.
+js_parser.py — Shared utility to parse and regenerate JavaScript data files.
 
 Handles the conversion from JS object syntax (unquoted keys, trailing commas)
-to valid JSON that can be parsed by Python's json module.
+to valid JSON that can be parsed by Python's json module, and the reverse:
+rewriting individual exported arrays without touching the rest of the file.
 
-Used by both generate_social_post.py and research_venues.py.
+Used by update_dtxent.py, sync_firestore_ci.py, generate_social_post.py and
+research_venues.py.
 """
 
 import json
+import os
 import re
+from datetime import datetime
 from pathlib import Path
 
+from atomic_write import write_atomic
+
+# Strings, comments and brackets — everything the array scanner has to tell apart
+_JS_TOKEN = re.compile(
+    r'"(?:[^"\\\n]|\\.)*"'
+    r"|'(?:[^'\\\n]|\\.)*'"
+    r"|`(?:[^`\\]|\\.)*`"
+    r"|//[^\n]*"
+    r"|/\*.*?\*/"
+    r"|[\[\]]",
+    re.DOTALL,
+)
+
+
+def find_js_array_span(content: str, variable_name: str) -> tuple[int, int] | None:
+    """
+    Locate `export const NAME = [...]` and return the (start, end) offsets of
+    the array literal, brackets included.
+
+    Brackets inside string literals and comments are ignored, so a value like
+    "Live ];-)" cannot end the array early.
+    """
+    pattern = rf"export\s+const\s+{re.escape(variable_name)}\s*=\s*\["
+    match = re.search(pattern, content)
+    if not match:
+        return None
+
+    array_start = match.end() - 1
+    depth = 0
+    for token in _JS_TOKEN.finditer(content, array_start):
+        bracket = token.group()
+        if bracket == "[":
+            depth += 1
+        elif bracket == "]":
+            depth -= 1
+            if depth == 0:
+                return array_start, token.end()
+
+    return None
+
 
 def extract_js_array(content: str, variable_name: str) -> list[dict]:
     """
@@ -29,33 +73,11 @@ def extract_js_array(content: str, variable_name: str) -> list[dict]:
     Returns:
         A list of dictionaries parsed from the JS array.
     """
-    # Find the array declaration
-    pattern = rf"export\s+const\s+{re.escape(variable_name)}\s*=\s*\["
-    match = re.search(pattern, content)
-    if not match:
-        return []
-
-    # Find the matching closing bracket using bracket counting
-    start = match.start()
-    bracket_count = 0
-    array_start = None
-    array_end = None
-
-    for i in range(start, len(content)):
-        if content[i] == "[":
-            if array_start is None:
-                array_start = i
-            bracket_count += 1
-        elif content[i] == "]":
-            bracket_count -= 1
-            if bracket_count == 0:
-                array_end = i + 1
-                break
-
-    if array_start is None or array_end is None:
+    span = find_js_array_span(content, variable_name)
+    if span is None:
         return []
 
-    raw_array = content[array_start:array_end]
+    raw_array = content[span[0]:span[1]]
 
     # Convert JS → JSON using a token-aware approach
     json_str = _js_to_json(raw_array)
@@ -158,12 +180,91 @@ def load_events_data(filepath: Path) -> dict:
     """
     Load all data arrays from an events-data.js file.
 
-    Returns a dict with keys: 'events', 'clubs', 'restaurants', 'hotels'.
+    Returns a dict with keys: 'events', 'clubs', 'restaurants', 'dining', 'hotels'.
     """
     content = filepath.read_text(encoding="utf-8")
     return {
         "events": extract_js_array(content, "LOCAL_EVENTS"),
         "clubs": extract_js_array(content, "LOCAL_CLUBS"),
         "restaurants": extract_js_array(content, "LOCAL_RESTAURANTS"),
+        "dining": extract_js_array(content, "DINING_RESTAURANTS"),
         "hotels": extract_js_array(content, "LOCAL_HOTELS"),
     }
+
+
+def _serialize_array(items: list) -> list[str]:
+    """Compact JS array literal, one element per line for readable diffs."""
+    if not items:
+        return ["[]"]
+    chunks = ["[\n"]
+    last = len(items) - 1
+    for i, item in enumerate(items):
+        line = json.dumps(item, ensure_ascii=False, separators=(",", ":"))
+        chunks.append(f"    {line}{',' if i < last else ''}\n")
+    chunks.append("]")
+    return chunks
+
+
+def write_js_arrays(
+    filepath: Path,
+    arrays: dict[str, list],
+    header_fields: dict[str, str] | None = None,
+) -> bool:
+    """
+    Regenerate the named exported arrays in a JS data file.
+
+    Only the listed arrays are re-serialized; everything else (other arrays,
+    comments, formatting) is copied through unchanged. If every listed array
+    already serializes to the same text and the header fields match, nothing
+    is written. Otherwise the new file is streamed to a temp file next to the
+    original and swapped in atomically, with `header_fields` (e.g.
+    {"Sources": "..."}) and "Last updated" refreshed in the leading comment.
+
+    Returns True if the file was rewritten.
+    """
+    with open(filepath, "r", encoding="utf-8", newline="") as f:
+        content = f.read()
+
+    spans = []
+    for name, items in arrays.items():
+        span = find_js_array_span(content, name)
+        if span is None:
+            raise ValueError(f"{name} not found in {filepath}")
+        spans.append((span[0], span[1], _serialize_array(items)))
+    spans.sort(key=lambda s: s[0])
+
+    # Compare chunk-by-chunk against the current text before writing anything
+    changed = False
+    for start, end, chunks in spans:
+        pos = start
+        for chunk in chunks:
+            if not content.startswith(chunk, pos):
+                changed = True
+                break
+            pos += len(chunk)
+        if changed or pos != end:
+            changed = True
+            break
+
+    old_head = content[:spans[0][0]]
+    fields = dict(header_fields or {})
+    if changed:
+        fields["Last updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    head = old_head
+    for label, value in fields.items():
+        head = re.sub(rf"( \* {re.escape(label)}: ).*", lambda m: m.group(1) + value, head, count=1)
+
+    if not changed and head == old_head:
+        return False
+
+    def pieces():
+        yield head
+        pos = len(old_head)
+        for start, end, chunks in spans:
+            yield content[pos:start]
+            yield from chunks
+            pos = end
+        yield content[pos:]
+
+    write_atomic(filepath, pieces(), mode=os.stat(filepath).st_mode & 0o777)
+    return True
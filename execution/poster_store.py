@@ -0,0 +1,219 @@
+"""
+poster_store.py — Content-addressed store for event poster images.
+
+Posters used to be saved under the scraper's slug (`payne-{slug}.webp`) and
+an existing filename meant "already done": the same flyer under two slugs was
+converted twice, and a new flyer under an old slug never replaced the old one.
+The store keys every poster by the hash of its source bytes instead:
+
+    assets/posters/<sha256[:16]>.webp
+    assets/posters/index.json   {"names": {"payne-bronco.jpg": {"hash": "...", "url": "..."}}}
+
+Events reference posters as imageName "posters/<hash>.webp", which every
+consumer already resolves as assets/<imageName>.
+
+- lookup(name, url) skips the download when the name is known for that URL
+- put(data, name, url) converts once per distinct source image
+- gc() reports (and with prune=True deletes) store objects no event uses,
+  plus legacy top-level assets/ images nothing in the site references.
+  "No event" means no event in events-data.js: past events that have left
+  it keep their posters in Firestore and their pre-rendered pages, so only
+  prune when those are gone too. update_dtxent.py prunes only with
+  --prune-posters.
+
+Usage:
+    python poster_store.py gc              # report only
+    python poster_store.py gc --prune      # delete orphaned posters
+    python poster_store.py gc --prune --legacy
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import sys
+from pathlib import Path
+
+from atomic_write import write_atomic
+
+# ---------- Configuration ----------
+DTXENT_DIR = Path(__file__).resolve().parent.parent
+ASSETS_DIR = DTXENT_DIR / "assets"
+POSTERS_DIR = ASSETS_DIR / "posters"
+INDEX_NAME = "index.json"
+HASH_LENGTH = 16
+WEBP_QUALITY = 85
+MAX_EDGE = 2048  # Longest poster side; larger sources are scaled down while decoding
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+# Files scanned for references to legacy assets/ images
+REFERENCE_GLOBS = (
+    "*.html", "js/*.js", "css/*.css", "dining/*.html", "admin/*.html", "admin/*.js",
+    "functions/ssr/*.js", "execution/manual_events.json",
+)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def poster_name(digest: str) -> str:
+    """imageName for a stored poster (relative to assets/)."""
+    return f"posters/{digest}.webp"
+
+
+def _to_webp(fp) -> bytes:
+    """
+    Decode and re-encode as WebP, capped at MAX_EDGE. JPEGs are decoded with
+    draft() so the DCT scaling happens in libjpeg and the full-resolution
+    bitmap of an oversized flyer is never materialized.
+    """
+    from PIL import Image
+
+    with Image.open(fp) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", (MAX_EDGE, MAX_EDGE))
+        img = img.convert("RGB")
+        if max(img.size) > MAX_EDGE:
+            img.thumbnail((MAX_EDGE, MAX_EDGE), reducing_gap=2.0)
+        out = io.BytesIO()
+        img.save(out, "WEBP", quality=WEBP_QUALITY)
+    return out.getvalue()
+
+
+class PosterStore:
+    """Name → hash index over assets/posters/. Call save() once after a batch of puts."""
+
+    def __init__(self, posters_dir: Path = POSTERS_DIR):
+        self.dir = posters_dir
+        self.index_path = posters_dir / INDEX_NAME
+        try:
+            self.index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.index = {"names": {}}
+        self.written: list[Path] = []
+        self.stats = {"known": 0, "deduplicated": 0, "converted": 0}
+
+    def _path(self, digest: str) -> Path:
+        return self.dir / f"{digest}.webp"
+
+    def lookup(self, name: str, url: str | None = None) -> str | None:
+        """imageName if `name` was stored from the same URL and the poster still exists."""
+        entry = self.index["names"].get(name)
+        if not entry or (url is not None and entry.get("url") != url):
+            return None
+        if not self._path(entry["hash"]).exists():
+            return None
+        self.stats["known"] += 1
+        return poster_name(entry["hash"])
+
+    def has(self, digest: str) -> bool:
+        return self._path(digest).exists()
+
+    def link(self, name: str, digest: str, url: str | None = None) -> str | None:
+        """Point `name` at an already stored poster (e.g. after a 304). None if it's gone."""
+        if not self.has(digest):
+            return None
+        self.index["names"][name] = {"hash": digest, "url": url}
+        self.stats["known"] += 1
+        return poster_name(digest)
+
+    def put(self, data: bytes, name: str, url: str | None = None) -> str:
+        """Store source image bytes under `name`. Returns the imageName."""
+        return self.put_file(io.BytesIO(data), content_hash(data), name, url)
+
+    def put_file(self, fp, digest: str, name: str, url: str | None = None) -> str:
+        """
+        Store a source image read from `fp` (hash already known, e.g. from a
+        streamed download). Converts to WebP only if no poster with the same
+        source hash exists yet. Returns the imageName.
+        """
+        path = self._path(digest)
+        if path.exists():
+            self.stats["deduplicated"] += 1
+        else:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, _to_webp(fp))
+            self.written.append(path)
+            self.stats["converted"] += 1
+        self.index["names"][name] = {"hash": digest, "url": url}
+        return poster_name(digest)
+
+    def save(self) -> bool:
+        """Write index.json if it changed. Returns True if written."""
+        data = (json.dumps({"names": dict(sorted(self.index["names"].items()))}, indent=2) + "\n").encode("utf-8")
+        if self.index_path.exists() and self.index_path.read_bytes() == data:
+            return False
+        self.dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.index_path, data)
+        self.written.append(self.index_path)
+        return True
+
+    def gc(self, image_names: set[str], prune: bool = False, legacy: bool = False,
+           site_dir: Path = DTXENT_DIR) -> dict:
+        """
+        Find store objects and legacy assets/ images that no event uses.
+
+        image_names: imageName of every current event. Store objects outside
+        that set are orphans; index entries pointing at them are dropped when
+        pruning. Legacy images are top-level assets/ files that neither an
+        event nor any page, script or stylesheet references.
+
+        Returns {"orphanPosters": [...], "legacyAssets": [...], "bytes": N, "pruned": [...]}.
+        """
+        live = {Path(n).stem for n in image_names if n.startswith("posters/")}
+        orphans = sorted(p for p in self.dir.glob("*.webp") if p.stem not in live) if self.dir.exists() else []
+
+        texts = list(image_names)
+        for pattern in REFERENCE_GLOBS:
+            texts.extend(f.read_text(encoding="utf-8", errors="ignore") for f in site_dir.glob(pattern))
+        corpus = "\n".join(texts)
+        legacy_assets = sorted(
+            p for p in self.dir.parent.iterdir()
+            if p.is_file() and p.suffix.lower() in IMAGE_SUFFIXES and p.name not in corpus
+        )
+
+        report = {
+            "orphanPosters": [p.name for p in orphans],
+            "legacyAssets": [p.name for p in legacy_assets],
+            "bytes": sum(p.stat().st_size for p in orphans + legacy_assets),
+            "pruned": [],
+        }
+        if not prune:
+            return report
+
+        doomed = orphans + (legacy_assets if legacy else [])
+        for path in doomed:
+            path.unlink()
+            report["pruned"].append(path)
+        dropped = {p.stem for p in orphans}
+        self.index["names"] = {n: e for n, e in self.index["names"].items() if e["hash"] not in dropped}
+        self.save()
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Poster store maintenance")
+    sub = parser.add_subparsers(dest="command", required=True)
+    gc = sub.add_parser("gc", help="Report (and prune) posters no event uses")
+    gc.add_argument("--prune", action="store_true", help="Delete orphaned posters")
+    gc.add_argument("--legacy", action="store_true", help="With --prune: also delete unreferenced legacy assets")
+    args = parser.parse_args()
+
+    from js_parser import load_events_data
+
+    events = load_events_data(DTXENT_DIR / "js" / "events-data.js")["events"]
+    report = PosterStore().gc({e["imageName"] for e in events if e.get("imageName")},
+                              prune=args.prune, legacy=args.legacy)
+    print(f"[INFO] {len(report['orphanPosters'])} orphaned poster(s), "
+          f"{len(report['legacyAssets'])} unreferenced legacy asset(s), {report['bytes'] / 1e6:.1f} MB")
+    for name in report["orphanPosters"]:
+        print(f"  posters/{name}")
+    for name in report["legacyAssets"]:
+        print(f"  {name}")
+    if args.prune:
+        print(f"[OK] Pruned {len(report['pruned'])} file(s)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,698 @@
+"""
+prerender_events.py — Static pre-rendering of event pages, the events index
+and the events sitemap.
+
+The Cloud Functions in functions/ssr/ render these on demand from Firestore.
+Firebase Hosting serves a static file before applying rewrites, so writing
+the same HTML into the hosting directory at update time means the common
+case never cold-starts a function or reads Firestore:
+
+    events/<artist>-<venue>-<yyyy-mm-dd>.html   → /events/<slug>   (eventPageSSR)
+    events.html                                 → /events          (eventIndexSSR)
+    sitemap-events.xml                          → /sitemap-events.xml (eventSitemapSSR)
+
+Artist hub pages (/events/<artist>) and event pages that are no longer in
+LOCAL_EVENTS still fall through to eventPageSSR.
+
+The templates mirror functions/ssr/helpers.js — keep the two in sync.
+
+Rebuilds are incremental: every page has a fingerprint of everything it is
+rendered from (event fields, related events, past/upcoming state, footer
+year, this module's source). Pages whose fingerprint matches the one recorded
+in events/.manifest.json are not re-rendered, and pages for events that left
+the list are deleted.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from atomic_write import write_atomic
+from event_keys import parse_event_datetime, to_slug
+
+# ---------- Configuration ----------
+REPO_ROOT = Path(__file__).resolve().parent.parent
+EVENTS_DIR = REPO_ROOT / "events"
+INDEX_FILE = REPO_ROOT / "events.html"
+SITEMAP_FILE = REPO_ROOT / "sitemap-events.xml"
+MANIFEST_FILE = EVENTS_DIR / ".manifest.json"  # Dotfiles are excluded from hosting
+
+SITE_URL = "https://dtxent.com"
+INDEX_LIMIT = 60          # eventIndexSSR shows the next 60 events
+RELATED_LIMIT = 4         # "More shows" cards per section
+OLD_PAST_DAYS = 30        # Past events older than this are noindex
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+MONTHS_SHORT = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+
+TEMPLATE_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+
+
+# ---------------------------------------------------------------------------
+# Dates (helpers.js)
+# ---------------------------------------------------------------------------
+
+
+def event_slug(event: dict) -> str:
+    return f"{to_slug(event['artistName'])}-{to_slug(event['venueName'])}-{event['_date']:%Y-%m-%d}"
+
+
+def format_date(dt: datetime) -> str:
+    """"May 9, 2026" """
+    return f"{MONTHS[dt.month - 1]} {dt.day}, {dt.year}"
+
+
+def format_month_year(dt: datetime) -> str:
+    return f"{MONTHS[dt.month - 1]} {dt.year}"
+
+
+def format_datetime_iso(dt: datetime) -> str:
+    """ISO 8601 with the RGV offset: CDT (-05:00) Mar–Oct, CST (-06:00) Nov–Feb."""
+    offset = "-05:00" if 3 <= dt.month <= 10 else "-06:00"
+    return f"{dt:%Y-%m-%dT%H:%M}:00{offset}"
+
+
+# ---------------------------------------------------------------------------
+# HTML Fragments (helpers.js)
+# ---------------------------------------------------------------------------
+
+
+def esc(value) -> str:
+    if not value:
+        return ""
+    return (str(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            .replace('"', "&quot;").replace("'", "&#39;"))
+
+
+def image_url(event: dict) -> str:
+    """Site-absolute poster path (local asset preferred, like the Firestore sync)."""
+    if event.get("imageName"):
+        return f"/assets/{event['imageName']}"
+    return event.get("imageUrl", "")
+
+
+def build_head(title: str, description: str, canonical_url: str, og_image: str = "",
+               noindex: bool = False, json_ld_blocks: list[dict] | None = None) -> str:
+    safe_title = esc(title)
+    safe_desc = esc(description)
+    og_image = og_image or f"{SITE_URL}/assets/dtxent-logo.png"
+    if og_image.startswith("/"):
+        og_image = SITE_URL + og_image
+    robots_meta = ('<meta name="robots" content="noindex, follow">' if noindex
+                   else '<meta name="robots" content="index, follow">')
+    json_ld_tags = "\n    ".join(
+        f'<script type="application/ld+json">\n{json.dumps(obj, indent=2, ensure_ascii=False)}\n</script>'
+        for obj in json_ld_blocks or []
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{safe_title}</title>
+    <meta name="description" content="{safe_desc}">
+    <link rel="canonical" href="{esc(canonical_url)}">
+    {robots_meta}
+
+    <!-- Open Graph -->
+    <meta property="og:type" content="website">
+    <meta property="og:url" content="{esc(canonical_url)}">
+    <meta property="og:title" content="{safe_title}">
+    <meta property="og:description" content="{safe_desc}">
+    <meta property="og:image" content="{esc(og_image)}">
+    <meta property="og:site_name" content="Dynamic TX Entertainment">
+    <meta property="og:locale" content="en_US">
+
+    <!-- Twitter Card -->
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:site" content="@dtxent">
+    <meta name="twitter:title" content="{safe_title}">
+    <meta name="twitter:description" content="{safe_desc}">
+    <meta name="twitter:image" content="{esc(og_image)}">
+
+    <!-- Geo -->
+    <meta name="geo.region" content="US-TX">
+    <meta name="geo.placename" content="Rio Grande Valley">
+
+    <!-- Fonts -->
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;600;700;800&display=swap" rel="stylesheet">
+
+    <!-- Favicon -->
+    <link rel="icon" type="image/svg+xml" href="/favicon.svg">
+    <link rel="manifest" href="/manifest.json">
+
+    <!-- Styles -->
+    <link rel="stylesheet" href="/styles.css">
+    <link rel="stylesheet" href="/css/ssr-pages.css">
+
+    <!-- Google Analytics -->
+    <script async src="https://www.googletagmanager.com/gtag/js?id=G-RZY6W9D8H0"></script>
+    <script src="/js/gtag.js"></script>
+
+    <!-- External Analytics -->
+    <script src="https://link.dtxent.com/js/external-tracking.js" data-tracking-id="tk_7fb448734686429f8324fcc0fcde1b45"></script>
+    <script id="vtag-ai-js" async src="https://r2.leadsy.ai/tag.js" data-pid="LIXLdg8BNV3WGs46" data-version="062024"></script>
+
+    {json_ld_tags}
+</head>"""
+
+
+def build_nav() -> str:
+    return """    <a href="#main-content" class="skip-link">Skip to main content</a>
+    <div class="mobile-menu-backdrop" aria-hidden="true"></div>
+    <header class="header" role="banner">
+        <nav class="nav container" role="navigation" aria-label="Main navigation">
+            <a href="/" class="logo">
+                <img src="/assets/dtxent-logo.png" alt="DTXENT Logo" class="logo-img" width="200" height="75">
+            </a>
+            <ul class="nav-links">
+                <li><a href="/events">Shows</a></li>
+                <li><a href="/#nightlife">Nightlife</a></li>
+                <li><a href="/vip.html">VIP Services</a></li>
+                <li><a href="/transportation.html">Transportation</a></li>
+                <li><a href="/dining/dining.html">Dining</a></li>
+                <li><a href="/#stay">Stay</a></li>
+                <li><a href="/contact.html">Contact</a></li>
+                <li><a href="/events" class="btn btn-primary">Buy Tickets</a></li>
+            </ul>
+            <button class="mobile-menu-btn" aria-label="Toggle menu">
+                <span></span>
+                <span></span>
+                <span></span>
+            </button>
+        </nav>
+    </header>"""
+
+
+def build_footer(year: int) -> str:
+    return f"""    <footer class="footer" role="contentinfo">
+        <div class="container footer-content">
+            <div class="footer-brand">
+                <a href="/" class="logo">
+                    <img src="/assets/dtxent-logo.png" alt="DTXENT Logo" class="logo-img" width="200" height="75" loading="lazy">
+                </a>
+                <p>&copy; {year} Dynamic TX Entertainment. All rights reserved.</p>
+            </div>
+            <div class="footer-social">
+                <a href="https://facebook.com/dtxent" aria-label="Follow us on Facebook" target="_blank" rel="noopener noreferrer">
+                    <svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path d="M24 12.073c0-6.627-5.373-12-12-12s-12 5.373-12 12c0 5.99 4.388 10.954 10.125 11.854v-8.385H7.078v-3.47h3.047V9.43c0-3.007 1.792-4.669 4.533-4.669 1.312 0 2.686.235 2.686.235v2.953H15.83c-1.491 0-1.956.925-1.956 1.874v2.25h3.328l-.532 3.47h-2.796v8.385C19.612 23.027 24 18.062 24 12.073z"/></svg>
+                </a>
+                <a href="https://instagram.com/dtxent" aria-label="Follow us on Instagram" target="_blank" rel="noopener noreferrer">
+                    <svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path d="M12 0C8.74 0 8.333.015 7.053.072 5.775.132 4.905.333 4.14.63c-.789.306-1.459.717-2.126 1.384S.935 3.35.63 4.14C.333 4.905.131 5.775.072 7.053.012 8.333 0 8.74 0 12s.015 3.667.072 4.947c.06 1.277.261 2.148.558 2.913.306.788.717 1.459 1.384 2.126.667.666 1.336 1.079 2.126 1.384.766.296 1.636.499 2.913.558C8.333 23.988 8.74 24 12 24s3.667-.015 4.947-.072c1.277-.06 2.148-.262 2.913-.558.788-.306 1.459-.718 2.126-1.384.666-.667 1.079-1.335 1.384-2.126.296-.765.499-1.636.558-2.913.06-1.28.072-1.687.072-4.947s-.015-3.667-.072-4.947c-.06-1.277-.262-2.149-.558-2.913-.306-.789-.718-1.459-1.384-2.126C21.319 1.347 20.651.935 19.86.63c-.765-.297-1.636-.499-2.913-.558C15.667.012 15.26 0 12 0zm0 2.16c3.203 0 3.585.016 4.85.071 1.17.055 1.805.249 2.227.415.562.217.96.477 1.382.896.419.42.679.819.896 1.381.164.422.36 1.057.413 2.227.057 1.266.07 1.646.07 4.85s-.015 3.585-.074 4.85c-.061 1.17-.256 1.805-.421 2.227-.224.562-.479.96-.899 1.382-.419.419-.824.679-1.38.896-.42.164-1.065.36-2.235.413-1.274.057-1.649.07-4.859.07-3.211 0-3.586-.015-4.859-.074-1.171-.061-1.816-.256-2.236-.421-.569-.224-.96-.479-1.379-.899-.421-.419-.69-.824-.9-1.38-.165-.42-.359-1.065-.42-2.235-.045-1.26-.061-1.649-.061-4.844 0-3.196.016-3.586.061-4.861.061-1.17.255-1.814.42-2.234.21-.57.479-.96.9-1.381.419-.419.81-.689 1.379-.898.42-.166 1.051-.361 2.221-.421 1.275-.045 1.65-.06 4.859-.06l.045.03zm0 3.678c-3.405 0-6.162 2.76-6.162 6.162 0 3.405 2.76 6.162 6.162 6.162 3.405 0 6.162-2.76 6.162-6.162 0-3.405-2.76-6.162-6.162-6.162zM12 16c-2.21 0-4-1.79-4-4s1.79-4 4-4 4 1.79 4 4-1.79 4-4 4zm7.846-10.405c0 .795-.646 1.44-1.44 1.44-.795 0-1.44-.646-1.44-1.44 0-.794.646-1.439 1.44-1.439.793-.001 1.44.645 1.44 1.439z"/></svg>
+                </a>
+                <a href="https://twitter.com/dtxent" aria-label="Follow us on X (Twitter)" target="_blank" rel="noopener noreferrer">
+                    <svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path d="M18.244 2.25h3.308l-7.227 8.26 8.502 11.24H16.17l-5.214-6.817L4.99 21.75H1.68l7.73-8.835L1.254 2.25H8.08l4.713 6.231zm-1.161 17.52h1.833L7.084 4.126H5.117z"/></svg>
+                </a>
+            </div>
+        </div>
+    </footer>"""
+
+
+def build_scripts() -> str:
+    return '    <script src="/script.js"></script>'
+
+
+def build_event_card(event: dict, past: bool = False) -> str:
+    dt = event["_date"]
+    href = f"/events/{event_slug(event)}"
+    img_src = image_url(event) or "/assets/dtxent-logo.png"
+    img_alt = esc(event.get("imageAlt") or event.get("artistName") or "Event")
+
+    ticket_btn = (
+        '<span class="btn btn-outline btn-block" style="opacity:0.5;cursor:default;">Show Ended</span>' if past
+        else f'<a href="{esc(event.get("ticketUrl") or href)}" class="btn btn-primary btn-block" target="_blank" rel="noopener noreferrer">Get Tickets</a>'
+    )
+
+    return f"""<article class="event-card{' event-card--past' if past else ''}" role="listitem">
+            <a href="{esc(href)}" class="event-card-link" aria-label="{esc(event['artistName'])} at {esc(event['venueName'])}">
+                <div class="event-image">
+                    <div class="event-date">
+                        <span class="month">{MONTHS_SHORT[dt.month - 1]}</span>
+                        <span class="day">{dt.day}</span>
+                    </div>
+                    <img src="{esc(img_src)}" alt="{img_alt}" loading="lazy">
+                </div>
+                <div class="event-details">
+                    <span class="event-venue">{esc(event['venueName'])}, {esc(event.get('venueCity'))}</span>
+                    <h3 class="event-artist">{esc(event['artistName'])}</h3>
+                    <p class="event-info">{esc(event.get('eventName', ''))}</p>
+                </div>
+            </a>
+            <div class="event-card-actions">
+                {ticket_btn}
+            </div>
+        </article>"""
+
+
+# ---------------------------------------------------------------------------
+# Pages
+# ---------------------------------------------------------------------------
+
+
+def render_event_page(event: dict, same_artist: list[dict], same_venue: list[dict], now: datetime) -> str:
+    """Static equivalent of eventPageSSR.renderEventPage."""
+    slug = event_slug(event)
+    artist_slug = to_slug(event["artistName"])
+    canonical_url = f"{SITE_URL}/events/{slug}"
+    dt = event["_date"]
+    formatted_date = format_date(dt)
+    is_past = dt < now
+    is_old_past = now - dt > timedelta(days=OLD_PAST_DAYS)
+    artist, venue, city = event["artistName"], event["venueName"], event.get("venueCity", "")
+    poster = image_url(event)
+
+    event_schema = {
+        "@context": "https://schema.org",
+        "@type": "Event",
+        "name": event.get("eventName") or artist,
+        "description": event.get("description") or f"{artist} live at {venue} in {city}, TX. Presented by Dynamic TX Entertainment.",
+        "startDate": format_datetime_iso(dt),
+        "eventStatus": "https://schema.org/EventCancelled" if event.get("isClosed") else "https://schema.org/EventScheduled",
+        "eventAttendanceMode": "https://schema.org/OfflineEventAttendanceMode",
+        "location": {
+            "@type": "Place",
+            "name": venue,
+            "address": {
+                "@type": "PostalAddress",
+                "addressLocality": city or "Hidalgo",
+                "addressRegion": "TX",
+                "addressCountry": "US",
+            },
+        },
+        "performer": {"@type": "MusicGroup", "name": artist},
+        "organizer": {
+            "@type": "Organization",
+            "name": "Dynamic TX Entertainment",
+            "url": SITE_URL,
+        },
+        "url": canonical_url,
+    }
+    if poster:
+        event_schema["image"] = [SITE_URL + poster if poster.startswith("/") else poster]
+    if event.get("ticketUrl") and not event.get("isClosed"):
+        event_schema["offers"] = {
+            "@type": "Offer",
+            "url": event["ticketUrl"],
+            "priceCurrency": "USD",
+            "availability": "https://schema.org/SoldOut" if is_past else "https://schema.org/InStock",
+        }
+
+    breadcrumb_schema = {
+        "@context": "https://schema.org",
+        "@type": "BreadcrumbList",
+        "itemListElement": [
+            {"@type": "ListItem", "position": 1, "name": "Home", "item": f"{SITE_URL}/"},
+            {"@type": "ListItem", "position": 2, "name": "Events", "item": f"{SITE_URL}/events"},
+            {"@type": "ListItem", "position": 3, "name": artist, "item": f"{SITE_URL}/events/{artist_slug}"},
+            {"@type": "ListItem", "position": 4, "name": f"{artist} at {venue} – {formatted_date}", "item": canonical_url},
+        ],
+    }
+
+    hero_style = f"style=\"background-image:url('{esc(poster)}')\"" if poster else ""
+
+    if event.get("isClosed"):
+        ticket_section = '<div class="ticket-card"><p class="ticket-cancelled">This event has been cancelled.</p></div>'
+    elif is_past:
+        ticket_section = f'<div class="ticket-card"><p class="ticket-past">This event has already taken place.</p><a href="/events/{artist_slug}" class="btn btn-outline">See More {esc(artist)} Shows</a></div>'
+    else:
+        ticket_section = f"""<div class="ticket-card">
+                <div class="ticket-info">
+                    <h2>Get Your Tickets</h2>
+                    <p class="ticket-date">{esc(formatted_date)}</p>
+                    <p class="ticket-venue">{esc(venue)}, {esc(city)}, TX</p>
+                </div>
+                <a href="{esc(event.get('ticketUrl') or '#')}" class="btn btn-primary btn-lg" target="_blank" rel="noopener noreferrer" aria-label="Buy {esc(artist)} tickets at {esc(venue)}">
+                    Buy Tickets
+                </a>
+            </div>"""
+
+    card_sep = "\n                    "
+    related_artist_section = f"""<section class="section ssr-related" aria-label="More {esc(artist)} shows">
+            <div class="container">
+                <h2 class="section-title">More <span class="text-highlight">{esc(artist)}</span> Shows</h2>
+                <div class="events-grid" role="list">
+                    {card_sep.join(build_event_card(e) for e in same_artist)}
+                </div>
+            </div>
+        </section>""" if same_artist else ""
+
+    related_venue_section = f"""<section class="section ssr-related" aria-label="More events at {esc(venue)}">
+            <div class="container">
+                <h2 class="section-title">More Events at <span class="text-highlight">{esc(venue)}</span></h2>
+                <div class="events-grid" role="list">
+                    {card_sep.join(build_event_card(e) for e in same_venue)}
+                </div>
+            </div>
+        </section>""" if same_venue else ""
+
+    description = event.get("description") or (
+        f"{artist} performs live at {venue} in {city or 'the Rio Grande Valley'}, TX on {formatted_date}. "
+        "Presented by Dynamic TX Entertainment (DTXENT) — the Rio Grande Valley's premier live entertainment brand."
+    )
+
+    head = build_head(
+        title=f"{artist} at {venue} – {formatted_date} | DTXENT",
+        description=f"{artist} live at {venue}, {city or 'TX'} on {formatted_date}. Get tickets now — presented by Dynamic TX Entertainment.",
+        canonical_url=canonical_url,
+        og_image=poster,
+        noindex=is_old_past,
+        json_ld_blocks=[event_schema, breadcrumb_schema],
+    )
+
+    tour_line = f'<p class="ssr-event-tour">{esc(event["eventName"])}</p>' if event.get("eventName") else ""
+
+    return f"""{head}
+<body>
+{build_nav()}
+    <main id="main-content" role="main">
+
+        <!-- Breadcrumb -->
+        <nav class="ssr-breadcrumb container" aria-label="Breadcrumb">
+            <ol>
+                <li><a href="/">Home</a></li>
+                <li><a href="/events">Events</a></li>
+                <li><a href="/events/{artist_slug}">{esc(artist)}</a></li>
+                <li aria-current="page">{esc(venue)} – {esc(formatted_date)}</li>
+            </ol>
+        </nav>
+
+        <!-- Event Hero -->
+        <section class="ssr-event-hero" {hero_style} aria-label="Event hero">
+            <div class="ssr-event-hero-overlay"></div>
+            <div class="container ssr-event-hero-content">
+                <div class="ssr-date-badge">
+                    <span class="month">{MONTHS_SHORT[dt.month - 1]}</span>
+                    <span class="day">{dt.day}</span>
+                    <span class="year">{dt.year}</span>
+                </div>
+                <h1 class="ssr-event-title">{esc(artist)}</h1>
+                {tour_line}
+                <p class="ssr-event-venue-line">{esc(venue)} &middot; {esc(city)}, TX</p>
+            </div>
+        </section>
+
+        <!-- Ticket CTA -->
+        <section id="tickets" class="section ssr-tickets" aria-label="Tickets">
+            <div class="container">
+                {ticket_section}
+            </div>
+        </section>
+
+        <!-- Event Details -->
+        <section class="section ssr-details" aria-label="Event details">
+            <div class="container ssr-details-grid">
+                <div class="ssr-description">
+                    <h2>About This Show</h2>
+                    <p>{esc(description)}</p>
+                </div>
+                <aside class="ssr-sidebar">
+                    <div class="ssr-detail-card">
+                        <h3>Event Details</h3>
+                        <dl>
+                            <dt>Date</dt>
+                            <dd>{esc(formatted_date)}</dd>
+                            <dt>Venue</dt>
+                            <dd>{esc(venue)}</dd>
+                            <dt>City</dt>
+                            <dd>{esc(city or 'Rio Grande Valley')}, TX</dd>
+                        </dl>
+                    </div>
+                    <div class="ssr-detail-card">
+                        <h3>VIP Experience</h3>
+                        <p>Upgrade your night with DTXENT VIP packages — bottle service, exclusive access, and more.</p>
+                        <a href="/vip.html" class="btn btn-outline">Explore VIP</a>
+                    </div>
+                </aside>
+            </div>
+        </section>
+
+        {related_artist_section}
+        {related_venue_section}
+
+    </main>
+{build_footer(now.year)}
+{build_scripts()}
+</body>
+</html>"""
+
+
+def render_index_page(upcoming: list[dict], now: datetime) -> str:
+    """Static equivalent of eventIndexSSR."""
+    canonical_url = f"{SITE_URL}/events"
+
+    grouped: dict[str, list[dict]] = {}
+    for event in upcoming:
+        grouped.setdefault(format_month_year(event["_date"]), []).append(event)
+
+    card_sep = "\n            "
+    month_sections = "\n".join(
+        f"""        <div class="ssr-month-group">
+                <h2 class="ssr-month-heading">{esc(month)}</h2>
+                <div class="events-grid" role="list">
+                    {card_sep.join(build_event_card(e) for e in events)}
+                </div>
+            </div>"""
+        for month, events in grouped.items()
+    )
+
+    empty_state = "" if upcoming else (
+        '<div class="ssr-empty"><p>No upcoming events at this time. Check back soon!</p>'
+        '<a href="/" class="btn btn-outline">Back to Home</a></div>'
+    )
+
+    json_ld = [
+        {
+            "@context": "https://schema.org",
+            "@type": "CollectionPage",
+            "name": "Upcoming Events | DTXENT",
+            "description": "Browse all upcoming concerts, shows, and live entertainment events in the Rio Grande Valley, TX.",
+            "url": canonical_url,
+            "publisher": {
+                "@type": "Organization",
+                "name": "Dynamic TX Entertainment",
+                "url": SITE_URL,
+            },
+        },
+        {
+            "@context": "https://schema.org",
+            "@type": "BreadcrumbList",
+            "itemListElement": [
+                {"@type": "ListItem", "position": 1, "name": "Home", "item": f"{SITE_URL}/"},
+                {"@type": "ListItem", "position": 2, "name": "Events", "item": canonical_url},
+            ],
+        },
+    ]
+
+    head = build_head(
+        title="Upcoming Events in the Rio Grande Valley | DTXENT",
+        description="Browse all upcoming concerts, comedy shows, and live entertainment events across South Texas — Payne Arena, South Padre Island, McAllen, and beyond. Promoted by DTXENT.",
+        canonical_url=canonical_url,
+        json_ld_blocks=json_ld,
+    )
+
+    return f"""{head}
+<body>
+{build_nav()}
+    <main id="main-content" role="main">
+        <section class="ssr-hero section" aria-labelledby="events-index-title">
+            <div class="container">
+                <h1 id="events-index-title" class="section-title">
+                    Upcoming <span class="text-highlight">Events</span>
+                </h1>
+                <p class="section-desc">Concerts, shows, and live entertainment across the Rio Grande Valley — Payne Arena, South Padre Island, McAllen, and beyond.</p>
+            </div>
+        </section>
+
+        <section class="section" aria-label="Events list">
+            <div class="container">
+                {month_sections}
+                {empty_state}
+            </div>
+        </section>
+    </main>
+{build_footer(now.year)}
+{build_scripts()}
+</body>
+</html>"""
+
+
+def render_sitemap(entries: list[dict]) -> str:
+    """Static equivalent of eventSitemapSSR. `entries` are {loc, lastmod, changefreq, priority}."""
+    url_tags = "\n".join(
+        f"""  <url>
+    <loc>{u['loc']}</loc>
+    <lastmod>{u['lastmod']}</lastmod>
+    <changefreq>{u['changefreq']}</changefreq>
+    <priority>{u['priority']}</priority>
+  </url>"""
+        for u in entries
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{url_tags}
+</urlset>"""
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    data = text.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, data)
+    return True
+
+
+def _fingerprint(*parts) -> str:
+    payload = json.dumps([TEMPLATE_VERSION, *parts], sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _page_inputs(event: dict) -> dict:
+    return {k: v for k, v in event.items() if not k.startswith("_")}
+
+
+def _related(event: dict, upcoming: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Mirror eventPageSSR: next 5 upcoming per artist/venue, minus this event, capped at 4."""
+    slug = event["_slug"]
+    same_artist = [e for e in upcoming if e["artistName"] == event["artistName"]][:5]
+    same_venue = [e for e in upcoming if e["venueName"] == event["venueName"]][:5]
+    same_artist = [e for e in same_artist if e["_slug"] != slug][:RELATED_LIMIT]
+    artist_slug = to_slug(event["artistName"])
+    same_venue = [e for e in same_venue if e["_slug"] != slug][:RELATED_LIMIT]
+    same_venue = [e for e in same_venue if to_slug(e["artistName"]) != artist_slug]
+    return same_artist, same_venue
+
+
+def load_manifest(path: Path = MANIFEST_FILE) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"pages": {}}
+
+
+def prerender(
+    events: list[dict],
+    events_dir: Path = EVENTS_DIR,
+    index_file: Path = INDEX_FILE,
+    sitemap_file: Path = SITEMAP_FILE,
+    now: datetime | None = None,
+) -> dict:
+    """
+    Render every published event page, the index and the sitemap.
+
+    Returns stats: {"rendered", "skipped", "deleted", "index", "sitemap", "paths"}
+    where "paths" lists every file written or deleted (for git staging).
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    manifest_path = events_dir / MANIFEST_FILE.name
+    manifest = load_manifest(manifest_path)
+    old_pages = manifest.get("pages", {})
+    stats = {"rendered": 0, "skipped": 0, "deleted": 0, "index": False, "sitemap": False, "paths": []}
+
+    # Normalize: published events with the fields a page needs, keyed by slug
+    by_slug = {}
+    for event in events:
+        if event.get("isPublished") is False:
+            continue
+        if not event.get("artistName") or not event.get("venueName"):
+            continue
+        dt = parse_event_datetime(event.get("eventDate", ""))
+        if dt is None:
+            continue
+        page_event = {**event, "_date": dt}
+        page_event["_slug"] = event_slug(page_event)
+        by_slug[page_event["_slug"]] = page_event
+
+    ordered = sorted(by_slug.values(), key=lambda e: e["_date"])
+    upcoming = [e for e in ordered if e["_date"] >= now]
+
+    pages = {}
+    for event in ordered:
+        slug = event["_slug"]
+        same_artist, same_venue = _related(event, upcoming)
+        is_past = event["_date"] < now
+        is_old_past = now - event["_date"] > timedelta(days=OLD_PAST_DAYS)
+        fingerprint = _fingerprint(
+            _page_inputs(event),
+            [_page_inputs(e) for e in same_artist],
+            [_page_inputs(e) for e in same_venue],
+            is_past, is_old_past, now.year,
+        )
+        path = events_dir / f"{slug}.html"
+        previous = old_pages.get(slug)
+
+        if previous and previous["fingerprint"] == fingerprint and path.exists():
+            pages[slug] = previous
+            stats["skipped"] += 1
+            continue
+
+        html = render_event_page(event, same_artist, same_venue, now)
+        lastmod = previous["lastmod"] if previous else f"{now:%Y-%m-%d}"
+        if _write_if_changed(path, html):
+            stats["paths"].append(path)
+            lastmod = f"{now:%Y-%m-%d}"
+        pages[slug] = {"fingerprint": fingerprint, "lastmod": lastmod}
+        stats["rendered"] += 1
+
+    for slug in old_pages.keys() - pages.keys():
+        stale = events_dir / f"{slug}.html"
+        if stale.exists():
+            stale.unlink()
+            stats["paths"].append(stale)
+            stats["deleted"] += 1
+
+    if _write_if_changed(index_file, render_index_page(upcoming[:INDEX_LIMIT], now)):
+        stats["index"] = True
+        stats["paths"].append(index_file)
+
+    # lastmod is the day a page last changed, so the sitemap is stable between runs
+    latest = max((p["lastmod"] for p in pages.values()), default=f"{now:%Y-%m-%d}")
+    entries = [{"loc": f"{SITE_URL}/events", "lastmod": latest, "changefreq": "daily", "priority": "0.9"}]
+    artist_slugs = set()
+    for event in ordered:
+        is_upcoming = event["_date"] >= now
+        entries.append({
+            "loc": f"{SITE_URL}/events/{event['_slug']}",
+            "lastmod": pages[event["_slug"]]["lastmod"],
+            "changefreq": "weekly" if is_upcoming else "monthly",
+            "priority": "1.0" if is_upcoming else "0.6",
+        })
+        artist_slug = to_slug(event["artistName"])
+        if artist_slug not in artist_slugs:
+            artist_slugs.add(artist_slug)
+            entries.append({
+                "loc": f"{SITE_URL}/events/{artist_slug}",
+                "lastmod": latest,
+                "changefreq": "weekly",
+                "priority": "0.7",
+            })
+    if _write_if_changed(sitemap_file, render_sitemap(entries)):
+        stats["sitemap"] = True
+        stats["paths"].append(sitemap_file)
+
+    manifest_text = json.dumps({"pages": dict(sorted(pages.items()))}, indent=2) + "\n"
+    if _write_if_changed(manifest_path, manifest_text):
+        stats["paths"].append(manifest_path)
+
+    return stats
+
+
+if __name__ == "__main__":
+    from js_parser import load_events_data
+
+    data = load_events_data(REPO_ROOT / "js" / "events-data.js")
+    result = prerender(data["events"])
+    print(f"[OK] Pre-rendered {result['rendered']} event page(s), "
+          f"{result['skipped']} unchanged, {result['deleted']} deleted")
+    print(f"     events.html {'updated' if result['index'] else 'unchanged'}, "
+          f"sitemap-events.xml {'updated' if result['sitemap'] else 'unchanged'}")
@@ -13,18 +13,30 @@ Usage:
     python execution/research_venues.py --category "food_trucks" --location "Payne Arena, Hidalgo, TX" --radius 15
     python execution/research_venues.py --category "hotels" --location "South Padre Island, TX" --top 5
     python execution/research_venues.py --category "clubs" --location "McAllen, TX" --update-site
+    python execution/research_venues.py --category "hotels" --location "Hidalgo, TX" --refresh
+    python execution/research_venues.py --category restaurants hotels clubs --location "Hidalgo, TX" "McAllen, TX"
+    python execution/research_venues.py --batch research_jobs.yaml --concurrency 4 --rate-limit 1
+    python execution/research_venues.py --from-events --days 60 --category restaurants hotels --max-jobs 10
+
+Search responses are cached under .tmp/research/cache/ (see response_cache.py),
+keyed by model + prompt + category + location + radius + top. --refresh
+bypasses the cache; --cache-ttl sets the maximum age in hours.
 """
 
 import argparse
 import json
-import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from gemini_client import GeminiClient, RateLimiter, ResponseParseError
+from response_cache import ResponseCache, fingerprint
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -38,6 +50,24 @@ ENV_PATH = WORKSPACE_ROOT / ".env"
 
 MODEL = "gemini-3-pro-preview"
 
+CACHE_DIR = OUTPUT_DIR / "cache"
+CACHE_TTL_HOURS = 72
+CACHE_MAX_ENTRIES = 500
+
+# Batch mode defaults (override per job file or on the command line)
+BATCH_CONCURRENCY = 4
+BATCH_RATE_LIMIT = 1.0  # Gemini calls started per second
+
+DEFAULT_RADIUS = 25         # Miles
+
+# Other arrays listing the same kind of place, checked during dedupe
+DEDUPE_ALSO = {"LOCAL_RESTAURANTS": ["DINING_RESTAURANTS"]}
+
+# --from-events defaults
+VENUE_WINDOW_DAYS = 30      # Count events in the next N days
+VENUE_RADIUS = 10           # Miles around a venue
+VENUE_CATEGORIES = ["restaurants", "hotels"]
+
 # Category to schema mapping
 CATEGORY_SCHEMAS = {
     "restaurants": {
@@ -93,30 +123,55 @@ def load_existing_entries(category: str) -> list[dict]:
     return extract_js_array(content, array_name)
 
 
+def load_existing_arrays(categories: list[str]) -> dict[str, list[dict]]:
+    """
+    Existing entries for several categories, keyed by array name, from a
+    single read/parse of events-data.js (batch mode).
+    """
+    from js_parser import extract_js_array
+
+    content = EVENTS_DATA_PATH.read_text(encoding="utf-8")
+    array_names = {CATEGORY_SCHEMAS[c]["array_name"] for c in categories if c in CATEGORY_SCHEMAS}
+    return {name: extract_js_array(content, name) for name in sorted(array_names)}
+
+
+def load_related_arrays(array_names: list[str]) -> dict[str, list[dict]]:
+    """
+    Entries from the DEDUPE_ALSO arrays of each array name (e.g. the dining
+    page's restaurants for LOCAL_RESTAURANTS), checked during dedupe only.
+    """
+    from js_parser import extract_js_array
+
+    content = EVENTS_DATA_PATH.read_text(encoding="utf-8")
+    return {
+        name: [e for related in DEDUPE_ALSO.get(name, []) for e in extract_js_array(content, related)]
+        for name in array_names
+    }
+
+
 # ---------------------------------------------------------------------------
 # Gemini Search — Grounded Research
 # ---------------------------------------------------------------------------
 
 
-def search_vendors(
-    category: str,
-    location: str,
-    radius: int = 25,
-    top: int = 10,
-) -> list[dict]:
-    """
-    Use Gemini with Google Search grounding to find businesses.
-    Returns a list of structured results.
-    """
-    from google import genai
-    from google.genai import types
+def make_client() -> GeminiClient:
+    """Shared Gemini wrapper; the genai.Client behind it is created on first use."""
+    return GeminiClient()
 
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise EnvironmentError("GEMINI_API_KEY not set in .env")
 
-    client = genai.Client(api_key=api_key)
+def vendor_schema(category: str) -> dict:
+    """Response schema for one category's search results (structured output)."""
+    fields = CATEGORY_SCHEMAS[category]["fields"]
+    types = {"features": {"type": "ARRAY", "items": {"type": "STRING"}},
+             "lat": {"type": "NUMBER"}, "lng": {"type": "NUMBER"}, "stars": {"type": "NUMBER"}}
+    properties = {f: types.get(f, {"type": "STRING"}) for f in fields if f not in ("id", "image")}
+    properties["confidence_score"] = {"type": "NUMBER"}
+    return {"type": "ARRAY", "items": {"type": "OBJECT", "properties": properties,
+                                       "required": ["name", "city", "confidence_score"]}}
 
+
+def build_search_prompt(category: str, location: str, radius: int = 25, top: int = 10) -> str:
+    """Grounded-search prompt for one category around one location."""
     # Build category-specific prompt additions
     category_context = {
         "restaurants": "Focus on dining experiences that concert-goers and event attendees would enjoy — late-night options, pre-show dinner spots, and unique local cuisine.",
@@ -172,36 +227,70 @@ Also include a "confidence_score" (0.0 to 1.0) indicating how confident you are
 
 Return ONLY a JSON array of objects. No markdown fences, no extra text.
 Example: [{{"name": "Example Place", "type": "Mexican", ...}}]"""
+    return prompt
 
-    try:
-        response = client.models.generate_content(
-            model=MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                tools=[types.Tool(google_search=types.GoogleSearch())],
-            ),
-        )
 
-        response_text = response.text.strip()
-        # Strip markdown fences if present
-        if response_text.startswith("```"):
-            response_text = re.sub(r"```\w*\n?", "", response_text).strip()
+def search_cache_key(category: str, location: str, radius: int = 25, top: int = 10) -> str:
+    """Response-cache fingerprint: everything that determines the model's answer."""
+    return fingerprint(model=MODEL, prompt=build_search_prompt(category, location, radius, top),
+                       category=category, location=location, radius=radius, top=top)
 
-        results = json.loads(response_text)
-        if isinstance(results, list):
-            return results
-        else:
-            print("WARNING: Response was not a JSON array")
-            return []
 
-    except json.JSONDecodeError as e:
+def search_vendors(
+    category: str,
+    location: str,
+    radius: int = 25,
+    top: int = 10,
+    cache: ResponseCache | None = None,
+    client: GeminiClient | None = None,
+    on_item=None,
+) -> list[dict]:
+    """
+    Use Gemini with Google Search grounding to find businesses.
+    Returns a list of structured results.
+
+    With a cache, an identical request (same model, prompt and parameters)
+    is answered from disk without calling the API. Pass `client` to share
+    one GeminiClient across calls (batch mode); `on_item` receives each
+    result as soon as it has streamed in.
+    """
+    prompt = build_search_prompt(category, location, radius, top)
+    cache_key = search_cache_key(category, location, radius, top)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            print(f"   ♻️  Cached response ({len(cached)} results)")
+            return cached
+
+    from google.genai import types
+
+    client = client or make_client()
+
+    try:
+        results = client.generate_json(
+            prompt,
+            model=MODEL,
+            schema=vendor_schema(category),
+            tools=[types.Tool(google_search=types.GoogleSearch())],
+            label=f"search {category} @ {location}",
+            on_item=on_item,
+        )
+    except ResponseParseError as e:
         print(f"ERROR: Failed to parse Gemini response as JSON: {e}")
-        print(f"Raw response:\n{response_text[:500]}")
+        print(f"Raw response:\n{e.text[:500]}")
         return []
     except Exception as e:
         print(f"ERROR: Gemini search failed: {e}")
         return []
 
+    if not isinstance(results, list):
+        print("WARNING: Response was not a JSON array")
+        return []
+    if cache is not None and results:
+        cache.put(cache_key, results, meta={"model": MODEL, "category": category, "location": location,
+                                            "radius": radius, "top": top})
+    return results
+
 
 # ---------------------------------------------------------------------------
 # Scoring & Ranking
@@ -283,25 +372,213 @@ def filter_duplicates(
     new_entries: list[dict], existing_entries: list[dict]
 ) -> list[dict]:
     """
-    Remove entries that already exist in events-data.js.
-    Matches on name (case-insensitive) + city.
+    Remove entries that already exist in events-data.js (or earlier in
+    new_entries). Same place = similar name within SAME_PLACE_M meters, or
+    the same name in the same city (see geo_index.GeoIndex.find_duplicate).
     """
-    existing_keys = set()
-    for e in existing_entries:
-        key = (e.get("name", "").strip().lower(), e.get("city", "").strip().lower())
-        existing_keys.add(key)
+    from geo_index import SAME_PLACE_M, GeoIndex
 
+    index = GeoIndex(existing_entries, cell_m=SAME_PLACE_M)
     unique = []
     for entry in new_entries:
-        key = (entry.get("name", "").strip().lower(), entry.get("city", "").strip().lower())
-        if key not in existing_keys:
+        match = index.find_duplicate(entry)
+        if match is None:
             unique.append(entry)
+            index.add(entry)
         else:
-            print(f"   ⏭️  Skipping duplicate: {entry['name']} ({entry['city']})")
+            print(f"   ⏭️  Skipping duplicate: {entry['name']} ({entry['city']}) ~ {match.get('name')}")
 
     return unique
 
 
+# ---------------------------------------------------------------------------
+# Batch Mode — category × location matrix
+# ---------------------------------------------------------------------------
+
+
+def expand_matrix(categories: list[str], locations: list[str], radius: int = 25, top: int = 10) -> list[dict]:
+    """Every category × location pair as a job dict."""
+    return [
+        {"category": category, "location": location, "radius": radius, "top": top}
+        for category in categories
+        for location in locations
+    ]
+
+
+def load_jobs(path: Path) -> tuple[list[dict], dict]:
+    """
+    Read a YAML or JSON job file. Returns (jobs, settings).
+
+        concurrency: 4          # optional, overrides --concurrency
+        rate_limit: 1           # optional, Gemini calls per second
+        radius: 25              # defaults for every matrix below
+        top: 10
+        jobs:
+          - categories: [restaurants, hotels]
+            locations: ["Hidalgo, TX", "McAllen, TX"]
+          - categories: [clubs]
+            locations: ["South Padre Island, TX"]
+            radius: 10
+
+    Duplicate (category, location, radius, top) jobs are dropped.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix.lower() in (".yaml", ".yml"):
+        import yaml
+
+        spec = yaml.safe_load(text) or {}
+    else:
+        spec = json.loads(text)
+
+    jobs, seen = [], set()
+    for matrix in spec.get("jobs", []):
+        categories = matrix.get("categories") or [matrix["category"]]
+        locations = matrix.get("locations") or [matrix["location"]]
+        for category in categories:
+            if category not in CATEGORY_SCHEMAS:
+                raise ValueError(f"Unknown category in {path}: {category}")
+        for job in expand_matrix(categories, locations,
+                                 matrix.get("radius", spec.get("radius", 25)),
+                                 matrix.get("top", spec.get("top", 10))):
+            key = tuple(job.values())
+            if key not in seen:
+                seen.add(key)
+                jobs.append(job)
+
+    settings = {k: spec[k] for k in ("concurrency", "rate_limit") if k in spec}
+    return jobs, settings
+
+
+def run_batch(
+    jobs: list[dict],
+    cache: ResponseCache | None = None,
+    concurrency: int = BATCH_CONCURRENCY,
+    rate_limit: float | None = BATCH_RATE_LIMIT,
+    client=None,
+) -> dict:
+    """
+    Run all jobs concurrently and merge the results into one report.
+
+    events-data.js is parsed once; one GeminiClient is shared (and only
+    created if some job misses the cache); cache hits skip the rate limiter.
+    New entries are deduplicated against the site and across jobs, and get
+    sequential ids per array.
+    """
+    from geo_index import SAME_PLACE_M, GeoIndex
+
+    existing = load_existing_arrays([job["category"] for job in jobs])
+    related = load_related_arrays(list(existing))
+    limiter = RateLimiter(rate_limit)
+    client_lock = threading.Lock()
+    shared = {"client": client}
+
+    def run_job(job: dict) -> list[dict]:
+        call_client = None
+        if cache is None or not cache.contains(search_cache_key(**job)):
+            with client_lock:
+                if shared["client"] is None:
+                    shared["client"] = make_client()
+                call_client = shared["client"]
+            limiter.wait()
+        return search_vendors(**job, cache=cache, client=call_client)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        raw_results = list(pool.map(run_job, jobs))
+
+    results = {name: [] for name in existing}
+    seen = {name: GeoIndex(entries + related[name], cell_m=SAME_PLACE_M) for name, entries in existing.items()}
+    job_reports = []
+    for job, raw in zip(jobs, raw_results):
+        schema = CATEGORY_SCHEMAS[job["category"]]
+        array_name = schema["array_name"]
+        ranked = score_and_rank(raw)
+        new = 0
+        for entry in format_for_website(ranked, job["category"]):
+            if seen[array_name].find_duplicate(entry) is not None:
+                continue
+            seen[array_name].add(entry)
+            entry["id"] = f"{schema['id_prefix']}-{len(existing[array_name]) + len(results[array_name]) + 1}"
+            entry["_query"] = {"category": job["category"], "location": job["location"]}
+            results[array_name].append(entry)
+            new += 1
+        job_reports.append({**job, "raw": len(raw), "ranked": len(ranked), "new": new})
+
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "model": MODEL,
+        "jobs": job_reports,
+        "existing": {name: len(entries) for name, entries in existing.items()},
+        "result_count": sum(len(entries) for entries in results.values()),
+        "results": results,
+        "cache": dict(cache.stats) if cache is not None else None,
+        "gemini": shared["client"].metrics() if shared["client"] is not None else None,
+    }
+
+
+def venue_targets(events: list[dict], days: int = VENUE_WINDOW_DAYS, now: datetime | None = None) -> list[dict]:
+    """
+    Unique (venueName, venueCity) pairs from LOCAL_EVENTS, weighted by the
+    number of show dates in the next `days` days, busiest first. Venues with
+    no show in the window are left out.
+    """
+    from event_keys import parse_event_datetime
+
+    now = now or datetime.now()
+    horizon = now.timestamp() + days * 86400
+    targets: dict[tuple[str, str], dict] = {}
+    for event in events:
+        venue, city = event.get("venueName", "").strip(), event.get("venueCity", "").strip()
+        if not venue or not city:
+            continue
+        dates = [d.get("eventDate", "") for d in event.get("dates") or []] or [event.get("eventDate", "")]
+        upcoming = 0
+        for value in dates:
+            dt = parse_event_datetime(value)
+            if dt is not None and now <= dt and dt.timestamp() <= horizon:
+                upcoming += 1
+        if not upcoming:
+            continue
+        key = (venue.lower(), city.lower())
+        target = targets.setdefault(key, {
+            "venueName": venue, "venueCity": city, "venueState": event.get("venueState", ""), "upcoming": 0,
+        })
+        target["upcoming"] += upcoming
+
+    return sorted(targets.values(), key=lambda t: (-t["upcoming"], t["venueName"].lower()))
+
+
+def venue_jobs(
+    targets: list[dict],
+    categories: list[str],
+    cache: ResponseCache | None = None,
+    radius: int = VENUE_RADIUS,
+    top: int = 10,
+    max_jobs: int | None = None,
+) -> list[dict]:
+    """
+    Research jobs around each target venue, skipping (venue, category) pairs
+    whose cached research is still fresh. Busiest venues come first, so
+    max_jobs drops the least-visited ones.
+    """
+    jobs = []
+    for target in targets:
+        location = ", ".join(p for p in (target["venueName"], target["venueCity"], target["venueState"]) if p)
+        for category in categories:
+            job = {"category": category, "location": location, "radius": radius, "top": top}
+            if cache is not None and cache.contains(search_cache_key(**job)):
+                continue
+            jobs.append(job)
+    return jobs[:max_jobs] if max_jobs else jobs
+
+
+def save_batch_report(report: dict) -> Path:
+    """Save a consolidated batch report to .tmp/research/."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    filepath = OUTPUT_DIR / f"{datetime.now().strftime('%Y-%m-%d_%H%M%S')}_batch.json"
+    filepath.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    return filepath
+
+
 # ---------------------------------------------------------------------------
 # Output
 # ---------------------------------------------------------------------------
@@ -340,17 +617,41 @@ def main():
         description="AI Research Assistant — discover venues, restaurants, hotels, and vendors."
     )
     parser.add_argument(
-        "--category", type=str, required=True,
+        "--category", type=str, nargs="+",
         choices=VALID_CATEGORIES,
-        help=f"Category to search: {', '.join(VALID_CATEGORIES)}"
+        help=f"Category to search: {', '.join(VALID_CATEGORIES)} (several = batch matrix)"
     )
     parser.add_argument(
-        "--location", type=str, required=True,
-        help="Location to search near (e.g., 'Hidalgo, TX', 'near Payne Arena')"
+        "--location", type=str, nargs="+",
+        help="Location to search near (e.g., 'Hidalgo, TX', 'near Payne Arena'; several = batch matrix)"
     )
     parser.add_argument(
-        "--radius", type=int, default=25,
-        help="Search radius in miles (default: 25)"
+        "--batch", type=Path,
+        help="YAML/JSON job file with category × location matrices (see load_jobs)"
+    )
+    parser.add_argument(
+        "--from-events", action="store_true",
+        help="Derive jobs from the venues in LOCAL_EVENTS (only venues with stale research)"
+    )
+    parser.add_argument(
+        "--days", type=int, default=VENUE_WINDOW_DAYS,
+        help=f"--from-events: weight venues by shows in the next N days (default: {VENUE_WINDOW_DAYS})"
+    )
+    parser.add_argument(
+        "--max-jobs", type=int,
+        help="--from-events: research at most this many (busiest first)"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=BATCH_CONCURRENCY,
+        help=f"Batch mode: parallel searches (default: {BATCH_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, default=BATCH_RATE_LIMIT,
+        help=f"Batch mode: Gemini calls started per second (default: {BATCH_RATE_LIMIT})"
+    )
+    parser.add_argument(
+        "--radius", type=int,
+        help=f"Search radius in miles (default: {DEFAULT_RADIUS}, or {VENUE_RADIUS} with --from-events)"
     )
     parser.add_argument(
         "--top", type=int, default=10,
@@ -360,7 +661,27 @@ def main():
         "--update-site", action="store_true",
         help="Append new entries to events-data.js (use with caution)"
     )
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="Ignore cached search responses (fresh results are still cached)"
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=CACHE_TTL_HOURS,
+        help=f"Maximum age of cached search responses in hours (default: {CACHE_TTL_HOURS})"
+    )
     args = parser.parse_args()
+    if not (args.batch or args.from_events) and not (args.category and args.location):
+        parser.error("--category and --location are required (or use --batch / --from-events)")
+
+    cache = ResponseCache(CACHE_DIR, ttl_seconds=args.cache_ttl * 3600,
+                          max_entries=CACHE_MAX_ENTRIES, refresh=args.refresh)
+
+    if args.from_events:
+        return main_from_events(args, cache)
+    args.radius = args.radius or DEFAULT_RADIUS
+    if args.batch or len(args.category) > 1 or len(args.location) > 1:
+        return main_batch(args, cache)
+    args.category, args.location = args.category[0], args.location[0]
 
     print("=" * 60)
     print("🔍 DTXENT AI Research Assistant")
@@ -377,13 +698,20 @@ def main():
 
     # 2. Search with Gemini
     print(f"\n🔎 Searching for {args.category} near {args.location}...")
+    client = make_client()
     raw_results = search_vendors(
         category=args.category,
         location=args.location,
         radius=args.radius,
         top=args.top,
+        cache=cache,
+        client=client,
+        on_item=lambda item: print(f"   • {item.get('name', '?')}") if isinstance(item, dict) else None,
     )
     print(f"   Found {len(raw_results)} raw results")
+    print(f"   Cache: {cache.summary()}")
+    if client.calls:
+        print(f"   Gemini: {client.summary()}")
 
     if not raw_results:
         print("\n❌ No results found. Try widening the radius or adjusting the location.")
@@ -397,7 +725,8 @@ def main():
     formatted = format_for_website(ranked, args.category, len(existing))
 
     # 5. Remove duplicates
-    unique = filter_duplicates(formatted, existing)
+    array_name = CATEGORY_SCHEMAS[args.category]["array_name"]
+    unique = filter_duplicates(formatted, existing + load_related_arrays([array_name])[array_name])
     print(f"   {len(unique)} new unique entries")
 
     # 6. Save report
@@ -441,5 +770,69 @@ def main():
     print("✅ Done!")
 
 
+def main_from_events(args, cache: ResponseCache):
+    """Research around the venues shows are booked at, skipping venues with fresh research."""
+    from js_parser import load_events_data
+
+    events = load_events_data(EVENTS_DATA_PATH)["events"]
+    targets = venue_targets(events, days=args.days)
+    radius = args.radius or VENUE_RADIUS
+    jobs = venue_jobs(targets, args.category or VENUE_CATEGORIES, cache, radius, args.top, args.max_jobs)
+
+    print(f"📍 {len(targets)} venue(s) with shows in the next {args.days} days:")
+    for target in targets:
+        print(f"   {target['upcoming']:>3} × {target['venueName']} ({target['venueCity']})")
+    if not targets:
+        print("\n✅ No upcoming shows in the window — nothing to do.")
+        return
+    if not jobs:
+        print("\n✅ All venue research is fresh — nothing to do.")
+        return
+    return main_batch(args, cache, jobs)
+
+
+def main_batch(args, cache: ResponseCache, jobs: list[dict] | None = None):
+    """Batch mode: run a category × location matrix and write one consolidated report."""
+    settings = {}
+    if args.batch:
+        jobs, settings = load_jobs(args.batch)
+    elif jobs is None:
+        jobs = expand_matrix(args.category, args.location, args.radius, args.top)
+    concurrency = settings.get("concurrency", args.concurrency)
+    rate_limit = settings.get("rate_limit", args.rate_limit)
+
+    print("=" * 60)
+    print("🔍 DTXENT AI Research Assistant — batch")
+    print(f"   Model: {MODEL}")
+    print(f"   Jobs: {len(jobs)} (concurrency {concurrency}, {rate_limit} call(s)/s)")
+    print("=" * 60)
+
+    report = run_batch(jobs, cache=cache, concurrency=concurrency, rate_limit=rate_limit)
+
+    print("\n" + "=" * 60)
+    for job in report["jobs"]:
+        print(f"   {job['category']:<12} {job['location']:<32} raw {job['raw']:>3}  ranked {job['ranked']:>3}  new {job['new']:>3}")
+    for array_name, entries in report["results"].items():
+        print(f"\n📋 {array_name}: {len(entries)} new unique entries (existing: {report['existing'][array_name]})")
+        for entry in entries:
+            print(f"   - {entry['name']} ({entry.get('city', 'N/A')}) — confidence {entry.get('_confidence', '?')}")
+    print(f"\n   Cache: {cache.summary()}")
+    if report["gemini"]:
+        g = report["gemini"]
+        print(f"   Gemini: {g['calls']} call(s), {g['retries']} retried, {g['repaired']} repaired, "
+              f"{g['promptTokens']} in / {g['outputTokens']} out tokens")
+
+    report_path = save_batch_report(report)
+    print(f"\n💾 Report saved: {report_path}")
+
+    if args.update_site and report["result_count"]:
+        update_path = OUTPUT_DIR / "pending_update_batch.json"
+        update_path.write_text(json.dumps(report["results"], indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"   Pending update saved (manual review recommended): {update_path}")
+
+    print("\n" + "=" * 60)
+    print("✅ Done!")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,132 @@
+"""
+response_cache.py — Persistent cache for slow, billed model responses.
+
+Entries are JSON files named by a fingerprint of everything that determines
+the response (model, prompt, parameters):
+
+    .tmp/research/cache/<sha256>.json
+    {"createdAt": 1767225600.0, "meta": {...}, "value": ...}
+
+- get() misses once an entry is older than the TTL
+- put() evicts least-recently-used entries beyond max_entries
+  (file mtime is the "last used" clock; hits touch it)
+- refresh=True bypasses reads but still stores the fresh response
+- stats counts hits / misses / expired / writes / evicted for the run summary
+
+Binary payloads (generated images) go in blobs/, named by the sha256 of their
+content: put_blob() returns the name to keep in the entry's value, and the
+entry lists it in meta["blobs"] so evict() can drop blobs nothing references.
+
+Used by research_venues.search_vendors and generate_social_post; the
+fingerprint parts and the cache directory are up to each caller.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from atomic_write import write_atomic
+
+
+def fingerprint(**parts) -> str:
+    """Stable key for a set of request parts (order-independent, JSON-canonical)."""
+    canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, directory: Path, ttl_seconds: float | None = None,
+                 max_entries: int | None = None, refresh: bool = False):
+        self.dir = Path(directory)
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self.refresh = refresh
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "writes": 0, "evicted": 0}
+
+    def _path(self, key: str) -> Path:
+        return self.dir / f"{key}.json"
+
+    def _load(self, key: str) -> dict | None:
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def age(self, key: str) -> float | None:
+        """Seconds since `key` was stored, or None if it isn't cached. Doesn't count as a lookup."""
+        entry = self._load(key)
+        return None if entry is None else time.time() - entry.get("createdAt", 0)
+
+    def contains(self, key: str) -> bool:
+        """True if get(key) would hit."""
+        age = self.age(key)
+        return not self.refresh and age is not None and (self.ttl is None or age <= self.ttl)
+
+    def get(self, key: str):
+        """Cached value for `key`, or None on a miss (absent, expired or refresh)."""
+        entry = None if self.refresh else self._load(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if self.ttl is not None and time.time() - entry.get("createdAt", 0) > self.ttl:
+            self.stats["expired"] += 1
+            self.stats["misses"] += 1
+            return None
+        try:
+            os.utime(self._path(key))  # LRU clock
+        except FileNotFoundError:
+            pass  # Evicted by a concurrent put; the value is still good
+        self.stats["hits"] += 1
+        return entry["value"]
+
+    def put(self, key: str, value, meta: dict | None = None):
+        """Store a JSON-serializable value, then enforce max_entries."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"createdAt": time.time(), "meta": meta or {}, "value": value},
+                          ensure_ascii=False, indent=2)
+        write_atomic(self._path(key), data, mode=None)
+        self.stats["writes"] += 1
+        self.evict()
+
+    def put_blob(self, data: bytes, suffix: str = "") -> str:
+        """Store bytes under blobs/ by content hash; returns the blob name (list it in meta["blobs"])."""
+        name = hashlib.sha256(data).hexdigest() + suffix
+        path = self.blob_path(name)
+        if path.exists():
+            return name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, data, mode=None)
+        return name
+
+    def blob_path(self, name: str) -> Path:
+        return self.dir / "blobs" / name
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries beyond max_entries, then unreferenced blobs. Returns entries removed."""
+        if not self.max_entries:
+            return 0
+        entries = sorted(self.dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        removed = 0
+        for path in entries[self.max_entries:]:
+            path.unlink(missing_ok=True)
+            removed += 1
+        self.stats["evicted"] += removed
+        blobs_dir = self.dir / "blobs"
+        if removed and blobs_dir.is_dir():
+            kept = set()
+            for path in entries[:self.max_entries]:
+                entry = self._load(path.stem) or {}
+                kept.update(entry.get("meta", {}).get("blobs", []))
+            for blob in blobs_dir.iterdir():
+                if blob.name not in kept and not blob.name.startswith("."):
+                    blob.unlink(missing_ok=True)
+        return removed
+
+    def summary(self) -> str:
+        s = self.stats
+        total = s["hits"] + s["misses"]
+        rate = f" ({s['hits'] / total:.0%} hit rate)" if total else ""
+        return (f"{s['hits']} hit(s), {s['misses']} miss(es){rate}, "
+                f"{s['expired']} expired, {s['writes']} written, {s['evicted']} evicted")
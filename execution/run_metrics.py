@@ -0,0 +1,42 @@
+"""
+run_metrics.py — Per-run metrics shared by the pipeline stages.
+
+Each stage records a named section into .tmp/run_metrics.json:
+
+    {"runStartedAt": "...", "compression": {...}, "images": {...}}
+
+start_run() clears the file at the beginning of update_dtxent.main(), so the
+file always describes the most recent run. Stages run standalone (e.g.
+`python data_bundles.py`) simply merge their section into whatever is there.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+METRICS_FILE = Path(__file__).resolve().parent.parent / ".tmp" / "run_metrics.json"
+
+
+def load(path: Path | None = None) -> dict:
+    path = path or METRICS_FILE
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def start_run(path: Path | None = None):
+    """Reset the metrics file for a new run."""
+    path = path or METRICS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"runStartedAt": datetime.now().isoformat(timespec="seconds")}, indent=2) + "\n",
+                    encoding="utf-8")
+
+
+def record(section: str, data, path: Path | None = None):
+    """Set one section of the current run's metrics (METRICS_FILE is read at call time, so tests can patch it)."""
+    path = path or METRICS_FILE
+    metrics = load(path)
+    metrics[section] = data
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(metrics, indent=2) + "\n", encoding="utf-8")
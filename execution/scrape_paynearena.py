@@ -18,6 +18,8 @@ from pathlib import Path
 import requests
 from bs4 import BeautifulSoup
 
+from http_replay import install_from_env
+
 # ---------- Configuration ----------
 URL = "https://paynearena.com"
 OUTPUT_DIR = Path(__file__).resolve().parent.parent / ".tmp"
@@ -170,6 +172,7 @@ def main():
     print("Payne Arena Event Scraper (HTML)")
     print("=" * 60)
 
+    install_from_env()
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
     print(f"  Fetching {URL}...")
@@ -22,6 +22,8 @@ from pathlib import Path
 
 import requests
 
+from http_replay import install_from_env
+
 # ---------- Configuration ----------
 SCRIPT_DIR = Path(__file__).resolve().parent
 DTXENT_DIR = SCRIPT_DIR.parent
@@ -193,6 +195,8 @@ def main():
     print("Ticketmaster Event Scraper (Discovery API)")
     print("=" * 60)
 
+    install_from_env()
+
     # Load API key
     api_key = load_api_key()
     if not api_key:
@@ -18,6 +18,8 @@ from pathlib import Path
 
 import requests
 
+from http_replay import install_from_env
+
 # ---------- Configuration ----------
 API_BASE = "https://tixplug.com/wp-json/wp/v2"
 PRODUCTS_ENDPOINT = f"{API_BASE}/product"
@@ -328,6 +330,8 @@ def main():
     print("TixPlug Event Scraper (WP REST API)")
     print("=" * 60)
 
+    install_from_env()
+
     # Ensure output directory exists
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
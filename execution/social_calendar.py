@@ -0,0 +1,351 @@
+"""
+social_calendar.py — Plan and batch-generate a multi-week social posting calendar.
+
+Every published show in LOCAL_EVENTS gets up to three posts:
+
+    announcement   ANNOUNCE_DAYS before the show (or as soon as possible if that's past)
+    reminder       REMINDER_DAYS before the show
+    day-of         the morning of the show
+
+Slots are kept if they fall in the next N weeks. A slot is dropped if
+history.jsonl already has that post for the event. Any earlier daily post
+that featured the event counts as its announcement.
+
+The remaining caption jobs (slot × platform) and image jobs (one per event,
+shared by its slots) go through one worker queue. The queue uses a shared
+GeminiClient and ResponseCache, and a RateLimiter caps the call rate. Cache
+hits skip the limiter. The calendar manifest is rewritten after every job,
+so an interrupted or partly failed run can be finished with --resume. That
+re-runs the same plan, and only the jobs that didn't finish call Gemini.
+
+Outputs (.tmp/social_posts/calendar/):
+    <start>_calendar.json                 manifest: slots, captions per platform, images, failures
+    images/<event id>_image.png           promo image per event, plus platform derivatives
+
+Usage:
+    python execution/social_calendar.py                      # next 4 weeks, all platforms
+    python execution/social_calendar.py --weeks 6 --platform instagram twitter
+    python execution/social_calendar.py --plan-only          # print the schedule, no Gemini calls
+    python execution/social_calendar.py --resume             # finish the last calendar's failed jobs
+"""
+
+import argparse
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import generate_social_post as social
+from atomic_write import write_atomic
+from event_keys import event_id, parse_event_datetime
+from gemini_client import GeminiClient, RateLimiter
+from response_cache import ResponseCache
+
+# ---------- Configuration ----------
+CALENDAR_DIR = social.OUTPUT_DIR / "calendar"
+IMAGES_DIR = CALENDAR_DIR / "images"
+DEFAULT_WEEKS = 4
+ANNOUNCE_DAYS = 21
+REMINDER_DAYS = 3
+POST_HOURS = {"announcement": 10, "reminder": 12, "day-of": 9}  # Local time each kind goes out
+CONCURRENCY = 4
+RATE_LIMIT = 0.5            # Gemini calls started per second
+
+
+def plan_calendar(
+    events: list[dict],
+    weeks: int = DEFAULT_WEEKS,
+    history: list[dict] | None = None,
+    now: datetime | None = None,
+) -> tuple[list[dict], dict]:
+    """
+    Posting slots for the next `weeks` weeks, in posting order. Returns
+    (slots, stats); stats counts the slots skipped as already covered.
+    """
+    now = now or datetime.now()
+    horizon = now + timedelta(weeks=weeks)
+    covered = set()
+    for entry in history or []:
+        for eid in entry.get("events", []):
+            covered.add((eid, entry.get("kind", "announcement")))
+
+    slots, stats = [], {"events": 0, "slots": 0, "covered": 0}
+    for event in events:
+        show = parse_event_datetime(event.get("eventDate", ""))
+        if show is None or show < now:
+            continue
+        eid = event_id(event)
+        times = {
+            "announcement": show - timedelta(days=ANNOUNCE_DAYS),
+            "reminder": show - timedelta(days=REMINDER_DAYS),
+            "day-of": show,
+        }
+        times = {kind: when.replace(hour=POST_HOURS[kind], minute=0, second=0, microsecond=0)
+                 for kind, when in times.items()}
+        if times["announcement"] < now:
+            times["announcement"] = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+            if times["reminder"] >= now and times["announcement"] > times["reminder"] - timedelta(days=1):
+                del times["announcement"]  # Too close to the reminder: the reminder is the first post
+        planned = 0
+        for kind, when in times.items():
+            if when < now or when > horizon or when > show:
+                continue
+            if (eid, kind) in covered:
+                stats["covered"] += 1
+                continue
+            slots.append({"id": f"{eid}:{kind}", "kind": kind, "postAt": when.isoformat(timespec="minutes"),
+                          "eventId": eid, "event": event})
+            planned += 1
+        stats["events"] += bool(planned)
+    slots.sort(key=lambda s: (s["postAt"], s["id"]))
+    stats["slots"] = len(slots)
+    return slots, stats
+
+
+def _write_json(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, json.dumps(data, indent=2, ensure_ascii=False), mode=None)
+
+
+def _event_summary(event: dict) -> dict:
+    return {
+        "artist": event.get("artistName"),
+        "event": event.get("eventName"),
+        "date": event.get("eventDate"),
+        "venue": event.get("venueName"),
+        "ticket_url": event.get("ticketUrl"),
+    }
+
+
+def run_calendar(
+    slots: list[dict],
+    platforms: list[str],
+    manifest_path: Path,
+    client: GeminiClient | None = None,
+    cache: ResponseCache | None = None,
+    concurrency: int = CONCURRENCY,
+    rate_limit: float | None = RATE_LIMIT,
+    with_images: bool = True,
+    meta: dict | None = None,
+) -> dict:
+    """
+    Generate every caption and image for `slots` through one worker queue
+    and write the manifest to `manifest_path` as jobs finish. Captions and
+    images already in `cache` cost no call. A fallback caption (unparseable
+    response) counts as a failed job and isn't cached. Returns the manifest.
+    """
+    client = client or GeminiClient()
+    limiter = RateLimiter(rate_limit)
+    lock = threading.Lock()
+    results: dict[str, dict] = {}  # job id -> {"ok": bool, ...}
+
+    jobs = [
+        {"id": f"{slot['id']}:{platform}", "type": "caption", "slot": slot, "platform": platform,
+         "key": social.caption_key([slot["event"]], platform, slot["kind"])}
+        for slot in slots
+        for platform in platforms
+    ]
+    if with_images:
+        events = {slot["eventId"]: slot["event"] for slot in slots}
+        jobs += [
+            {"id": f"{eid}:image", "type": "image", "event": event, "eventId": eid,
+             "key": social.image_key([event])}
+            for eid, event in events.items()
+        ]
+
+    def run_job(job: dict) -> dict:
+        cached = cache.get(job["key"]) if cache else None
+        if job["type"] == "caption":
+            if cached is not None:
+                return {"ok": True, "post": cached, "cached": True}
+            limiter.wait()
+            slot = job["slot"]
+            post = social.generate_post_text([slot["event"]], job["platform"], client, angle=slot["kind"])
+            if post.get("fallback"):  # Raw model text, not a caption: leave it for --resume
+                return {"ok": False, "error": "unparseable caption response"}
+            if cache:
+                cache.put(job["key"], post, meta={"kind": "caption", "platform": job["platform"],
+                                                  "events": [slot["eventId"]], "angle": slot["kind"]})
+            return {"ok": True, "post": post, "cached": False}
+
+        if cached is not None and cache.blob_path(cached["blob"]).exists():
+            data, from_cache = cache.blob_path(cached["blob"]).read_bytes(), True
+        else:
+            limiter.wait()
+            data, from_cache = social.generate_promo_image([job["event"]], client), False
+            if not data:
+                return {"ok": False, "error": "no image returned"}
+            if cache:
+                blob = cache.put_blob(data, ".png")
+                cache.put(job["key"], {"blob": blob},
+                          meta={"kind": "image", "events": [job["eventId"]], "blobs": [blob]})
+        IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+        path = IMAGES_DIR / f"{job['eventId']}_image.png"
+        path.write_bytes(data)
+        return {"ok": True, "image": str(path), "cached": from_cache}
+
+    def manifest() -> dict:
+        with lock:
+            done = dict(results)
+        entries = []
+        for slot in slots:
+            posts = {p: done.get(f"{slot['id']}:{p}", {}).get("post") for p in platforms}
+            image = done.get(f"{slot['eventId']}:image", {})
+            wanted = [posts[p] is not None for p in platforms] + ([bool(image.get("ok"))] if with_images else [])
+            entries.append({
+                "id": slot["id"],
+                "kind": slot["kind"],
+                "postAt": slot["postAt"],
+                "eventId": slot["eventId"],
+                "event": _event_summary(slot["event"]),
+                "status": "done" if all(wanted) else "partial" if any(wanted) else "pending",
+                "posts": posts,
+                "image": image.get("image"),
+                "imageDerivatives": image.get("derivatives"),
+            })
+        return {
+            **(meta or {}),
+            "updatedAt": datetime.now().isoformat(),
+            "platforms": platforms,
+            "model": social.MODEL,
+            "jobs": len(jobs),
+            "completed": sum(1 for r in done.values() if r["ok"]),
+            "failed": sorted(jid for jid, r in done.items() if not r["ok"]),
+            "slots": entries,
+            # Resume state: the plan itself, so --resume re-runs the same slots
+            "plan": [{k: slot[k] for k in ("id", "kind", "postAt", "eventId", "event")} for slot in slots],
+            "cache": dict(cache.stats) if cache else None,
+            "gemini": client.metrics(),
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"ok": False, "error": str(e) or repr(e)}
+            if not result["ok"]:
+                print(f"   [WARN] {job['id']} failed: {result['error']}")
+            with lock:
+                results[job["id"]] = result
+            _write_json(manifest_path, manifest())
+
+    for jid, result in results.items():
+        if result["ok"] and result.get("image"):  # Each build already uses a process pool
+            image = Path(result["image"])
+            try:
+                social.build_derivatives(image)
+            except Exception as e:
+                print(f"   [WARN] Derivatives for {jid} failed: {e}")
+            else:
+                result["derivatives"] = str(image.with_name(image.stem.removesuffix("_image") + "_images.json"))
+
+    final = manifest()
+    _write_json(manifest_path, final)
+    return final
+
+
+def record_history(manifest: dict, path: Path = social.HISTORY_PATH) -> int:
+    """
+    Log each generated calendar post in history.jsonl so later plans skip it.
+    Posts already logged (a resumed calendar) aren't logged twice. Returns
+    the number of lines added.
+    """
+    logged = {(e.get("captionKey"), e["post"].get("caption")) for e in social.load_history(path)}
+    entries = []
+    for plan, slot in zip(manifest["plan"], manifest["slots"]):
+        for platform, post in slot["posts"].items():
+            key = social.caption_key([plan["event"]], platform, slot["kind"])
+            if post is None or (key, post.get("caption")) in logged:
+                continue
+            entries.append({
+                "generatedAt": manifest["updatedAt"],
+                "platform": platform,
+                "kind": slot["kind"],
+                "postAt": slot["postAt"],
+                "events": [slot["eventId"]],
+                "captionKey": key,
+                "post": post,
+            })
+    social.append_history(entries, path)
+    return len(entries)
+
+
+def latest_manifest() -> Path | None:
+    manifests = sorted(CALENDAR_DIR.glob("*_calendar.json"))
+    return manifests[-1] if manifests else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan and generate a multi-week DTXENT social calendar.")
+    parser.add_argument("--weeks", type=int, default=DEFAULT_WEEKS,
+                        help=f"Plan N weeks ahead (default: {DEFAULT_WEEKS})")
+    parser.add_argument("--platform", type=str, nargs="+", default=["all"],
+                        choices=list(social.PLATFORM_LIMITS.keys()) + ["all"],
+                        help=f"Platforms; 'all' = {', '.join(social.MULTI_PLATFORMS)} (default: all)")
+    parser.add_argument("--plan-only", action="store_true", help="Print the schedule without generating")
+    parser.add_argument("--resume", action="store_true",
+                        help="Re-run the latest calendar's plan; finished jobs come from the cache")
+    parser.add_argument("--no-images", action="store_true", help="Captions only")
+    parser.add_argument("--regenerate", action="store_true", help="Ignore cached captions/images")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY,
+                        help=f"Parallel Gemini calls (default: {CONCURRENCY})")
+    parser.add_argument("--rate-limit", type=float, default=RATE_LIMIT,
+                        help=f"Gemini calls started per second (default: {RATE_LIMIT})")
+    parser.add_argument("--timeout", type=float, default=social.CALL_TIMEOUT,
+                        help=f"Seconds to wait for each Gemini call (default: {social.CALL_TIMEOUT})")
+    args = parser.parse_args()
+
+    if args.resume:
+        manifest_path = latest_manifest()
+        if manifest_path is None:
+            print("❌ No calendar to resume.")
+            sys.exit(1)
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        slots, platforms = previous["plan"], previous["platforms"]
+        meta = {k: previous[k] for k in ("startedAt", "weeks") if k in previous}
+        print(f"♻️  Resuming {manifest_path.name}: {len(previous['failed'])} failed, "
+              f"{previous['completed']}/{previous['jobs']} job(s) done")
+    else:
+        platforms = social.MULTI_PLATFORMS if "all" in args.platform else list(dict.fromkeys(args.platform))
+        events = social.load_upcoming_events(days_ahead=args.weeks * 7 + ANNOUNCE_DAYS)
+        slots, stats = plan_calendar(events, args.weeks, social.load_history())
+        started = datetime.now()
+        manifest_path = CALENDAR_DIR / f"{started.strftime('%Y-%m-%d')}_calendar.json"
+        meta = {"startedAt": started.isoformat(), "weeks": args.weeks}
+        print(f"📅 {stats['slots']} post(s) for {stats['events']} event(s) over {args.weeks} week(s) "
+              f"({stats['covered']} already covered)")
+
+    for slot in slots:
+        event = slot["event"]
+        print(f"   {slot['postAt']}  {slot['kind']:<12} {event.get('artistName', 'TBA')} @ {event.get('venueName', 'TBA')}")
+    if args.plan_only or not slots:
+        return
+
+    print(f"\n✍️  Generating {len(slots) * len(platforms)} caption(s)"
+          f"{'' if args.no_images else ' and promo images'} (concurrency {args.concurrency}, "
+          f"{args.rate_limit} call(s)/s)...")
+    client = GeminiClient(timeout=args.timeout)
+    cache = ResponseCache(social.CACHE_DIR, refresh=args.regenerate)
+    manifest = run_calendar(slots, platforms, manifest_path, client=client, cache=cache,
+                            concurrency=args.concurrency, rate_limit=args.rate_limit,
+                            with_images=not args.no_images, meta=meta)
+    record_history(manifest)
+
+    done = sum(1 for s in manifest["slots"] if s["status"] == "done")
+    print(f"\n💾 Calendar saved: {manifest_path}")
+    print(f"   {done}/{len(manifest['slots'])} post(s) complete, {len(manifest['failed'])} failed job(s)")
+    print(f"   Cache: {cache.summary()}")
+    print(f"   Gemini: {client.summary()}")
+    if manifest["failed"]:
+        print("   Re-run with --resume to retry the failed jobs.")
+        sys.exit(1)
+    print("✅ Done!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+social_images.py — Platform crops and sizes for a generated promo image.
+
+The promo image comes out of Gemini as one (usually square) PNG. Each
+platform wants its own shape:
+
+    instagram  square 1080x1080, portrait 1080x1350
+    twitter    landscape 1600x900
+    story      1080x1920 (Instagram / Facebook stories)
+    facebook   feed 1200x630
+
+Every rendition is cropped around the subject: the focus point is the
+centroid of edge energy on a small thumbnail (text and faces are busy,
+flat backgrounds aren't), computed once per source. A crop that would keep
+less than MIN_KEEP of the source (a square into a story) is letterboxed over
+a blurred fill of the same image instead.
+
+Each rendition is encoded as JPEG and WebP at the highest quality that fits
+MAX_BYTES. Renditions are rendered in a process pool, and the results are
+listed in <date>_images.json next to the post JSON:
+
+    {"source": "2026-10-19_image.png", "focus": [0.48, 0.41], "files": [
+        {"platform": "twitter", "name": "landscape", "file": "2026-10-19_twitter_landscape.jpg",
+         "width": 1600, "height": 900, "format": "JPEG", "quality": 88, "bytes": 183211, "mode": "crop"}, ...]}
+
+Usage:
+    python social_images.py .tmp/social_posts/2026-10-19_image.png
+"""
+
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# ---------- Configuration ----------
+# (platform, name, width, height)
+RENDITIONS = [
+    ("instagram", "square", 1080, 1080),
+    ("instagram", "portrait", 1080, 1350),
+    ("twitter", "landscape", 1600, 900),
+    ("story", "vertical", 1080, 1920),
+    ("facebook", "feed", 1200, 630),
+]
+FORMATS = {"JPEG": ".jpg", "WEBP": ".webp"}
+MAX_BYTES = 1_000_000       # Well under every platform's upload limit
+MAX_QUALITY = 90
+MIN_QUALITY = 50
+MIN_KEEP = 0.6              # Smallest share of the source a crop may keep before letterboxing
+FOCUS_THUMB = 64            # Thumbnail edge for the focus point
+
+
+def find_focus(img) -> tuple[float, float]:
+    """Subject position as (x, y) fractions: the centroid of edge energy on a thumbnail."""
+    from PIL import ImageFilter
+
+    thumb = img.convert("L")
+    thumb.thumbnail((FOCUS_THUMB, FOCUS_THUMB))
+    edges = thumb.filter(ImageFilter.FIND_EDGES)
+    width, height = edges.size
+    total = sx = sy = 0
+    for i, value in enumerate(edges.tobytes()):  # One byte per pixel in "L" mode
+        x, y = i % width, i // width
+        if x in (0, width - 1) or y in (0, height - 1):
+            continue  # FIND_EDGES lights up the frame border
+        weight = value * value  # Favor strong detail over texture
+        total += weight
+        sx += weight * x
+        sy += weight * y
+    if not total:
+        return 0.5, 0.5
+    return round((sx / total + 0.5) / width, 3), round((sy / total + 0.5) / height, 3)
+
+
+def crop_box(size: tuple[int, int], target: tuple[int, int], focus: tuple[float, float]) -> tuple[int, int, int, int]:
+    """Largest box with the target's aspect ratio, centered on `focus` and clamped to the image."""
+    width, height = size
+    aspect = target[0] / target[1]
+    crop_w, crop_h = (round(height * aspect), height) if width / height > aspect else (width, round(width / aspect))
+    left = min(max(round(focus[0] * width - crop_w / 2), 0), width - crop_w)
+    top = min(max(round(focus[1] * height - crop_h / 2), 0), height - crop_h)
+    return left, top, left + crop_w, top + crop_h
+
+
+def fit(img, target: tuple[int, int], focus: tuple[float, float]):
+    """Resize `img` to exactly `target`: crop around the focus, or letterbox a crop that would lose too much."""
+    from PIL import Image, ImageEnhance, ImageFilter
+
+    box = crop_box(img.size, target, focus)
+    kept = (box[2] - box[0]) * (box[3] - box[1]) / (img.size[0] * img.size[1])
+    if kept >= MIN_KEEP:
+        return img.resize(target, Image.LANCZOS, box=box, reducing_gap=2.0), "crop"
+
+    background = img.resize(target, Image.BILINEAR, box=box, reducing_gap=2.0)
+    background = ImageEnhance.Brightness(background.filter(ImageFilter.GaussianBlur(40))).enhance(0.6)
+    scale = min(target[0] / img.size[0], target[1] / img.size[1])
+    inner = img.resize((round(img.size[0] * scale), round(img.size[1] * scale)), Image.LANCZOS, reducing_gap=2.0)
+    background.paste(inner, ((target[0] - inner.size[0]) // 2, (target[1] - inner.size[1]) // 2))
+    return background, "pad"
+
+
+def encode_capped(img, fmt: str, max_bytes: int = MAX_BYTES) -> tuple[bytes, int]:
+    """(data, quality) at the highest quality that fits max_bytes; MIN_QUALITY if nothing does."""
+    def encode(quality: int) -> bytes:
+        out = io.BytesIO()
+        options = {"optimize": True, "progressive": True} if fmt == "JPEG" else {"method": 4}
+        img.save(out, fmt, quality=quality, **options)
+        return out.getvalue()
+
+    data = encode(MAX_QUALITY)
+    if len(data) <= max_bytes:
+        return data, MAX_QUALITY
+    low, high = MIN_QUALITY, MAX_QUALITY - 1
+    best = None
+    while low <= high:  # Binary search: the size grows with quality
+        quality = (low + high) // 2
+        data = encode(quality)
+        if len(data) <= max_bytes:
+            best = (data, quality)
+            low = quality + 1
+        else:
+            high = quality - 1
+    return best or (encode(MIN_QUALITY), MIN_QUALITY)
+
+
+def render(job: dict) -> list[dict]:
+    """Render one rendition in every format. Runs in a worker process, so it takes and returns plain data."""
+    from PIL import Image
+
+    with Image.open(job["source"]) as source:
+        img, mode = fit(source.convert("RGB"), (job["width"], job["height"]), tuple(job["focus"]))
+    files = []
+    for fmt, suffix in FORMATS.items():
+        data, quality = encode_capped(img, fmt, job["max_bytes"])
+        path = Path(job["out_dir"]) / f"{job['stem']}_{job['platform']}_{job['name']}{suffix}"
+        path.write_bytes(data)
+        files.append({
+            "platform": job["platform"], "name": job["name"], "file": path.name,
+            "width": job["width"], "height": job["height"], "format": fmt,
+            "quality": quality, "bytes": len(data), "mode": mode,
+            "overCap": len(data) > job["max_bytes"],
+        })
+    return files
+
+
+def build_derivatives(
+    image_path: Path,
+    renditions: list[tuple] = RENDITIONS,
+    max_bytes: int = MAX_BYTES,
+    workers: int | None = None,
+) -> dict:
+    """
+    Render every rendition of `image_path` next to it and write the
+    <date>_images.json manifest. `workers=1` renders in-process.
+    Returns the manifest.
+    """
+    from PIL import Image
+
+    image_path = Path(image_path)
+    stem = image_path.stem.removesuffix("_image")
+    with Image.open(image_path) as img:
+        focus = find_focus(img)
+    jobs = [
+        {"source": str(image_path), "out_dir": str(image_path.parent), "stem": stem, "platform": platform,
+         "name": name, "width": width, "height": height, "focus": focus, "max_bytes": max_bytes}
+        for platform, name, width, height in renditions
+    ]
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(render, jobs))
+    else:
+        results = [render(job) for job in jobs]
+
+    manifest = {
+        "source": image_path.name,
+        "focus": list(focus),
+        "maxBytes": max_bytes,
+        "files": [f for files in results for f in files],
+    }
+    manifest_path = image_path.parent / f"{stem}_images.json"
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+    manifest = build_derivatives(Path(sys.argv[1]))
+    for f in manifest["files"]:
+        flag = "  [WARN] over cap" if f["overCap"] else ""
+        print(f"  {f['file']:<45} {f['width']}x{f['height']} q{f['quality']} {f['bytes'] / 1024:.0f} KB ({f['mode']}){flag}")
+    print(f"[OK] {len(manifest['files'])} file(s), focus at {manifest['focus']}")
@@ -0,0 +1,278 @@
+"""
+sources.py — Event source registry and concurrent collector for update_dtxent.
+
+Each source implements an async fetch() that yields events as they are
+scraped, and declares its rate limit and cache policy in sources.json:
+
+    {"sources": [
+        {"name": "tixplug", "type": "tixplug", "url": "https://tixplug.com",
+         "rateLimit": 5, "concurrency": 4, "cacheTtlMinutes": 0, "timeout": 120},
+        ...
+    ]}
+
+    type             registered Source class (see SOURCE_TYPES)
+    rateLimit        max HTTP requests per second the source may issue
+    concurrency      parallel requests within the source (default 1)
+    cacheTtlMinutes  reuse .tmp/<name>_events.json if younger than this (0 = always fetch)
+    timeout          seconds before the source is abandoned
+    enabled          false to keep an entry in the file without running it
+
+collect() runs every enabled source concurrently. Events stream into
+per-source buckets as they arrive; the merged list keeps config order so the
+manual file still takes precedence in deduplicate_events. Each source's
+events are also written to .tmp/<name>_events.json as before.
+
+Deduplication deliberately waits for every source. The manual file must win
+over a scraper however late it arrives. Empty-venue rows merge with their
+venue-bearing twin, and multi-date runs are grouped across sources. So an
+event that arrives early can't be final until the others are in.
+
+Adding a venue feed is a new config entry (e.g. another Ticketmaster venue);
+adding a new kind of site is one Source subclass registered below.
+
+Usage:
+    python sources.py                 # run all sources, print counts
+    python sources.py tixplug manual  # run a subset
+"""
+
+import abc
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+# ---------- Configuration ----------
+SCRIPT_DIR = Path(__file__).resolve().parent
+DTXENT_DIR = SCRIPT_DIR.parent
+TMP_DIR = DTXENT_DIR / ".tmp"
+CONFIG_FILE = SCRIPT_DIR / "sources.json"
+DEFAULT_TIMEOUT = 120
+
+
+class SourceUnavailable(Exception):
+    """The source can't run in this environment (e.g. missing API key)."""
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across all of a source's tasks."""
+
+    def __init__(self, rate: float | None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class Source(abc.ABC):
+    """Base class: subclasses implement fetch() and register with @register."""
+
+    type = ""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.name = config["name"]
+        self.url = config.get("url", "")
+        self.concurrency = config.get("concurrency", 1)
+        self.cache_ttl = config.get("cacheTtlMinutes", 0) * 60
+        self.timeout = config.get("timeout", DEFAULT_TIMEOUT)
+        self.limiter = RateLimiter(config.get("rateLimit"))
+
+    @property
+    def output_file(self) -> Path:
+        return TMP_DIR / f"{self.name}_events.json"
+
+    async def call(self, func, *args):
+        """Run a blocking (requests-based) scraper function under the rate limit."""
+        await self.limiter.wait()
+        return await asyncio.to_thread(func, *args)
+
+    @abc.abstractmethod
+    def fetch(self) -> AsyncIterator[dict]:
+        """Async generator: yield events as they are scraped. Raise SourceUnavailable to skip the source."""
+
+
+SOURCE_TYPES: dict[str, type[Source]] = {}
+
+
+def register(cls: type[Source]) -> type[Source]:
+    SOURCE_TYPES[cls.type] = cls
+    return cls
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+@register
+class ManualSource(Source):
+    """Manually curated events (execution/manual_events.json)."""
+
+    type = "manual"
+
+    async def fetch(self):
+        path = SCRIPT_DIR / self.config.get("file", "manual_events.json")
+        if not path.exists():
+            raise SourceUnavailable(f"{path.name} not found")
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        # Strip comment entries and unpublished events
+        for e in raw:
+            if not e.get("_comment") and e.get("isPublished", True):
+                yield {**e, "source": e.get("source", "manual")}
+
+
+@register
+class PayneArenaSource(Source):
+    """paynearena.com homepage (Squarespace HTML)."""
+
+    type = "paynearena"
+
+    async def fetch(self):
+        import scrape_paynearena
+
+        html = await self.call(scrape_paynearena.fetch_page, self.url or scrape_paynearena.URL)
+        for event in scrape_paynearena.parse_events(html):
+            yield event
+
+
+@register
+class TixPlugSource(Source):
+    """tixplug.com WooCommerce products (WP REST API); one media call per product."""
+
+    type = "tixplug"
+
+    async def fetch(self):
+        import scrape_tixplug
+
+        products = await self.call(scrape_tixplug.fetch_all_products)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def process(product):
+            async with semaphore:
+                return await self.call(scrape_tixplug.process_product, product)
+
+        for next_event in asyncio.as_completed([process(p) for p in products]):
+            event = await next_event
+            if event:
+                yield event
+
+
+@register
+class TicketmasterSource(Source):
+    """Ticketmaster Discovery API, one venue id per configured venue."""
+
+    type = "ticketmaster"
+
+    async def fetch(self):
+        import scrape_ticketmaster
+
+        api_key = scrape_ticketmaster.load_api_key()
+        if not api_key:
+            raise SourceUnavailable("TM_API_KEY not set")
+        venues = self.config.get("venues") or scrape_ticketmaster.VENUES
+        for next_batch in asyncio.as_completed(
+            [self.call(scrape_ticketmaster.fetch_venue_events, venue, api_key) for venue in venues]
+        ):
+            for event in await next_batch:
+                yield event
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+def load_config(path: Path = CONFIG_FILE) -> list[dict]:
+    """Enabled source entries, in config order."""
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)["sources"]
+    return [entry for entry in entries if entry.get("enabled", True)]
+
+
+def build_sources(entries: list[dict]) -> list[Source]:
+    sources = []
+    for entry in entries:
+        cls = SOURCE_TYPES.get(entry.get("type", entry["name"]))
+        if cls is None:
+            raise ValueError(f"Unknown source type for {entry['name']!r}: {entry.get('type')}")
+        sources.append(cls(entry))
+    return sources
+
+
+def _status(source: Source, count: int, status: str, error: str | None = None) -> dict:
+    return {"name": source.name, "url": source.url, "eventsFound": count, "status": status, "errorMessage": error}
+
+
+def _cached(source: Source) -> list[dict] | None:
+    path = source.output_file
+    if not source.cache_ttl or not path.exists() or time.time() - path.stat().st_mtime > source.cache_ttl:
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def _run(source: Source, bucket: list[dict]) -> dict:
+    cached = _cached(source)
+    if cached is not None:
+        bucket.extend(cached)
+        print(f"  [{source.name}] {len(cached)} events (cached {source.output_file.name})")
+        return _status(source, len(cached), "cached")
+
+    async def drain():
+        async for event in source.fetch():
+            bucket.append(event)
+
+    try:
+        await asyncio.wait_for(drain(), timeout=source.timeout)
+    except SourceUnavailable as e:
+        print(f"  [{source.name}] [INFO] skipped: {e}")
+        bucket.clear()  # A skipped source contributes nothing, even if it yielded first
+        return _status(source, 0, "skipped", str(e))
+    except Exception as e:
+        print(f"  [{source.name}] [WARN] failed: {e!r}")
+        bucket.clear()
+        return _status(source, 0, "error", str(e) or repr(e))
+
+    if source.type != "manual":
+        # Arrival order depends on network timing; sort so runs are reproducible.
+        # Undated (TBA) events go last, as the standalone scrapers listed them.
+        bucket.sort(key=lambda e: (not e.get("eventDate"),
+                                   *(e.get(f) or "" for f in ("eventDate", "artistName", "venueName", "ticketUrl"))))
+        TMP_DIR.mkdir(parents=True, exist_ok=True)
+        with open(source.output_file, "w", encoding="utf-8") as f:
+            json.dump(bucket, f, indent=2, ensure_ascii=False)
+    print(f"  [{source.name}] {len(bucket)} events")
+    return _status(source, len(bucket), "success")
+
+
+async def collect(sources: list[Source]) -> tuple[list[dict], list[dict]]:
+    """Run all sources concurrently. Returns (events in config order, per-source status)."""
+    buckets = [[] for _ in sources]
+    statuses = await asyncio.gather(*(_run(source, bucket) for source, bucket in zip(sources, buckets)))
+    return [event for bucket in buckets for event in bucket], list(statuses)
+
+
+def collect_events(names: list[str] | None = None, config: Path = CONFIG_FILE) -> tuple[list[dict], list[dict]]:
+    """Synchronous entry point: configured sources (optionally only `names`)."""
+    entries = [e for e in load_config(config) if not names or e["name"] in names]
+    return asyncio.run(collect(build_sources(entries)))
+
+
+if __name__ == "__main__":
+    from http_replay import install_from_env
+
+    install_from_env()
+    events, statuses = collect_events(sys.argv[1:] or None)
+    for status in statuses:
+        print(f"{status['name']:>14}: {status['status']:<8} {status['eventsFound']} events")
+    print(f"[OK] {len(events)} events total")
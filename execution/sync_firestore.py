@@ -15,6 +15,10 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+from event_feeds import publish_feeds
+from event_keys import lookup_keys, related_ids
+from firestore_client import MAX_BATCH_SIZE, SERVER_TIMESTAMP, configured_client
+
 # Load environment variables
 REPO_ROOT = Path(__file__).resolve().parent.parent  # dtxent/
 WORKSPACE_ROOT = REPO_ROOT.parent
@@ -33,6 +37,13 @@ def init_firebase():
     if _initialized:
         return _db
 
+    # Fake / emulator / injected client (offline runs and load tests)
+    override = configured_client()
+    if override is not None:
+        _db = override
+        _initialized = True
+        return _db
+
     try:
         import firebase_admin
         from firebase_admin import credentials, firestore
@@ -99,23 +110,30 @@ def sync_events_to_firestore(events: list[dict]) -> dict:
     Args:
         events: List of event dictionaries from scraping
 
+    Each document also carries the lookup keys eventPageSSR resolves pages
+    by (slug, artistSlug, venueSlug, dateKey), precomputed relatedByArtist /
+    relatedByVenue id lists, and a slugs/{slug} pointer document. When an
+    event's slug changes, its previous pointer is deleted.
+
     Returns:
         dict with counts: {'created': N, 'updated': N, 'unchanged': N}
     """
-    from firebase_admin import firestore
-
     db = init_firebase()
     events_ref = db.collection("events")
+    slugs_ref = db.collection("slugs")
 
     stats = {"created": 0, "updated": 0, "unchanged": 0, "errors": 0}
 
+    doc_ids = [generate_event_id(event) for event in events]
+    related = related_ids(events, doc_ids)
+    current_slugs = {lookup_keys(event).get("slug") for event in events}
+
     # Process in batches of 500 (Firestore limit)
     batch = db.batch()
     batch_count = 0
 
-    for event in events:
+    for event, doc_id, related_lists in zip(events, doc_ids, related):
         try:
-            doc_id = generate_event_id(event)
             doc_ref = events_ref.document(doc_id)
 
             # Check if document exists
@@ -133,7 +151,7 @@ def sync_events_to_firestore(events: list[dict]) -> dict:
                 "isPublished": True,
                 "isClosed": False,
                 "source": event.get("source", "unknown"),
-                "updatedAt": firestore.SERVER_TIMESTAMP,
+                "updatedAt": SERVER_TIMESTAMP,
             }
 
             # Handle image - prefer imageName for local assets
@@ -156,23 +174,40 @@ def sync_events_to_firestore(events: list[dict]) -> dict:
                     for d in event["dates"]
                 ]
 
+            # Denormalized page lookup keys
+            keys = lookup_keys(event)
+            event_data.update(keys)
+            event_data.update(related_lists)
+
+            # Commit before this event's writes would overflow the batch
+            previous_slug = (existing.to_dict() or {}).get("slug") if existing.exists else None
+            new_pointer = bool(keys) and previous_slug != keys["slug"]
+            stale_pointer = new_pointer and bool(previous_slug) and previous_slug not in current_slugs
+
+            if batch_count + 1 + new_pointer + stale_pointer > MAX_BATCH_SIZE:
+                batch.commit()
+                batch = db.batch()
+                batch_count = 0
+
             if existing.exists:
                 # Update existing document
                 batch.update(doc_ref, event_data)
                 stats["updated"] += 1
             else:
                 # Create new document
-                event_data["createdAt"] = firestore.SERVER_TIMESTAMP
+                event_data["createdAt"] = SERVER_TIMESTAMP
                 batch.set(doc_ref, event_data)
                 stats["created"] += 1
-
             batch_count += 1
 
-            # Commit batch at 500 operations
-            if batch_count >= 500:
-                batch.commit()
-                batch = db.batch()
-                batch_count = 0
+            # Pointer doc only needs writing when the slug is new for this event;
+            # a replaced slug's pointer goes unless another event now has that slug
+            if new_pointer:
+                batch.set(slugs_ref.document(keys["slug"]), {"eventId": doc_id, "updatedAt": SERVER_TIMESTAMP})
+                batch_count += 1
+                if stale_pointer:
+                    batch.delete(slugs_ref.document(previous_slug))
+                    batch_count += 1
 
         except Exception as e:
             print(f"    [WARN] Error syncing {event.get('artistName', 'unknown')}: {e}")
@@ -186,6 +221,19 @@ def sync_events_to_firestore(events: list[dict]) -> dict:
     return stats
 
 
+def publish_event_feeds(events: list[dict]) -> dict:
+    """
+    Publish the feeds/* read-model documents for the public events grid.
+
+    Returns:
+        dict with counts: {'written': N, 'unchanged': N, 'deleted': N}
+    """
+    db = init_firebase()
+    stats = publish_feeds(db, events, [generate_event_id(event) for event in events])
+    print(f"    Feeds written: {stats['written']}, Unchanged: {stats['unchanged']}, Deleted: {stats['deleted']}")
+    return stats
+
+
 def mark_closed_events() -> int:
     """
     Mark past events as isClosed=true.
@@ -195,8 +243,6 @@ def mark_closed_events() -> int:
     Returns:
         Number of events marked as closed
     """
-    from firebase_admin import firestore
-
     db = init_firebase()
     events_ref = db.collection("events")
 
@@ -217,7 +263,7 @@ def mark_closed_events() -> int:
         if not data.get("isClosed", False):
             batch.update(doc.reference, {
                 "isClosed": True,
-                "updatedAt": firestore.SERVER_TIMESTAMP
+                "updatedAt": SERVER_TIMESTAMP
             })
             count += 1
 
@@ -238,8 +284,6 @@ def mark_closed_events() -> int:
 
 def parse_event_date(date_str: str):
     """Parse event date string to Firestore Timestamp."""
-    from firebase_admin import firestore
-
     if not date_str:
         return None
 
@@ -287,8 +331,6 @@ def write_scrape_log(
     Returns:
         The Firestore document ID of the log entry
     """
-    from firebase_admin import firestore
-
     db = init_firebase()
     logs_ref = db.collection("scrape_logs")
 
@@ -311,7 +353,7 @@ def write_scrape_log(
 
     log_entry = {
         "runId": f"run_{datetime.now().strftime('%Y-%m-%dT%H:%M:%S')}",
-        "scrapedAt": firestore.SERVER_TIMESTAMP,
+        "scrapedAt": SERVER_TIMESTAMP,
         "sources": sources_status,
         "events": event_entries,
         "summary": {
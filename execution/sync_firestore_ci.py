@@ -5,28 +5,44 @@ Reads LOCAL_EVENTS from js/events-data.js and upserts them to Firestore.
 Expects GOOGLE_APPLICATION_CREDENTIALS to point to the service account JSON file.
 """
 
-import json
 import os
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from event_feeds import publish_feeds
+from event_keys import lookup_keys, related_ids
+from firestore_client import MAX_BATCH_SIZE, SERVER_TIMESTAMP, configured_client
+from js_parser import extract_js_array, find_js_array_span
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 EVENTS_JS = REPO_ROOT / "js" / "events-data.js"
 
 
 def load_events_from_js() -> list[dict]:
-    """Extract LOCAL_EVENTS array from js/events-data.js using regex."""
+    """
+    Extract LOCAL_EVENTS array from js/events-data.js.
+
+    Raises ValueError if the array is missing, fails to parse or is empty:
+    extract_js_array() returns [] on a parse error, and syncing that would
+    publish empty feeds over the live ones.
+    """
     content = EVENTS_JS.read_text(encoding="utf-8")
-    match = re.search(r"export const LOCAL_EVENTS = (\[.*?\]);", content, re.DOTALL)
-    if not match:
+    if find_js_array_span(content, "LOCAL_EVENTS") is None:
         raise ValueError("Could not find LOCAL_EVENTS in events-data.js")
-    return json.loads(match.group(1))
+    events = extract_js_array(content, "LOCAL_EVENTS")
+    if not events:
+        raise ValueError("LOCAL_EVENTS in events-data.js is empty or failed to parse")
+    return events
 
 
 def init_firebase():
     """Initialize Firebase Admin SDK via GOOGLE_APPLICATION_CREDENTIALS."""
+    override = configured_client()
+    if override is not None:
+        return override
+
     import firebase_admin
     from firebase_admin import credentials, firestore
 
@@ -68,16 +84,17 @@ def parse_date(date_str: str):
 
 
 def sync(events: list[dict], db) -> dict:
-    from firebase_admin import firestore as fs
-
     collection = db.collection("events")
+    slugs = db.collection("slugs")
     stats = {"created": 0, "updated": 0, "errors": 0}
+    doc_ids = [generate_doc_id(event) for event in events]
+    related = related_ids(events, doc_ids)
+    current_slugs = {lookup_keys(event).get("slug") for event in events}
     batch = db.batch()
     count = 0
 
-    for event in events:
+    for event, doc_id, related_lists in zip(events, doc_ids, related):
         try:
-            doc_id = generate_doc_id(event)
             ref = collection.document(doc_id)
             existing = ref.get()
 
@@ -92,7 +109,7 @@ def sync(events: list[dict], db) -> dict:
                 "isPublished": True,
                 "isClosed": False,
                 "source": event.get("source", "unknown"),
-                "updatedAt": fs.SERVER_TIMESTAMP,
+                "updatedAt": SERVER_TIMESTAMP,
             }
 
             if event.get("imageName"):
@@ -109,19 +126,34 @@ def sync(events: list[dict], db) -> dict:
                     for d in event["dates"]
                 ]
 
+            keys = lookup_keys(event)
+            data.update(keys)
+            data.update(related_lists)
+
+            previous_slug = (existing.to_dict() or {}).get("slug") if existing.exists else None
+            new_pointer = bool(keys) and previous_slug != keys["slug"]
+            stale_pointer = new_pointer and bool(previous_slug) and previous_slug not in current_slugs
+
+            if count + 1 + new_pointer + stale_pointer > MAX_BATCH_SIZE:
+                batch.commit()
+                batch = db.batch()
+                count = 0
+
             if existing.exists:
                 batch.update(ref, data)
                 stats["updated"] += 1
             else:
-                data["createdAt"] = fs.SERVER_TIMESTAMP
+                data["createdAt"] = SERVER_TIMESTAMP
                 batch.set(ref, data)
                 stats["created"] += 1
-
             count += 1
-            if count >= 500:
-                batch.commit()
-                batch = db.batch()
-                count = 0
+
+            if new_pointer:
+                batch.set(slugs.document(keys["slug"]), {"eventId": doc_id, "updatedAt": SERVER_TIMESTAMP})
+                count += 1
+                if stale_pointer:
+                    batch.delete(slugs.document(previous_slug))
+                    count += 1
 
         except Exception as e:
             print(f"  [WARN] Error on {event.get('artistName')}: {e}")
@@ -145,6 +177,10 @@ def main():
     stats = sync(events, db)
     print(f"  Created: {stats['created']}, Updated: {stats['updated']}, Errors: {stats['errors']}")
 
+    print("Publishing read-model feeds...")
+    feed_stats = publish_feeds(db, events, [generate_doc_id(e) for e in events])
+    print(f"  Written: {feed_stats['written']}, Unchanged: {feed_stats['unchanged']}, Deleted: {feed_stats['deleted']}")
+
     if stats["errors"] > 0:
         sys.exit(1)
 
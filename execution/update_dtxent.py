@@ -1,14 +1,17 @@
 """
-1. Runs scrape_tixplug.py to fetch events from tixplug.com
-2. Runs scrape_paynearena.py to fetch events from paynearena.com
-3. Merges, deduplicates, and sorts events
-4. Downloads event poster images to assets/
-5. Regenerates js/events-data.js with the LOCAL_EVENTS array
-6. Syncs events to Firestore (for admin dashboard functionality)
-7. Commits and pushes changes to GitHub
+1. Collects events from every source in sources.json (manual file, TixPlug,
+   Payne Arena, Ticketmaster) concurrently — see sources.py
+2. Merges, deduplicates, and sorts events; records raw rows, merged events
+   and the run snapshot in the SQLite store (.tmp/dtxent.db)
+3. Downloads event poster images to assets/posters/
+4. Regenerates js/events-data.js with the LOCAL_EVENTS array and the
+   nearest vendors per venue (VENUE_VENDORS, venue_vendors.py), the
+   content-hashed bundles in js/data/ and the static event pages
+   (events/*.html, events.html, sitemap-events.xml)
+5. Syncs events to Firestore (for admin dashboard functionality)
+6. Commits and pushes changes to GitHub
 """
 
-import json
 import re
 import subprocess
 import sys
@@ -16,7 +19,18 @@ from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 
-import requests
+import event_changes
+import event_store
+import git_publish
+import image_fetch
+import run_metrics
+import sources
+import venue_vendors
+from data_bundles import build_bundles
+from http_replay import install_from_env
+from js_parser import write_js_arrays
+from poster_store import PosterStore, poster_name
+from prerender_events import prerender
 
 # ---------- Configuration ----------
 DTXENT_DIR = Path(__file__).resolve().parent.parent  # dtxent-site/
@@ -32,120 +46,9 @@ EXCLUDE_ARTISTS = [
 ]
 
 
-def run_scraper(scraper_name: str, output_filename: str, source_url: str) -> tuple[list[dict], dict]:
-    """Run a scraper script and load its output JSON."""
-    scraper = Path(__file__).resolve().parent / scraper_name
-    try:
-        result = subprocess.run(
-            [sys.executable, str(scraper)],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-        if result.returncode != 0:
-            raise RuntimeError(result.stderr or "non-zero exit")
-        print(result.stdout.rstrip())
-    except Exception as e:
-        print(f"  [WARN] {scraper_name} failed: {e}")
-        return [], {
-            "name": scraper_name.replace(".py", ""),
-            "url": source_url,
-            "eventsFound": 0,
-            "status": "error",
-            "errorMessage": str(e),
-        }
-
-    out_path = TMP_DIR / output_filename
-    if out_path.exists():
-        with open(out_path, "r", encoding="utf-8") as f:
-            events = json.load(f)
-        return events, {
-            "name": scraper_name.replace(".py", ""),
-            "url": source_url,
-            "eventsFound": len(events),
-            "status": "success",
-            "errorMessage": None,
-        }
-    return [], {
-        "name": scraper_name.replace(".py", ""),
-        "url": source_url,
-        "eventsFound": 0,
-        "status": "skipped",
-        "errorMessage": f"{output_filename} not found after scrape",
-    }
-
-
-def run_paynearena_scraper() -> tuple[list[dict], dict]:
-    """Run scrape_paynearena.py and return events + status."""
-    return run_scraper(
-        "scrape_paynearena.py",
-        "paynearena_events.json",
-        "https://paynearena.com"
-    )
-
-
-def run_tixplug_scraper() -> tuple[list[dict], dict]:
-    """Run scrape_tixplug.py and return events + status."""
-    return run_scraper(
-        "scrape_tixplug.py",
-        "tixplug_events.json",
-        "https://tixplug.com"
-    )
-
-
-def load_manual_events() -> tuple[list[dict], dict]:
-    """Load manually curated events (TixPlug / custom venues)."""
-    manual_path = Path(__file__).resolve().parent / "manual_events.json"
-    if not manual_path.exists():
-        print("  [INFO] No manual_events.json found — skipping")
-        return [], {
-            "name": "manual",
-            "url": "manual_events.json",
-            "eventsFound": 0,
-            "status": "skipped",
-            "errorMessage": "manual_events.json not found",
-        }
-
-    with open(manual_path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    # Strip comment entries and unpublished events
-    events = [
-        {**e, "source": e.get("source", "manual")}
-        for e in raw
-        if not e.get("_comment") and e.get("isPublished", True)
-    ]
-    print(f"  Loaded {len(events)} manual events")
-    return events, {
-        "name": "manual",
-        "url": "manual_events.json",
-        "eventsFound": len(events),
-        "status": "success",
-        "errorMessage": None,
-    }
-
-
 def load_scraped_events() -> tuple[list[dict], list[dict]]:
-    """Run all scrapers and return merged events + per-source status."""
-    events = []
-    sources_status = []
-
-    # Source 0: Manual events file (if any) (Added first so they take precedence in deduplication)
-    manual_events, manual_status = load_manual_events()
-    events.extend(manual_events)
-    sources_status.append(manual_status)
-
-    # Source 1: Payne Arena (HTML Scraping)
-    payne_events, payne_status = run_paynearena_scraper()
-    events.extend(payne_events)
-    sources_status.append(payne_status)
-
-    # Source 2: TixPlug (WordPress API)
-    tixplug_events, tixplug_status = run_tixplug_scraper()
-    events.extend(tixplug_events)
-    sources_status.append(tixplug_status)
-
-    return events, sources_status
+    """Run every source in sources.json concurrently and return merged events + per-source status."""
+    return sources.collect_events()
 
 
 def deduplicate_events(events: list[dict]) -> list[dict]:
@@ -230,30 +133,37 @@ def deduplicate_events(events: list[dict]) -> list[dict]:
     return final
 
 
-def download_image(image_url: str, filename: str) -> str | None:
-    """Download image and convert to WebP. Returns webp filename, or None on failure."""
+def download_image(store: PosterStore, fetch_index: dict, image_url: str, filename: str) -> str | None:
+    """
+    Fetch a poster into the content-addressed store (assets/posters/).
+
+    A poster stored from the same URL and checked within
+    image_fetch.REVALIDATE_AFTER is reused without a request. Older ones are
+    revalidated with their ETag / Last-Modified; an unchanged poster is
+    neither downloaded nor decoded. Returns the event's new imageName, or
+    None on failure.
+    """
     if not image_url:
         return None
 
-    from PIL import Image
-    import io
-
-    stem = Path(filename).stem
-    webp_name = stem + ".webp"
-    target_path = ASSETS_DIR / webp_name
-
-    if target_path.exists():
-        return webp_name  # Already have WebP version
+    entry = fetch_index.get(image_url) or {}
+    if image_fetch.is_fresh(entry):
+        known = store.lookup(filename, image_url)
+        if known == poster_name(entry["hash"]):
+            return known
+    try:
+        result = image_fetch.fetch(image_url, fetch_index, conditional=store.has(entry.get("hash", "")))
+    except Exception as e:
+        print(f"  [WARN] Failed to download {image_url}: {e}")
+        return store.lookup(filename, image_url)  # Keep the last good poster, if any
 
+    if result["status"] == "not_modified":
+        return store.link(filename, result["hash"], image_url)
     try:
-        headers = {"User-Agent": "Mozilla/5.0"}
-        resp = requests.get(image_url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        img = Image.open(io.BytesIO(resp.content)).convert("RGB")
-        img.save(target_path, "WEBP", quality=85)
-        return webp_name
+        with result["file"] as fp:
+            return store.put_file(fp, result["hash"], filename, image_url)
     except Exception as e:
-        print(f"  [WARN] Failed to download/convert {image_url}: {e}")
+        print(f"  [WARN] Failed to convert {image_url}: {e}")
         return None
 
 
@@ -279,72 +189,54 @@ def convert_existing_images() -> int:
     return converted
 
 
-def generate_events_data_js(events: list[dict]):
-    """Update js/events-data.js with the new events list."""
+def generate_events_data_js(events: list[dict]) -> bool:
+    """
+    Update js/events-data.js with the new events list.
+
+    Only LOCAL_EVENTS and VENUE_VENDORS are regenerated. Returns False (and
+    leaves the file untouched) when both serialize identically to what's on
+    disk.
+    """
     if not EVENTS_DATA_FILE.exists():
         print(f"  [ERROR] {EVENTS_DATA_FILE} not found")
-        return
-
-    with open(EVENTS_DATA_FILE, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    # Create the JS array content
-    events_json = json.dumps(events, indent=4, ensure_ascii=False)
-
-    # regex should match 'export const LOCAL_EVENTS = [...];'
-    pattern = r"export const LOCAL_EVENTS = \[.*?\];"
-    replacement = f"export const LOCAL_EVENTS = {events_json};"
-
-    new_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-
-    # Update timestamp (Matches ' * Last updated: ...')
-    timestamp_pattern = r" \* Last updated: .*"
-    timestamp_replacement = f" * Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    new_content = re.sub(timestamp_pattern, timestamp_replacement, new_content)
-
-    # Update sources
-    sources_pattern = r" \* Sources: .*"
-    sources_replacement = " * Sources: paynearena.com, tixplug.com"
-    new_content = re.sub(sources_pattern, sources_replacement, new_content)
-
-    with open(EVENTS_DATA_FILE, "w", encoding="utf-8") as f:
-        f.write(new_content)
+        return False
+
+    near, stats = venue_vendors.refresh(events, EVENTS_DATA_FILE)
+    run_metrics.record("venueVendors", stats)
+    print(f"  [OK] Nearest vendors for {stats['venues']} venue(s): "
+          f"{stats['recomputed']} recomputed, {stats['reused']} unchanged")
+    for name in stats["unresolved"]:
+        print(f"  [WARN] No coordinates for {name} — add it to {venue_vendors.VENUES_FILE.name}")
+
+    return write_js_arrays(
+        EVENTS_DATA_FILE,
+        {"LOCAL_EVENTS": events, venue_vendors.ARRAY_NAME: near},
+        header_fields={"Sources": "paynearena.com, tixplug.com"},
+    )
 
 
 def git_operations():
-    """Commit and push changes to GitHub."""
+    """Commit and push the files this run wrote (see git_publish.py)."""
     print("\n3. Running git operations...")
-    try:
-        # Check for remote changes first
-        subprocess.run(["git", "fetch", "origin"], check=True)
-
-        # Add changed files
-        subprocess.run(["git", "add", "js/events-data.js", "assets/"], check=True)
-        subprocess.run(["git", "add", "execution/"], check=True)
-
-        # Check if there are changes to commit
-        status = subprocess.run(["git", "diff", "--cached", "--quiet"])
-        if status.returncode == 0:
-            print("  No changes to commit.")
-            return
+    paths = git_publish.load()["paths"]
+    if not paths:
+        print("  No files written this run — skipping git.")
+        return
 
-        # Commit
+    try:
         msg = f"chore: update events data ({datetime.now().strftime('%Y-%m-%d')})"
-        subprocess.run(["git", "commit", "-m", msg], check=True)
-
-        # Stash any unstaged changes so rebase can proceed cleanly
-        subprocess.run(["git", "stash", "push", "--include-untracked", "-m", "auto-stash-before-deploy"], check=False)
-
-        # Push with rebase to handle remote changes
-        subprocess.run(["git", "pull", "--rebase", "origin", "main"], check=True)
-        subprocess.run(["git", "push", "origin", "main"], check=True)
-        print("  [OK] Changes pushed successfully")
-
-        # Restore any stashed changes
-        subprocess.run(["git", "stash", "pop"], check=False)
-
+        result = git_publish.publish(paths, msg, DTXENT_DIR)
     except subprocess.CalledProcessError as e:
         print(f"  [WARN] Git operations failed: {e}")
+        return
+
+    git_publish.mark_published()
+    if result["status"] == "noop":
+        print("  No changes to commit.")
+    elif result["files"]:
+        print(f"  [OK] Pushed {result['files']} changed file(s)")
+    else:
+        print("  [OK] Pushed the previous run's unpushed commit")
 
 
 def sync_to_firestore(events: list[dict]):
@@ -354,19 +246,26 @@ def sync_to_firestore(events: list[dict]):
         # Import sync_firestore locally to avoid dependency issues if not installed
         import sys
         sys.path.append(str(DTXENT_DIR / "execution"))
-        from sync_firestore import sync_events_to_firestore
+        from sync_firestore import publish_event_feeds, sync_events_to_firestore
 
         sync_events_to_firestore(events)
+        publish_event_feeds(events)
         print("  [OK] Firestore sync complete")
     except Exception as e:
         print(f"  [WARN] Firestore sync failed: {e}")
 
 
-def main(skip_git: bool = False):
+def main(skip_git: bool = False, prune_posters: bool = False):
     print("=" * 60)
     print("DTXent Website Updater")
     print("=" * 60)
 
+    install_from_env()
+    run_metrics.start_run()
+    carried = git_publish.start_run()
+    if carried:
+        print(f"[INFO] {carried} path(s) from an unpublished earlier run will be published with this one")
+
     # 1. Load Events
     print("\n1. Loading scraped events...")
     all_events, sources_status = load_scraped_events()
@@ -375,6 +274,11 @@ def main(skip_git: bool = False):
         print("  [ERROR] No events found from any source.")
         return
 
+    store = event_store.connect()
+    run_id = event_store.start_run(store)
+    raw_count = event_store.record_raw_events(store, run_id, all_events)
+    print(f"  [OK] Recorded {raw_count} raw rows in {event_store.DB_PATH.name} (run {run_id})")
+
     # 2. Process Events
     print(f"\n2. Processing {len(all_events)} events...")
 
@@ -436,25 +340,75 @@ def main(skip_git: bool = False):
 
     # Image Downloads
     print("\n3. Downloading event images...")
-    new_images = 0
+    assets_before = {p.name for p in ASSETS_DIR.iterdir()}
+    posters = PosterStore()
+    fetch_index = image_fetch.load_index()
     for event in processed_events:
         if event.get("imageUrl") and event.get("imageName"):
-            webp_name = download_image(event["imageUrl"], event["imageName"])
-            if webp_name:
-                if event["imageName"] != webp_name:
-                    new_images += 1
-                event["imageName"] = webp_name
-    print(f"  Downloaded {new_images} new images")
+            image_name = download_image(posters, fetch_index, event["imageUrl"], event["imageName"])
+            if image_name:
+                event["imageName"] = image_name
+    posters.save()
+    image_fetch.save_index(fetch_index)
+    print(f"  Posters: {posters.stats['converted']} new, {posters.stats['deduplicated']} deduplicated, "
+          f"{posters.stats['known']} already stored")
+
+    # Posters of past events drop out of processed_events but are still used by
+    # their Firestore docs and pre-rendered pages, so pruning is opt-in
+    gc_report = posters.gc({e["imageName"] for e in processed_events if e.get("imageName")}, prune=prune_posters)
+    if gc_report["pruned"]:
+        print(f"  Pruned {len(gc_report['orphanPosters'])} orphaned poster(s)")
+    elif gc_report["orphanPosters"]:
+        print(f"  [INFO] {len(gc_report['orphanPosters'])} poster(s) not used by a current event — kept "
+              f"(past events may still reference them); prune with --prune-posters")
+    if gc_report["legacyAssets"]:
+        print(f"  [INFO] {len(gc_report['legacyAssets'])} legacy asset(s) unreferenced "
+              f"— review with `python execution/poster_store.py gc`")
+    git_publish.record(posters.written + gc_report["pruned"])
+    run_metrics.record("posters", {**posters.stats, "orphansPruned": len(gc_report["pruned"]),
+                                   "legacyUnreferenced": len(gc_report["legacyAssets"])})
 
     # Convert any existing JPG/PNG assets to WebP
     converted = convert_existing_images()
     if converted:
         print(f"  Converted {converted} existing images to WebP")
+    git_publish.record([p for p in ASSETS_DIR.iterdir() if p.name not in assets_before])
+
+    stored = event_store.upsert_events(store, run_id, processed_events)
+    event_store.record_images(store, [
+        (e["imageName"], e.get("imageUrl"), ASSETS_DIR / e["imageName"])
+        for e in processed_events
+        if e.get("imageName") and not e["imageName"].startswith("http")
+    ])
+    event_store.finish_run(store, run_id, sources_status)
+    print(f"  [OK] Stored {stored['events']} merged events ({stored['newVersions']} new/changed)")
+
+    previous_run = event_store.previous_run_id(store, run_id)
+    changes = event_changes.diff_snapshots(
+        event_store.snapshot(store, previous_run) if previous_run else {},
+        event_store.snapshot(store, run_id),
+    )
+    changes_file = event_changes.write_changeset(changes, run_id, previous_run)
+    change_counts = event_changes.summarize(changes)
+    run_metrics.record("changes", {"runId": run_id, "previousRunId": previous_run, **change_counts})
+    print(f"  [OK] Changeset vs {previous_run or 'empty store'}: "
+          f"{', '.join(f'{n} {t}' for t, n in change_counts.items()) or 'no changes'} → {changes_file.name}")
 
     # Update JS Data File
     print("\n4. Updating website data file...")
-    generate_events_data_js(processed_events)
-    print(f"  [OK] Updated {EVENTS_DATA_FILE}")
+    if generate_events_data_js(processed_events):
+        git_publish.record([EVENTS_DATA_FILE])
+        print(f"  [OK] Updated {EVENTS_DATA_FILE}")
+    else:
+        print(f"  [OK] {EVENTS_DATA_FILE.name} unchanged — skipped write")
+    changed_bundles = build_bundles(EVENTS_DATA_FILE)
+    git_publish.record(changed_bundles)
+    print(f"  [OK] {len(changed_bundles)} data bundle file(s) changed")
+
+    prerendered = prerender(processed_events)
+    git_publish.record(prerendered["paths"])
+    print(f"  [OK] Pre-rendered {prerendered['rendered']} event page(s) "
+          f"({prerendered['skipped']} unchanged, {prerendered['deleted']} removed)")
 
     # Firestore Sync
     sync_to_firestore(processed_events)
@@ -468,7 +422,7 @@ def main(skip_git: bool = False):
     print("=" * 60)
 
     # Summary grouped by source
-    for src_label in ["paynearena", "tixplug", "manual"]:
+    for src_label in [status["name"] for status in sources_status]:
         src_events = [e for e in all_events if e.get("source", "manual") == src_label]
         if src_events:
             print(f"\n  [{src_label.upper()}] {len(src_events)} events:")
@@ -477,4 +431,4 @@ def main(skip_git: bool = False):
 
 
 if __name__ == "__main__":
-    main(skip_git="--ci" in sys.argv)
+    main(skip_git="--ci" in sys.argv, prune_posters="--prune-posters" in sys.argv)
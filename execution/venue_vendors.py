@@ -0,0 +1,133 @@
+"""
+venue_vendors.py — Precompute the nearest restaurants, hotels and clubs for
+every venue in LOCAL_EVENTS, so event pages need no client-side geometry.
+
+LOCAL_EVENTS has no coordinates, so venues are located through venues.json.
+The result is the VENUE_VENDORS array in js/events-data.js, which also
+ships as its own bundle (js/data/venues.<hash>.json):
+
+    {"venueName": "Payne Arena", "venueCity": "Hidalgo", "lat": 26.1108, "lng": -98.2464,
+     "restaurants": [["food-1", 3240], ...], "hotels": [...], "clubs": [...],
+     "hash": "3f9c2a1b7d"}
+
+Each list holds up to NEAR_K [vendor id, meters] pairs, nearest first, within
+NEAR_MAX_M. `hash` fingerprints the venue's coordinates and the vendor sets
+it was computed from; entries whose fingerprint is unchanged are carried
+over as-is, so a run only recomputes venues that are new or whose inputs
+changed.
+
+Usage:
+    python venue_vendors.py            # print the lists for the current LOCAL_EVENTS
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from geo_index import GeoIndex, coords, normalize_name
+
+# ---------- Configuration ----------
+SCRIPT_DIR = Path(__file__).resolve().parent
+VENUES_FILE = SCRIPT_DIR / "venues.json"
+EVENTS_DATA_FILE = SCRIPT_DIR.parent / "js" / "events-data.js"
+ARRAY_NAME = "VENUE_VENDORS"
+NEAR_K = 5
+NEAR_MAX_M = 40_000         # ~25 miles
+HASH_LENGTH = 10
+
+# Output list → events-data.js arrays it draws from
+VENDOR_SOURCES = {
+    "restaurants": ["LOCAL_RESTAURANTS", "DINING_RESTAURANTS"],
+    "hotels": ["LOCAL_HOTELS"],
+    "clubs": ["LOCAL_CLUBS"],
+}
+
+
+def load_venue_coords(path: Path = VENUES_FILE) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["venues"]
+
+
+def resolve_venue(name: str, city: str, table: list[dict]) -> dict | None:
+    """The venues.json row for (name, city); a blank city matches a unique name."""
+    key = normalize_name(name)
+    rows = [row for row in table if normalize_name(row["name"]) == key]
+    if city:
+        rows = [row for row in rows if normalize_name(row["city"]) == normalize_name(city)]
+    return rows[0] if len(rows) == 1 else None
+
+
+def _digest(value) -> str:
+    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def build_venue_vendors(
+    events: list[dict],
+    arrays: dict[str, list[dict]],
+    table: list[dict],
+    previous: list[dict] | None = None,
+    k: int = NEAR_K,
+    max_m: float = NEAR_MAX_M,
+) -> tuple[list[dict], dict]:
+    """
+    Near-vendor lists for each distinct (venueName, venueCity) in `events`.
+
+    `arrays` maps events-data.js array names to entries; `previous` is the
+    current VENUE_VENDORS array. Returns (entries sorted by venue, stats).
+    """
+    indexes, vendor_sets = {}, {}
+    for list_name, sources in VENDOR_SOURCES.items():
+        vendors = [v for source in sources for v in arrays.get(source, []) if v.get("id") and coords(v)]
+        indexes[list_name] = GeoIndex(vendors)
+        vendor_sets[list_name] = sorted((v["id"], *coords(v)) for v in vendors)
+    inputs = _digest({"vendors": vendor_sets, "k": k, "maxM": max_m})
+    carried = {(e["venueName"], e["venueCity"]): e for e in previous or []}
+
+    venues = sorted({(e.get("venueName", "").strip(), e.get("venueCity", "").strip()) for e in events} - {("", "")})
+    entries = []
+    stats = {"venues": 0, "recomputed": 0, "reused": 0, "unresolved": []}
+    for name, city in venues:
+        row = resolve_venue(name, city, table)
+        if row is None:
+            stats["unresolved"].append(f"{name} ({city or '?'})")
+            continue
+        lat, lng = row["lat"], row["lng"]
+        fingerprint = _digest([inputs, lat, lng])
+        prior = carried.get((name, city))
+        if prior and prior.get("hash") == fingerprint:
+            entries.append(prior)
+            stats["reused"] += 1
+            continue
+        entry = {"venueName": name, "venueCity": city, "lat": lat, "lng": lng}
+        for list_name, index in indexes.items():
+            entry[list_name] = [[v["id"], round(d)] for d, v in index.nearest(lat, lng, k=k, max_m=max_m)]
+        entry["hash"] = fingerprint
+        entries.append(entry)
+        stats["recomputed"] += 1
+    stats["venues"] = len(entries)
+    return entries, stats
+
+
+def refresh(events: list[dict], events_data: Path = EVENTS_DATA_FILE) -> tuple[list[dict], dict]:
+    """build_venue_vendors() against the vendor arrays and VENUE_VENDORS currently in events-data.js."""
+    from js_parser import extract_js_array
+
+    content = events_data.read_text(encoding="utf-8")
+    arrays = {name: extract_js_array(content, name) for sources in VENDOR_SOURCES.values() for name in sources}
+    previous = extract_js_array(content, ARRAY_NAME)
+    return build_venue_vendors(events, arrays, load_venue_coords(), previous)
+
+
+if __name__ == "__main__":
+    from js_parser import extract_js_array
+
+    events = extract_js_array(EVENTS_DATA_FILE.read_text(encoding="utf-8"), "LOCAL_EVENTS")
+    entries, stats = refresh(events)
+    for entry in entries:
+        print(f"{entry['venueName']} ({entry['venueCity']})")
+        for list_name in VENDOR_SOURCES:
+            print(f"  {list_name:<12} " + ", ".join(f"{vid} {m / 1609.34:.1f} mi" for vid, m in entry[list_name]))
+    print(f"[OK] {stats['venues']} venue(s): {stats['recomputed']} recomputed, {stats['reused']} reused")
+    for name in stats["unresolved"]:
+        print(f"  [WARN] No coordinates for {name} — add it to {VENUES_FILE.name}")
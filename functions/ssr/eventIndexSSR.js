@@ -8,6 +8,50 @@ const {
 
 const { Timestamp } = require('firebase-admin/firestore');
 
+const INDEX_LIMIT = 60;
+
+/**
+ * Upcoming events, from the feeds/upcoming read model published by the sync
+ * (one document read, already sorted). Feed entries group multi-night runs
+ * under `dates`; they are expanded back to one card per remaining date, the
+ * same shape the events query below returns. Falls back to querying the
+ * events collection when the feed has not been published.
+ */
+async function loadUpcomingEvents() {
+    const now = new Date();
+    const feed = await db.collection('feeds').doc('upcoming').get();
+    if (feed.exists) {
+        const events = [];
+        (feed.get('events') || []).forEach(e => {
+            if (!e.artistName || !e.venueName) return;
+            const dates = e.dates || [{ eventDate: e.eventDate, ticketUrl: e.ticketUrl }];
+            dates.forEach(d => {
+                if (d.eventDate && new Date(d.eventDate) >= now) {
+                    events.push({ ...e, eventDate: d.eventDate, ticketUrl: d.ticketUrl || e.ticketUrl });
+                }
+            });
+        });
+        events.sort((a, b) => new Date(a.eventDate) - new Date(b.eventDate));
+        return events.slice(0, INDEX_LIMIT);
+    }
+
+    const snapshot = await db.collection('events')
+        .where('isPublished', '==', true)
+        .where('eventDate', '>=', Timestamp.fromDate(now))
+        .orderBy('eventDate', 'asc')
+        .limit(INDEX_LIMIT)
+        .get();
+
+    const events = [];
+    snapshot.forEach(doc => {
+        const e = doc.data();
+        if (e.artistName && e.venueName && e.eventDate) {
+            events.push(e);
+        }
+    });
+    return events;
+}
+
 exports.eventIndexSSR = onRequest(
     { region: 'us-central1', timeoutSeconds: 15, memory: '256MiB', invoker: 'public' },
     async (req, res) => {
@@ -16,21 +60,7 @@ exports.eventIndexSSR = onRequest(
             const noindex = page > 1;
             const canonicalUrl = 'https://dtxent.com/events';
 
-            const now = Timestamp.now();
-            const snapshot = await db.collection('events')
-                .where('isPublished', '==', true)
-                .where('eventDate', '>=', now)
-                .orderBy('eventDate', 'asc')
-                .limit(60)
-                .get();
-
-            const events = [];
-            snapshot.forEach(doc => {
-                const e = doc.data();
-                if (e.artistName && e.venueName && e.eventDate) {
-                    events.push(e);
-                }
-            });
+            const events = await loadUpcomingEvents();
 
             // Group events by month
             const grouped = {};
@@ -9,13 +9,25 @@ const {
     buildHead, buildNav, buildFooter, buildScripts, buildEventCard, build404,
 } = require('./helpers');
 
-// ─── Individual Event Page ────────────────────────────────────────────────────
+// ─── Event Lookup ─────────────────────────────────────────────────────────────
 
-async function renderEventPage(req, res, slug) {
-    const dateStr = parseDateFromSlug(slug);
-    if (!dateStr) {
-        res.status(404).send(build404('Event Not Found'));
-        return;
+function toJsDate(ts) {
+    return ts && ts.toDate ? ts.toDate() : new Date(ts);
+}
+
+/**
+ * Resolve a page slug to its event.
+ * Fast path: the slugs/{slug} pointer written by the Python sync (two document gets).
+ * Fallback: documents created in the admin dashboard have no slug fields, so scan that day.
+ */
+async function findEventBySlug(slug, dateStr) {
+    const pointer = await db.collection('slugs').doc(slug).get();
+    if (pointer.exists) {
+        const doc = await db.collection('events').doc(pointer.get('eventId')).get();
+        const e = doc.exists ? doc.data() : null;
+        if (e && e.isPublished && e.slug === slug) {
+            return { id: doc.id, ...e };
+        }
     }
 
     // Parse the date string into a day range (UTC)
@@ -23,18 +35,11 @@ async function renderEventPage(req, res, slug) {
     const dayStart = new Date(Date.UTC(y, m - 1, d, 0, 0, 0));
     const dayEnd = new Date(Date.UTC(y, m - 1, d, 23, 59, 59));
 
-    let snapshot;
-    try {
-        snapshot = await db.collection('events')
-            .where('isPublished', '==', true)
-            .where('eventDate', '>=', Timestamp.fromDate(dayStart))
-            .where('eventDate', '<=', Timestamp.fromDate(dayEnd))
-            .get();
-    } catch (err) {
-        console.error('eventPageSSR Firestore error:', err);
-        res.status(500).send(build404('Error loading event'));
-        return;
-    }
+    const snapshot = await db.collection('events')
+        .where('isPublished', '==', true)
+        .where('eventDate', '>=', Timestamp.fromDate(dayStart))
+        .where('eventDate', '<=', Timestamp.fromDate(dayEnd))
+        .get();
 
     // Find the matching event by slug
     let event = null;
@@ -46,6 +51,90 @@ async function renderEventPage(req, res, slug) {
             event = { id: doc.id, ...e };
         }
     });
+    return event;
+}
+
+/**
+ * "More by this artist" / "More at this venue" events.
+ * Uses the relatedByArtist / relatedByVenue id lists precomputed at sync time
+ * (one batched get), falling back to queries for documents without them.
+ */
+async function findRelatedEvents(event) {
+    const artistSlug = toSlug(event.artistName);
+    const now = new Date();
+    const isShowable = e => e && e.isPublished && e.artistName && e.venueName && toJsDate(e.eventDate) >= now;
+
+    if (Array.isArray(event.relatedByArtist) && Array.isArray(event.relatedByVenue)) {
+        const ids = [...new Set([...event.relatedByArtist, ...event.relatedByVenue])];
+        const byId = new Map();
+        if (ids.length > 0) {
+            const docs = await db.getAll(...ids.map(id => db.collection('events').doc(id)));
+            docs.forEach(doc => {
+                if (doc.exists) byId.set(doc.id, doc.data());
+            });
+        }
+        const pick = list => list.map(id => byId.get(id)).filter(isShowable);
+        return {
+            sameArtistEvents: pick(event.relatedByArtist).slice(0, 4),
+            sameVenueEvents: pick(event.relatedByVenue)
+                .filter(e => toSlug(e.artistName) !== artistSlug)
+                .slice(0, 4),
+        };
+    }
+
+    const [artistSnap, venueSnap] = await Promise.all([
+        db.collection('events')
+            .where('isPublished', '==', true)
+            .where('artistName', '==', event.artistName)
+            .where('eventDate', '>=', Timestamp.now())
+            .orderBy('eventDate', 'asc')
+            .limit(5)
+            .get(),
+        db.collection('events')
+            .where('isPublished', '==', true)
+            .where('venueName', '==', event.venueName)
+            .where('eventDate', '>=', Timestamp.now())
+            .orderBy('eventDate', 'asc')
+            .limit(5)
+            .get(),
+    ]);
+    const sameArtistEvents = [];
+    const sameVenueEvents = [];
+    artistSnap.forEach(doc => {
+        const e = doc.data();
+        if (doc.id !== event.id && e.artistName && e.venueName) {
+            sameArtistEvents.push(e);
+        }
+    });
+    venueSnap.forEach(doc => {
+        const e = doc.data();
+        if (doc.id !== event.id && e.artistName && e.venueName) {
+            sameVenueEvents.push(e);
+        }
+    });
+    return {
+        sameArtistEvents: sameArtistEvents.slice(0, 4),
+        sameVenueEvents: sameVenueEvents.slice(0, 4).filter(e => toSlug(e.artistName) !== artistSlug),
+    };
+}
+
+// ─── Individual Event Page ────────────────────────────────────────────────────
+
+async function renderEventPage(req, res, slug) {
+    const dateStr = parseDateFromSlug(slug);
+    if (!dateStr) {
+        res.status(404).send(build404('Event Not Found'));
+        return;
+    }
+
+    let event;
+    try {
+        event = await findEventBySlug(slug, dateStr);
+    } catch (err) {
+        console.error('eventPageSSR Firestore error:', err);
+        res.status(500).send(build404('Error loading event'));
+        return;
+    }
 
     if (!event) {
         res.status(404).send(build404('Event Not Found'));
@@ -61,42 +150,11 @@ async function renderEventPage(req, res, slug) {
         return (Date.now() - d.getTime()) > 30 * 24 * 60 * 60 * 1000; // >30 days old
     })();
 
-    // Fetch related events (same artist, excluding current)
+    // Fetch related events (same artist / same venue, excluding current)
     let sameArtistEvents = [];
     let sameVenueEvents = [];
     try {
-        const [artistSnap, venueSnap] = await Promise.all([
-            db.collection('events')
-                .where('isPublished', '==', true)
-                .where('artistName', '==', event.artistName)
-                .where('eventDate', '>=', Timestamp.now())
-                .orderBy('eventDate', 'asc')
-                .limit(5)
-                .get(),
-            db.collection('events')
-                .where('isPublished', '==', true)
-                .where('venueName', '==', event.venueName)
-                .where('eventDate', '>=', Timestamp.now())
-                .orderBy('eventDate', 'asc')
-                .limit(5)
-                .get(),
-        ]);
-        artistSnap.forEach(doc => {
-            const e = doc.data();
-            if (doc.id !== event.id && e.artistName && e.venueName) {
-                sameArtistEvents.push(e);
-            }
-        });
-        venueSnap.forEach(doc => {
-            const e = doc.data();
-            if (doc.id !== event.id && e.artistName && e.venueName) {
-                sameVenueEvents.push(e);
-            }
-        });
-        sameArtistEvents = sameArtistEvents.slice(0, 4);
-        sameVenueEvents = sameVenueEvents.slice(0, 4).filter(
-            e => toSlug(e.artistName) !== artistSlug
-        );
+        ({ sameArtistEvents, sameVenueEvents } = await findRelatedEvents(event));
     } catch (err) {
         console.error('eventPageSSR related events error:', err);
     }
@@ -0,0 +1,65 @@
+// Data Loader - Fetches content-hashed data bundles listed in js/data/manifest.json
+// Bundles are generated by execution/data_bundles.py from js/events-data.js.
+// Hashed filenames never change content, so they are cached as immutable;
+// only the tiny manifest is revalidated on each visit.
+// Bundles are fetched as plain JSON; Firebase Hosting negotiates compression
+// from Accept-Encoding.
+
+const DATA_DIR = '/js/data/';
+const MANIFEST_URL = `${DATA_DIR}manifest.json`;
+
+// Bundle name → export in events-data.js (fallback when the manifest is unavailable)
+const FALLBACK_EXPORTS = {
+    events: 'LOCAL_EVENTS',
+    clubs: 'LOCAL_CLUBS',
+    restaurants: 'LOCAL_RESTAURANTS',
+    dining: 'DINING_RESTAURANTS',
+    hotels: 'LOCAL_HOTELS',
+    venues: 'VENUE_VENDORS'
+};
+
+let manifestPromise = null;
+const datasetPromises = new Map();
+
+function loadManifest() {
+    if (!manifestPromise) {
+        manifestPromise = fetch(MANIFEST_URL, { cache: 'no-cache' }).then(response => {
+            if (!response.ok) throw new Error(`Manifest request failed: ${response.status}`);
+            return response.json();
+        });
+    }
+    return manifestPromise;
+}
+
+async function fetchBundle(entry) {
+    const response = await fetch(`${DATA_DIR}${entry.file}`);
+    if (!response.ok) throw new Error(`Bundle request failed: ${response.status}`);
+    return response.json();
+}
+
+async function fetchDataset(name) {
+    try {
+        const manifest = await loadManifest();
+        const entry = manifest.datasets && manifest.datasets[name];
+        if (!entry) throw new Error(`Dataset "${name}" missing from manifest`);
+
+        return await fetchBundle(entry);
+    } catch (error) {
+        console.warn(`Data bundle "${name}" unavailable, falling back to events-data.js:`, error);
+        const module = await import('./events-data.js');
+        return module[FALLBACK_EXPORTS[name]] || [];
+    }
+}
+
+/**
+ * Load a dataset ("events", "clubs", "restaurants", "dining", "hotels").
+ * Concurrent calls for the same dataset share one request.
+ * @param {string} name
+ * @returns {Promise<Array>}
+ */
+export function loadDataset(name) {
+    if (!datasetPromises.has(name)) {
+        datasetPromises.set(name, fetchDataset(name));
+    }
+    return datasetPromises.get(name);
+}
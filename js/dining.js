@@ -1,4 +1,4 @@
-import { DINING_RESTAURANTS } from './events-data.js';
+import { loadDataset } from './data-loader.js';
 
 const CATEGORIES = [
     'All',
@@ -11,8 +11,10 @@ const CATEGORIES = [
 ];
 
 let activeCategory = 'All';
+let DINING_RESTAURANTS = [];
 
-function init() {
+async function init() {
+    DINING_RESTAURANTS = await loadDataset('dining');
     renderFilterBar();
     renderGrid();
     syncFromURL();
@@ -1,6 +1,6 @@
 /**
  * Events data - Auto-generated by update_dtxent workflow
- * Last updated: 2026-04-23 16:38:17
+ * Last updated: 2026-10-19 07:52:20
  * Sources: paynearena.com, tixplug.com
  */
 export const LOCAL_EVENTS = [
@@ -758,3 +758,16 @@ export const LOCAL_HOTELS = [
         lng: -97.160
     }
 ];
+
+/**
+ * Nearest vendors per event venue - generated by execution/venue_vendors.py
+ * Each entry: venue + [vendorId, meters] lists, nearest first.
+ */
+export const VENUE_VENDORS = [
+    {"venueName":"Alamo Sports Complex","venueCity":"Alamo","lat":26.195,"lng":-98.123,"restaurants":[["food-mousai",10302],["food-santa-fe",10797],["food-la-doble-m",14868]],"hotels":[["hotel-1",13370]],"clubs":[],"hash":"2afd79e326"},
+    {"venueName":"Cameron County Amphitheater","venueCity":"","lat":26.075,"lng":-97.158,"restaurants":[],"hotels":[["hotel-2",1680]],"clubs":[],"hash":"c0dedc605a"},
+    {"venueName":"Citrus Live","venueCity":"Edinburg","lat":26.2853,"lng":-98.1594,"restaurants":[["food-mousai",7120],["food-santa-fe",12871],["food-la-doble-m",14917]],"hotels":[["hotel-1",13985]],"clubs":[],"hash":"abe14b3f28"},
+    {"venueName":"HAPO Center","venueCity":"Pasco","lat":46.2611,"lng":-119.114,"restaurants":[],"hotels":[],"clubs":[],"hash":"7693e70973"},
+    {"venueName":"Payne Arena","venueCity":"Hidalgo","lat":26.1108,"lng":-98.2464,"restaurants":[["food-santa-fe",8830],["food-la-doble-m",9920],["food-mousai",14987]],"hotels":[["hotel-1",9422]],"clubs":[],"hash":"705cafb3f3"},
+    {"venueName":"The Box Theater at Payne","venueCity":"Hidalgo","lat":26.1108,"lng":-98.2464,"restaurants":[["food-santa-fe",8830],["food-la-doble-m",9920],["food-mousai",14987]],"hotels":[["hotel-1",9422]],"clubs":[],"hash":"705cafb3f3"}
+];
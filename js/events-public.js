@@ -1,20 +1,20 @@
 // Public Events Loader - Fetches and displays events on the landing page (Real-time)
 import { db } from './firebase-config.js';
-import { collection, query, where, orderBy, Timestamp, onSnapshot } from 'https://www.gstatic.com/firebasejs/10.14.1/firebase-firestore.js';
+import { collection, query, where, orderBy, Timestamp, onSnapshot, doc, getDoc } from 'https://www.gstatic.com/firebasejs/10.14.1/firebase-firestore.js';
 
 // Store unsubscribe function for cleanup
 let unsubscribeEvents = null;
 
 const SIX_HOURS_MS = 6 * 60 * 60 * 1000;
 const ONE_MINUTE_MS = 60 * 1000;
-import { LOCAL_EVENTS } from './events-data.js';
+import { loadDataset } from './data-loader.js';
 import { eventModal } from './event-detail-modal.js';
 
 
 /**
  * Load and display published events with real-time updates (From Firestore)
  */
-export function loadPublicEvents() {
+export async function loadPublicEvents() {
     const eventsGrid = document.querySelector('.events-grid');
     if (!eventsGrid) return;
 
@@ -23,25 +23,76 @@ export function loadPublicEvents() {
         unsubscribeEvents();
     }
 
-    // Step 1: Initial load from LOCAL_EVENTS for zero-latency
-    console.log('Performing initial load from local data...');
     const now = new Date();
     const pastCutoff = new Date(now.getTime() - SIX_HOURS_MS);
 
-    const initialLocalEvents = LOCAL_EVENTS.filter(event => {
-        if (event.isPublished === false) return false;
-        const eventDate = new Date(event.eventDate);
-        return !isNaN(eventDate.getTime()) && eventDate >= pastCutoff;
-    });
+    // Start the feed read now, but never block first paint on Firestore
+    const feedRequest = loadUpcomingFeed(pastCutoff);
+    let feedRendered = false;
 
-    if (initialLocalEvents.length > 0) {
-        renderEventsList(processEventsForDisplay(initialLocalEvents), eventsGrid);
-    } else {
-        eventsGrid.innerHTML = `
+    // Step 1: Initial render from the local events bundle for zero-latency
+    const localRender = (async () => {
+        console.log('Performing initial load from local data...');
+        const localEvents = await loadDataset('events');
+        if (feedRendered) return;
+
+        const initialLocalEvents = localEvents.filter(event => {
+            if (event.isPublished === false) return false;
+            const eventDate = new Date(event.eventDate);
+            return !isNaN(eventDate.getTime()) && eventDate >= pastCutoff;
+        });
+
+        if (initialLocalEvents.length > 0) {
+            renderEventsList(processEventsForDisplay(initialLocalEvents), eventsGrid);
+        } else {
+            eventsGrid.innerHTML = `
             <div class="events-empty">
                 <p>No upcoming events at this time. Check back soon!</p>
             </div>
         `;
+        }
+    })().then(() => null, error => error);
+
+    // Step 2: Replace with the pre-grouped feed published by the sync once it arrives
+    const feedEvents = await feedRequest;
+    if (feedEvents && feedEvents.length > 0) {
+        feedRendered = true;
+        renderEventsList(feedEvents, eventsGrid);
+    }
+
+    // A failed bundle load only matters if the feed didn't cover for it
+    const localError = await localRender;
+    if (localError && !feedRendered) throw localError;
+}
+
+/**
+ * Load feeds/upcoming — events already filtered, sorted and grouped by the sync.
+ * Only dates that have passed since the feed was published are dropped here.
+ * Returns null if the feed is unavailable.
+ */
+async function loadUpcomingFeed(pastCutoff) {
+    try {
+        const snapshot = await getDoc(doc(db, 'feeds', 'upcoming'));
+        if (!snapshot.exists()) return null;
+
+        return (snapshot.data().events || []).map(event => {
+            const dates = (event.dates || [{ eventDate: event.eventDate, ticketUrl: event.ticketUrl }])
+                .map(d => ({ ...d, eventDate: new Date(d.eventDate) }))
+                .filter(d => d.eventDate >= pastCutoff);
+            if (dates.length === 0) return null;
+
+            const first = dates[0].eventDate;
+            return {
+                ...event,
+                eventDate: first,
+                dates: dates.length > 1 ? dates : undefined,
+                displayMonth: first.toLocaleString('en-US', { month: 'short' }).toUpperCase(),
+                displayDay: first.getDate()
+            };
+        }).filter(Boolean);
+    } catch (error) {
+        console.warn('Events feed unavailable, using local data:', error);
+        return null;
     }
 }
 
@@ -500,31 +551,24 @@ function announceEventsLoaded(count) {
     }
 }
 
+/**
+ * Replace the events grid with an error message
+ */
+function showEventsLoadError(err) {
+    console.error('Failed to load events:', err);
+    const grid = document.querySelector('.events-grid');
+    if (grid) {
+        grid.innerHTML = `<div class="events-error">
+            <p>⚠️ Unable to load events. Please refresh or try again later.</p>
+        </div>`;
+    }
+}
+
 // Auto-initialize when DOM is ready
 if (document.readyState === 'loading') {
     document.addEventListener('DOMContentLoaded', () => {
-        try {
-            loadPublicEvents();
-        } catch (err) {
-            console.error('Failed to load events:', err);
-            const grid = document.querySelector('.events-grid');
-            if (grid) {
-                grid.innerHTML = `<div class="events-error">
-                    <p>⚠️ Unable to load events. Please refresh or try again later.</p>
-                </div>`;
-            }
-        }
+        loadPublicEvents().catch(showEventsLoadError);
     });
 } else {
-    try {
-        loadPublicEvents();
-    } catch (err) {
-        console.error('Failed to load events:', err);
-        const grid = document.querySelector('.events-grid');
-        if (grid) {
-            grid.innerHTML = `<div class="events-error">
-                <p>⚠️ Unable to load events. Please refresh or try again later.</p>
-            </div>`;
-        }
-    }
+    loadPublicEvents().catch(showEventsLoadError);
 }
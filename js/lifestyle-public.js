@@ -1,4 +1,4 @@
-import { LOCAL_CLUBS, LOCAL_RESTAURANTS, LOCAL_HOTELS, DINING_RESTAURANTS } from './events-data.js';
+import { loadDataset } from './data-loader.js';
 
 function escapeHtml(str) {
     if (str == null) return '';
@@ -46,9 +46,9 @@ export async function loadLifestyleContent() {
         loadFromFirestore('hotels')
     ]);
 
-    const clubs = (firestoreClubs.status === 'fulfilled' && firestoreClubs.value) || LOCAL_CLUBS;
-    const restaurants = (firestoreRestaurants.status === 'fulfilled' && firestoreRestaurants.value) || LOCAL_RESTAURANTS;
-    const hotels = (firestoreHotels.status === 'fulfilled' && firestoreHotels.value) || LOCAL_HOTELS;
+    const clubs = (firestoreClubs.status === 'fulfilled' && firestoreClubs.value) || await loadDataset('clubs');
+    const restaurants = (firestoreRestaurants.status === 'fulfilled' && firestoreRestaurants.value) || await loadDataset('restaurants');
+    const hotels = (firestoreHotels.status === 'fulfilled' && firestoreHotels.value) || await loadDataset('hotels');
 
     renderGrid('nightlife-grid', clubs, createClubCard);
 
@@ -59,7 +59,7 @@ export async function loadLifestyleContent() {
         renderFeaturedDining(firestoreFeatured);
     } else {
         // Fallback to DINING_RESTAURANTS which has the enhanced metadata
-        renderFeaturedDining(DINING_RESTAURANTS);
+        renderFeaturedDining(await loadDataset('dining'));
     }
 
     renderGrid('stay-grid', hotels, createHotelCard);
@@ -88,7 +88,7 @@ function renderGrid(elementId, data, cardCreator) {
  * Render 3-4 featured dining cards with logo-on-gradient style
  * @param {Array} dataSource - Array of restaurant objects
  */
-function renderFeaturedDining(dataSource = DINING_RESTAURANTS) {
+function renderFeaturedDining(dataSource) {
     const grid = document.getElementById('dining-grid');
     if (!grid) return;
 
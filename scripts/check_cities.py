@@ -1,8 +1,27 @@
-import json
-with open('.tmp/tixplug_events.json', encoding='utf-8') as f:
-    events = json.load(f)
-
-for e in events:
-    city = e.get('venueCity', '')
-    if city == 'Allen':
-        print(f"{e.get('eventDate')} | {e.get('artistName')} | {city} | {e.get('ticketUrl')}")
+"""
+check_cities.py — List scraped events in one city (default: Allen).
+
+Reads the latest run's raw rows from the SQLite event store (.tmp/dtxent.db).
+Seed it from a scraper dump with:
+    python execution/event_store.py import .tmp/tixplug_events.json --source tixplug
+
+Usage:
+    python scripts/check_cities.py
+    python scripts/check_cities.py --city Hidalgo --source paynearena
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "execution"))
+
+import event_store  # noqa: E402
+
+parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+parser.add_argument("--city", default="Allen")
+parser.add_argument("--source", default="tixplug")
+args = parser.parse_args()
+
+for e in event_store.raw_events(event_store.connect(), source=args.source, city=args.city):
+    print(f"{e.get('eventDate')} | {e.get('artistName')} | {e.get('venueCity')} | {e.get('ticketUrl')}")
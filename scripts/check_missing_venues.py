@@ -1,7 +1,26 @@
-import json
-with open('.tmp/tixplug_events.json', encoding='utf-8') as f:
-    events = json.load(f)
+"""
+check_missing_venues.py — List scraped events without a venue name or city.
 
-for e in events:
-    if not e.get('venueName') or not e.get('venueCity'):
-        print(f"{e.get('eventDate')} | {e.get('artistName')} | {e.get('venueName')} | {e.get('venueCity')} | {e.get('ticketUrl')}")
+Reads the latest run's raw rows from the SQLite event store (.tmp/dtxent.db).
+Seed it from a scraper dump with:
+    python execution/event_store.py import .tmp/tixplug_events.json --source tixplug
+
+Usage:
+    python scripts/check_missing_venues.py
+    python scripts/check_missing_venues.py --source paynearena
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "execution"))
+
+import event_store  # noqa: E402
+
+parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+parser.add_argument("--source", default="tixplug")
+args = parser.parse_args()
+
+for e in event_store.raw_events(event_store.connect(), source=args.source, missing_venue=True):
+    print(f"{e.get('eventDate')} | {e.get('artistName')} | {e.get('venueName')} | {e.get('venueCity')} | {e.get('ticketUrl')}")
@@ -0,0 +1,138 @@
+"""
+load_test_firestore_sync.py — Drive large event syncs through the in-process Firestore fake.
+
+Measures reads, writes, round trips and batch sizes for sync_events_to_firestore,
+a no-change re-sync (the redundant writes are what a diff-based sync would save),
+mark_closed_events, write_scrape_log and sync_firestore_ci.sync.
+
+Usage:
+    python scripts/load_test_firestore_sync.py
+    python scripts/load_test_firestore_sync.py --events 10000 --latency-ms 20
+    python scripts/load_test_firestore_sync.py --max-reads 10000 --max-writes 10000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "execution"))
+
+import firestore_client  # noqa: E402
+import sync_firestore  # noqa: E402
+import sync_firestore_ci  # noqa: E402
+from firestore_client import FakeFirestore  # noqa: E402
+
+
+def make_events(n: int, past_fraction: float = 0.1) -> list[dict]:
+    """Synthetic scraper-shaped events; the first `past_fraction` are already over."""
+    now = datetime.now()
+    past = int(n * past_fraction)
+    events = []
+    for i in range(n):
+        offset = -(i + 1) if i < past else i + 1
+        events.append({
+            "artistName": f"Load Test Artist {i}",
+            "eventName": "Live in Concert",
+            "eventDate": (now + timedelta(days=offset)).strftime("%Y-%m-%dT20:00:00"),
+            "venueName": ["Payne Arena", "Citrus Live", "Cine El Rey"][i % 3],
+            "venueCity": ["Hidalgo", "Edinburg", "McAllen"][i % 3],
+            "venueState": "TX",
+            "imageName": f"load-{i}.webp",
+            "ticketUrl": f"https://tixplug.com/shop/load-{i}/",
+            "isPublished": True,
+            "source": "tixplug",
+        })
+    return events
+
+
+def use_fake(db: FakeFirestore):
+    """Point both sync modules at `db`, discarding any cached client."""
+    firestore_client.set_client(db)
+    sync_firestore._db = None
+    sync_firestore._initialized = False
+
+
+def measure(label: str, db: FakeFirestore, fn) -> dict:
+    db.reset_stats()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    row = {"phase": label, "seconds": round(elapsed, 3), **db.stats.as_dict()}
+    return row
+
+
+def run_load_test(n_events: int, latency_ms: float = 0.0) -> list[dict]:
+    """Run every sync phase against fresh fakes and return one stats row per phase."""
+    events = make_events(n_events)
+    db = FakeFirestore(latency=latency_ms / 1000)
+    use_fake(db)
+
+    rows = []
+    stats = {}
+
+    def initial_sync():
+        stats.update(sync_firestore.sync_events_to_firestore(events))
+
+    rows.append(measure("sync (initial)", db, initial_sync))
+    rows.append(measure("sync (no changes)", db, lambda: sync_firestore.sync_events_to_firestore(events)))
+    rows.append(measure("publish feeds", db, lambda: sync_firestore.publish_event_feeds(events)))
+    rows.append(measure("publish feeds (no changes)", db, lambda: sync_firestore.publish_event_feeds(events)))
+    rows.append(measure("mark_closed_events", db, sync_firestore.mark_closed_events))
+    rows.append(measure("write_scrape_log", db, lambda: sync_firestore.write_scrape_log(
+        [{"name": "load", "url": "", "eventsFound": n_events, "status": "success", "errorMessage": None}],
+        events,
+        stats,
+    )))
+
+    ci_db = FakeFirestore(latency=latency_ms / 1000)
+    rows.append(measure("ci sync (initial)", ci_db, lambda: sync_firestore_ci.sync(events, ci_db)))
+
+    firestore_client.set_client(None)
+    return rows
+
+
+def print_report(rows: list[dict]):
+    columns = ["phase", "seconds", "reads", "writes", "roundTrips", "commits", "maxBatchSize", "redundantWrites"]
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(widths[c]) for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the Firestore sync path offline.")
+    parser.add_argument("--events", type=int, default=10_000, help="Events per sync (default: 10000)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Injected latency per round trip")
+    parser.add_argument("--max-reads", type=int, help="Fail if any sync phase exceeds this many reads")
+    parser.add_argument("--max-writes", type=int, help="Fail if any sync phase exceeds this many writes")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Firestore Sync Load Test — {args.events} events, {args.latency_ms} ms/round trip")
+    print("=" * 60)
+
+    rows = run_load_test(args.events, args.latency_ms)
+    print()
+    print_report(rows)
+
+    failures = []
+    for row in rows:
+        if not row["phase"].startswith(("sync", "ci sync")):
+            continue
+        if args.max_reads is not None and row["reads"] > args.max_reads:
+            failures.append(f"{row['phase']}: {row['reads']} reads > {args.max_reads}")
+        if args.max_writes is not None and row["writes"] > args.max_writes:
+            failures.append(f"{row['phase']}: {row['writes']} writes > {args.max_writes}")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"  [FAIL] {failure}")
+        sys.exit(1)
+    print("\n[OK] Load test complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,49 @@
 // Service Worker for Dynamic TX Entertainment
 // Increment version on every deploy to bust the SW cache
-const CACHE_VERSION = 'dtxent-v3.0.0';
+const CACHE_VERSION = 'dtxent-v3.2.1';
 const DYNAMIC_CACHE = 'dtxent-dynamic-v3';
 
-// Install event - skip waiting to activate immediately
+// Content-hashed data bundles (js/data/<name>.<hash>.json) never change once
+// published, so they live in their own cache that survives SW version bumps.
+const DATA_CACHE = 'dtxent-data';
+const DATA_MANIFEST_URL = '/js/data/manifest.json';
+const HASHED_DATA_PATTERN = /^\/js\/data\/[a-z]+\.[0-9a-f]+\.json$/;
+
+// Same URL js/data-loader.js requests: the plain bundle, compressed by Hosting
+function bundleUrl(entry) {
+    return `/js/data/${entry.file}`;
+}
+
+/**
+ * Precache every bundle listed in the manifest and drop bundles it no longer lists.
+ * Unchanged datasets keep their URL, so only changed bundles are downloaded.
+ */
+async function precacheDataBundles() {
+    const response = await fetch(DATA_MANIFEST_URL, { cache: 'no-cache' });
+    if (!response.ok) return;
+    const manifest = await response.json();
+    const urls = Object.values(manifest.datasets || {}).map(bundleUrl);
+
+    const cache = await caches.open(DATA_CACHE);
+    const cached = await cache.keys();
+    const cachedPaths = new Set(cached.map(request => new URL(request.url).pathname));
+
+    await cache.addAll(urls.filter(url => !cachedPaths.has(url)));
+    await Promise.all(
+        cached
+            .filter(request => !urls.includes(new URL(request.url).pathname))
+            .map(request => cache.delete(request))
+    );
+}
+
+// Install event - precache data bundles, skip waiting to activate immediately
 self.addEventListener('install', (event) => {
     console.log('[SW] Installing service worker...');
-    self.skipWaiting();
+    event.waitUntil(
+        precacheDataBundles()
+            .catch(err => console.warn('[SW] Data precache failed:', err))
+            .then(() => self.skipWaiting())
+    );
 });
 
 // Activate event - clean ALL old caches
@@ -15,7 +52,7 @@ self.addEventListener('activate', (event) => {
     event.waitUntil(
         caches.keys().then(keys => {
             return Promise.all(
-                keys.filter(key => key !== DYNAMIC_CACHE)
+                keys.filter(key => key !== DYNAMIC_CACHE && key !== DATA_CACHE)
                     .map(key => {
                         console.log('[SW] Deleting old cache:', key);
                         return caches.delete(key);
@@ -36,6 +73,24 @@ self.addEventListener('fetch', (event) => {
     // Let cross-origin requests go straight to network (no SW interception)
     if (url.origin !== location.origin) return;
 
+    // Hashed data bundles are immutable - cache first
+    if (HASHED_DATA_PATTERN.test(url.pathname)) {
+        event.respondWith(
+            caches.open(DATA_CACHE).then(cache =>
+                cache.match(request).then(cached => cached || fetch(request).then(response => {
+                    if (response.status === 200) cache.put(request, response.clone());
+                    return response;
+                }))
+            )
+        );
+        return;
+    }
+
+    // A new manifest means new bundles - refresh the data cache in the background
+    if (url.pathname === DATA_MANIFEST_URL) {
+        event.waitUntil(precacheDataBundles().catch(() => {}));
+    }
+
     // Network first, cache fallback for same-origin requests only
     event.respondWith(
         fetch(request)
@@ -0,0 +1,142 @@
+"""
+Synthetic, deterministic datasets for the pipeline benchmarks.
+
+Shapes mirror what the scrapers emit (see directives/scrape_events.md) and
+include the awkward cases the hot paths have to handle: multi-date runs,
+empty-venue duplicates, accented names, URLs with colons, and unquoted keys
+with trailing commas in the JS source.
+"""
+
+import json
+import random
+
+SIZES = [100, 1_000, 10_000]
+
+ARTISTS = [
+    "Carin León", "Los Angeles Azules", "Reik", "Kodak Black", "Grupo Bryndis",
+    "Emerson, Lake & Palmer", "Pop Punk Party Night", "Chingo's Love & Laughter",
+    "Mötley KRÜE", "Sand & Sound Festival", "Panter Belico", "Majo Aguilar",
+]
+VENUES = [
+    ("Payne Arena", "Hidalgo", "108 E Main St"),
+    ("Citrus Live", "Edinburg", "108 N 12th Ave"),
+    ("Cine El Rey", "McAllen", "311 S 17th St"),
+    ("Cameron County Amphitheater", "South Padre Island", "33174 State Park Rd 100"),
+    ("The Box Theater at Payne", "Hidalgo", "2600 N 10th St"),
+]
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+SUFFIX = {1: "st", 2: "nd", 3: "rd", 21: "st", 22: "nd", 23: "rd", 31: "st"}
+
+
+def make_events(n: int, seed: int = 42) -> list[dict]:
+    """Scraper-shaped events; ~10% multi-date runs, ~5% empty-venue duplicates."""
+    rng = random.Random(seed)
+    events = []
+    for i in range(n):
+        artist = f"{rng.choice(ARTISTS)} {i // 3}"
+        venue, city, _ = rng.choice(VENUES)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 28)
+        event = {
+            "artistName": artist,
+            "eventName": rng.choice(["", "Live in Concert", "Tour 2027", "Comedy Night"]),
+            "eventDate": f"2027-{month:02d}-{day:02d}T20:00:00",
+            "venueName": venue,
+            "venueCity": city,
+            "venueState": "TX",
+            "imageName": f"poster-{i}.webp",
+            "imageUrl": f"https://tixplug.com/wp-content/uploads/2027/{month:02d}/poster-{i}-768x1152.jpg",
+            "ticketUrl": f"https://tixplug.com/shop/event-{i}/",
+            "isPublished": True,
+            "source": rng.choice(["tixplug", "paynearena", "manual"]),
+        }
+        if rng.random() < 0.3:
+            event["schedule"] = [{"time": "7:30 PM", "description": "Doors Open"}]
+        events.append(event)
+        if rng.random() < 0.1:
+            events.append({**event, "eventDate": f"2027-{month:02d}-{min(day + 1, 28):02d}T20:00:00"})
+        if rng.random() < 0.05:
+            events.append({**event, "venueName": "", "venueCity": ""})
+    return events[:n]
+
+
+def make_js_source(events: list[dict], variable_name: str = "LOCAL_EVENTS") -> str:
+    """Render events the way hand-edited JS looks: unquoted keys and trailing commas."""
+    lines = ["/**", " * Events data", " */", f"export const {variable_name} = ["]
+    for event in events:
+        lines.append("    {")
+        for key, value in event.items():
+            lines.append(f"        {key}: {json.dumps(value, ensure_ascii=False)},")
+        lines.append("    },")
+    lines.append("];")
+    lines.append("")
+    lines.append("export const LOCAL_CLUBS = [];")
+    return "\n".join(lines)
+
+
+def make_event_texts(n: int, seed: int = 7) -> list[str]:
+    """TixPlug excerpt+content text blobs in the formats parse_event_details handles."""
+    rng = random.Random(seed)
+    texts = []
+    for i in range(n):
+        venue, city, street = rng.choice(VENUES)
+        day = rng.randint(1, 28)
+        date = f"{rng.choice(WEEKDAYS)}, {rng.choice(MONTHS)} {day}{SUFFIX.get(day, 'th')}, 2027"
+        style = i % 3
+        if style == 0:
+            text = (f"Date: {date} Location: {venue} – {street}, {city}, TX 78539 "
+                    f"Doors Open: 7:30 PM Show Starts: 8:30 PM")
+        elif style == 1:
+            text = f"Join us {date} for a night to remember! Venue: {venue} – {city}, TX Doors: 7:00 PM"
+        else:
+            text = f"{rng.choice(WEEKDAYS)}, {rng.choice(MONTHS)} {day} at {venue}. Showtime: 9:00 PM"
+        texts.append(text)
+    return texts
+
+
+def make_locations(n: int, seed: int = 11) -> list[str]:
+    """Raw TixPlug location strings, including the concatenated-name quirk."""
+    rng = random.Random(seed)
+    locations = []
+    for i in range(n):
+        venue, city, street = rng.choice(VENUES)
+        if i % 4 == 0:
+            locations.append(f"{venue}Inside Isla Blanca Park, {city}, TX 78597")
+        elif i % 4 == 1:
+            locations.append(f"{venue} — {city}, TX")
+        else:
+            locations.append(f"{venue} – {street}, {city}, TX 78501")
+    return locations
+
+
+def make_payne_html(n: int) -> str:
+    """Squarespace gallery markup with n Ticketmaster-linked event cards."""
+    cards = []
+    for i in range(n):
+        month = i % 12 + 1
+        day = i % 28 + 1
+        href = (f"https://www.ticketmaster.com/artist-{i}-tour-hidalgo-texas-"
+                f"{month:02d}-{day:02d}-2027/event/3A00{i:06X}?brand=payne")
+        img = f"https://images.squarespace-cdn.com/content/v1/5b98/{i}/poster.jpg"
+        cards.append(
+            f'<article class="Index-gallery-item"><a href="{href}"><img data-src="{img}"></a>'
+            f'<a href="{href}">Tickets</a></article>'
+        )
+    return f'<html><body><section>{"".join(cards)}</section></body></html>'
+
+
+def make_vendors(n: int, seed: int = 3, prefix: str = "Vendor") -> list[dict]:
+    """research_venues-shaped vendor entries."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"food-{i + 1}",
+            "name": f"{prefix} {i}",
+            "city": rng.choice(VENUES)[1],
+            "lat": 26.2 + rng.random() / 10,
+            "lng": -98.2 + rng.random() / 10,
+        }
+        for i in range(n)
+    ]
@@ -0,0 +1,32 @@
+"""
+Benchmark suite for the pipeline's CPU hot paths (pytest-benchmark).
+
+The default test run executes each benchmark once as a smoke test
+(--benchmark-disable in pytest.ini). To measure:
+
+    # Record a baseline for this machine
+    python -m pytest tests/benchmarks --benchmark-enable --benchmark-only --benchmark-save=baseline
+
+    # Regression gate: compare against the checked-in baseline, fail on a >25% mean regression
+    python -m pytest tests/benchmarks --benchmark-enable --benchmark-only \
+        --benchmark-compare=0001 --benchmark-compare-fail=mean:25%
+
+Baselines are JSON files under tests/benchmarks/baselines/<machine>/. When a
+change makes a hot path intentionally slower (or much faster), re-record
+0001_baseline.json in the same commit. Pull requests that touch execution/
+run the same gate in CI (.github/workflows/benchmarks.yml). There, the base
+branch is benchmarked on the same runner and used as the baseline; if the
+base branch has no benchmarks yet, CI runs them without a comparison.
+
+The datasets live in bench_data.py (not datasets.py, which would shadow the
+PyPI `datasets` package on sys.path).
+"""
+
+import pytest
+
+from bench_data import SIZES
+
+
+@pytest.fixture(params=SIZES, ids=lambda n: f"{n}")
+def size(request) -> int:
+    return request.param
@@ -0,0 +1,116 @@
+"""Benchmarks for parsing, dedupe, ID generation and data-file generation."""
+
+import shutil
+
+import pytest
+
+import js_parser
+import research_venues
+import run_metrics
+import scrape_paynearena
+import scrape_tixplug
+import sync_firestore
+import update_dtxent
+import venue_vendors
+from bench_data import (
+    make_event_texts,
+    make_events,
+    make_js_source,
+    make_locations,
+    make_payne_html,
+    make_vendors,
+)
+
+
+@pytest.mark.benchmark(group="js_parser.extract_js_array")
+def test_extract_js_array(benchmark, size):
+    events = make_events(size)
+    source = make_js_source(events)
+    result = benchmark(js_parser.extract_js_array, source, "LOCAL_EVENTS")
+    assert len(result) == size
+
+
+@pytest.mark.benchmark(group="js_parser._js_to_json")
+def test_js_to_json(benchmark, size):
+    source = make_js_source(make_events(size))
+    raw = source[source.index("["):source.index("];") + 1]
+    result = benchmark(js_parser._js_to_json, raw)
+    assert result.startswith("[")
+
+
+@pytest.mark.benchmark(group="update_dtxent.deduplicate_events")
+def test_deduplicate_events(benchmark, size):
+    events = make_events(size)
+    result = benchmark(update_dtxent.deduplicate_events, events)
+    assert 0 < len(result) <= size
+
+
+@pytest.fixture
+def events_data(tmp_path, monkeypatch):
+    """A scratch copy of events-data.js, with run metrics kept out of the repo's .tmp/."""
+    target = tmp_path / "events-data.js"
+    shutil.copy(update_dtxent.EVENTS_DATA_FILE, target)
+    monkeypatch.setattr(update_dtxent, "EVENTS_DATA_FILE", target)
+    monkeypatch.setattr(run_metrics, "METRICS_FILE", tmp_path / "run_metrics.json")
+    return target
+
+
+@pytest.mark.benchmark(group="update_dtxent.generate_events_data_js")
+def test_generate_events_data_js(benchmark, size, events_data, monkeypatch):
+    # The nearest-vendor lists are benchmarked on their own (test_venue_vendors_refresh),
+    # so this times only regenerating the arrays and the atomic write
+    events = make_events(size)
+    precomputed = venue_vendors.refresh(events, events_data)
+    monkeypatch.setattr(venue_vendors, "refresh", lambda *args: precomputed)
+    original = events_data.read_bytes()
+
+    def restore():
+        events_data.write_bytes(original)  # Otherwise later rounds only time the no-change comparison
+
+    written = benchmark.pedantic(update_dtxent.generate_events_data_js, args=(events,),
+                                 setup=restore, rounds=10, iterations=1)
+    assert written
+    assert len(js_parser.extract_js_array(events_data.read_text(encoding="utf-8"), "LOCAL_EVENTS")) == size
+
+
+@pytest.mark.benchmark(group="venue_vendors.refresh")
+def test_venue_vendors_refresh(benchmark, size, events_data):
+    events = make_events(size)
+    entries, stats = benchmark(venue_vendors.refresh, events, events_data)
+    assert len(entries) == stats["venues"]
+
+
+@pytest.mark.benchmark(group="scrape_tixplug.parse_event_details")
+def test_parse_event_details(benchmark, size):
+    texts = make_event_texts(size)
+    result = benchmark(lambda: [scrape_tixplug.parse_event_details(t) for t in texts])
+    assert sum(1 for d in result if "date_raw" in d) == size
+
+
+@pytest.mark.benchmark(group="scrape_tixplug.parse_venue_parts")
+def test_parse_venue_parts(benchmark, size):
+    locations = make_locations(size)
+    result = benchmark(lambda: [scrape_tixplug.parse_venue_parts(loc) for loc in locations])
+    assert all(parts["venueName"] for parts in result)
+
+
+@pytest.mark.benchmark(group="scrape_paynearena.parse_events")
+def test_paynearena_parse_events(benchmark, size):
+    html = make_payne_html(size)
+    result = benchmark(scrape_paynearena.parse_events, html)
+    assert len(result) == size
+
+
+@pytest.mark.benchmark(group="sync_firestore.generate_event_id")
+def test_generate_event_id(benchmark, size):
+    events = make_events(size)
+    result = benchmark(lambda: [sync_firestore.generate_event_id(e) for e in events])
+    assert len(result) == size
+
+
+@pytest.mark.benchmark(group="research_venues.filter_duplicates")
+def test_filter_duplicates(benchmark, size):
+    existing = make_vendors(size)
+    new_entries = make_vendors(size // 2, prefix="Vendor") + make_vendors(size // 2, seed=5, prefix="New Spot")
+    result = benchmark(research_venues.filter_duplicates, new_entries, existing)
+    assert len(result) >= size // 2 - 1
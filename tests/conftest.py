@@ -0,0 +1,17 @@
+"""Shared pytest setup: make the execution/ scripts importable as top-level modules."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+sys.path.insert(0, str(REPO_ROOT / "execution"))
+
+
+@pytest.fixture
+def scrapers_cassette() -> Path:
+    """Recorded TixPlug / Payne Arena / Ticketmaster / image CDN responses."""
+    return FIXTURES_DIR / "scrapers.json"
@@ -0,0 +1,33 @@
+"""Shared atomic writer: streamed chunks, modes, and cleanup on failure."""
+
+import os
+import stat
+
+import pytest
+
+from atomic_write import write_atomic
+
+
+def test_writes_bytes_text_and_chunks(tmp_path):
+    path = tmp_path / "out.txt"
+
+    write_atomic(path, b"old")
+    assert path.read_bytes() == b"old" and stat.S_IMODE(os.stat(path).st_mode) == 0o644
+
+    write_atomic(path, (chunk for chunk in ["a\r\n", b"b", "é"]), mode=0o600)
+    assert path.read_bytes() == "a\r\nbé".encode("utf-8")  # No newline translation
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_failed_write_keeps_the_old_file_and_no_temp(tmp_path):
+    path = tmp_path / "out.txt"
+    write_atomic(path, "old")
+
+    def chunks():
+        yield "partial"
+        raise RuntimeError("source failed")
+
+    with pytest.raises(RuntimeError):
+        write_atomic(path, chunks())
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
@@ -0,0 +1,27 @@
+"""Best-case compressed sizes: measured in memory, parallel, summarized for run metrics."""
+
+import gzip
+
+from compression_stats import compressed_sizes, measure, summarize
+
+
+def test_sizes_match_a_real_compression(tmp_path):
+    data = b'[{"artistName":"Bronco","venueName":"Payne Arena"}]' * 50
+
+    stats = compressed_sizes("events.abc.json", data)
+
+    assert stats["gzipBytes"] == len(gzip.compress(data, compresslevel=9, mtime=0))
+    assert stats["gzipBytes"] < stats["bytes"] and 0 < stats["gzipRatio"] < 1
+    if "br" in stats["encodings"]:
+        assert stats["brBytes"] < stats["bytes"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_measure_keeps_input_order_and_summarizes():
+    bundles = {f"d{i}.json": b"[]" * 100 * (i + 1) for i in range(3)}
+
+    stats = measure(bundles)
+
+    assert [s["file"] for s in stats] == list(bundles)
+    summary = summarize(stats)
+    assert summary["totalBytes"] == 1200 and summary["totalGzipBytes"] > 0
@@ -0,0 +1,35 @@
+"""Content-hashed data bundles: stable names, manifest refresh, stale cleanup, no compressed siblings."""
+
+import json
+
+from data_bundles import MANIFEST_NAME, write_bundles
+
+
+def test_unchanged_dataset_keeps_its_file(tmp_path):
+    datasets = {"events": [{"artistName": "A"}], "hotels": [{"name": "H"}]}
+    manifest, touched = write_bundles(datasets, tmp_path)
+    assert {p.name for p in touched} == {MANIFEST_NAME, *(entry["file"] for entry in manifest["datasets"].values())}
+    assert manifest["datasets"]["hotels"]["encodings"]["gzip"] > 0
+
+    hotels_file = manifest["datasets"]["hotels"]["file"]
+    old_events_file = manifest["datasets"]["events"]["file"]
+
+    datasets["events"].append({"artistName": "B"})
+    manifest, touched = write_bundles(datasets, tmp_path)
+
+    assert manifest["datasets"]["hotels"]["file"] == hotels_file
+    assert manifest["datasets"]["events"]["count"] == 2
+    new_events_file = manifest["datasets"]["events"]["file"]
+    assert {p.name for p in touched} == {MANIFEST_NAME, new_events_file, old_events_file}
+    assert not (tmp_path / old_events_file).exists()
+    assert not list(tmp_path.glob("*.gz")) and not list(tmp_path.glob("*.br"))
+
+    on_disk = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert on_disk == manifest
+
+
+def test_rerun_with_same_data_writes_nothing(tmp_path):
+    datasets = {"dining": [{"name": "Café", "cuisine": "Tex-Mex"}]}
+    write_bundles(datasets, tmp_path)
+    _, touched = write_bundles(datasets, tmp_path)
+    assert touched == []
@@ -0,0 +1,55 @@
+"""Run-to-run changesets: change classification, JSONL output and subscriber cursors."""
+
+import event_changes
+
+
+def _event(artist, venue, date, **extra):
+    return {"artistName": artist, "venueName": venue, "venueCity": "Hidalgo", "eventDate": date,
+            "ticketUrl": f"https://example.com/{artist}", "imageName": f"{artist.lower()}.webp", **extra}
+
+
+PREVIOUS = [
+    _event("Bronco", "Payne Arena", "2027-02-20T20:00:00"),
+    _event("Intocable", "Payne Arena", "2027-03-05T20:00:00"),
+    _event("Grupo Frontera", "Citrus Live", "2027-04-01T20:00:00"),
+    _event("Carin Leon", "Payne Arena", "2027-05-01T20:00:00"),
+    _event("Old Show", "Payne Arena", "2027-01-10T20:00:00"),
+]
+CURRENT = [
+    _event("Bronco", "Payne Arena", "2027-02-27T20:00:00"),                         # rescheduled
+    _event("Intocable", "Payne Arena", "2027-03-05T20:00:00", ticketUrl="https://t.co/x",
+           imageName="intocable_v2.webp"),                                           # ticket + image
+    _event("Grupo Frontera", "Bert Ogden Arena", "2027-04-01T20:00:00"),           # venue moved
+    _event("Carin Leon", "Payne Arena", "2027-05-01T20:00:00"),                    # unchanged
+    _event("New Act", "Citrus Live", "2027-06-01T20:00:00"),                       # added
+]
+
+
+def test_changes_are_classified():
+    changes = event_changes.diff_events(PREVIOUS, CURRENT)
+
+    assert event_changes.summarize(changes) == {
+        "rescheduled": 1, "venue_changed": 1, "ticket_url_changed": 1, "image_changed": 1, "added": 1, "removed": 1,
+    }
+    by_type = {c["type"]: c for c in changes}
+    assert by_type["rescheduled"]["previousKey"] == "bronco_2027-02-20_paynearena"
+    assert by_type["rescheduled"]["changes"] == {"eventDate": ["2027-02-20T20:00:00", "2027-02-27T20:00:00"]}
+    assert by_type["venue_changed"]["changes"]["venueName"] == ["Citrus Live", "Bert Ogden Arena"]
+    assert by_type["image_changed"]["changes"] == {"imageName": ["intocable.webp", "intocable_v2.webp"]}
+    assert by_type["added"]["key"] == "newact_2027-06-01_citruslive"
+    assert by_type["removed"]["key"] == "oldshow_2027-01-10_paynearena"
+
+
+def test_changeset_feed_and_cursors(tmp_path):
+    changes = event_changes.diff_events(PREVIOUS, CURRENT)
+    path = event_changes.write_changeset(changes, "20270102T000000", "20270101T000000", tmp_path)
+    event_changes.write_changeset([], "20270103T000000", "20270102T000000", tmp_path)
+
+    records = event_changes.read_changeset(path)
+    assert len(records) == len(changes)
+    assert records[0]["runId"] == "20270102T000000" and records[0]["previousRunId"] == "20270101T000000"
+
+    assert [run for run, _ in event_changes.pending("sync", tmp_path)] == ["20270102T000000", "20270103T000000"]
+    event_changes.ack("sync", "20270102T000000", tmp_path)
+    assert event_changes.pending("sync", tmp_path) == [("20270103T000000", [])]
+    assert len(event_changes.pending("social", tmp_path)) == 2
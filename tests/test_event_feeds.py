@@ -0,0 +1,85 @@
+"""Read-model feeds: grouping like processEventsForDisplay, no-op republish, stale cleanup, empty-load guard."""
+
+from datetime import datetime
+
+import pytest
+
+import sync_firestore_ci
+from event_feeds import build_feeds, publish_feeds
+from firestore_client import FakeFirestore
+
+NOW = datetime(2027, 1, 15, 12, 0)
+
+
+def _event(artist, venue, city, date, **extra):
+    return {"artistName": artist, "venueName": venue, "venueCity": city, "venueState": "TX",
+            "eventDate": date, "ticketUrl": f"https://example.com/{artist}/{date[:10]}",
+            "imageName": f"{artist.lower()}.webp", "isPublished": True, **extra}
+
+
+EVENTS = [
+    _event("Bronco", "Payne Arena", "Hidalgo", "2027-02-20T20:00:00"),
+    _event("Bronco", "Payne Arena", "Hidalgo", "2027-02-21T20:00:00"),
+    _event("Intocable", "Citrus Live", "Edinburg", "2027-03-05T20:00:00"),
+    _event("Old Show", "Payne Arena", "Hidalgo", "2027-01-10T20:00:00"),
+    _event("Draft", "Citrus Live", "Edinburg", "2027-03-06T20:00:00", isPublished=False),
+]
+DOC_IDS = [f"doc{i}" for i in range(len(EVENTS))]
+
+
+def test_feeds_group_multi_date_runs_and_drop_past():
+    feeds = build_feeds(EVENTS, DOC_IDS, now=NOW)
+
+    upcoming = feeds["upcoming"]["events"]
+    assert [e["artistName"] for e in upcoming] == ["Bronco", "Intocable"]
+    bronco = upcoming[0]
+    assert [d["eventDate"] for d in bronco["dates"]] == ["2027-02-20T20:00:00", "2027-02-21T20:00:00"]
+    assert (bronco["displayMonth"], bronco["displayDay"], bronco["imageUrl"]) == ("FEB", 20, "assets/bronco.webp")
+    assert bronco["slug"] == "bronco-payne-arena-2027-02-20"
+
+    assert set(feeds) == {"upcoming", "by-city-hidalgo", "by-city-edinburg", "by-month-2027-02", "by-month-2027-03"}
+    assert feeds["by-month-2027-03"]["label"] == "March 2027"
+    assert [c["slug"] for c in feeds["upcoming"]["cities"]] == ["edinburg", "hidalgo"]
+
+
+def test_feed_image_matches_process_events_for_display():
+    base = _event("Bronco", "Payne Arena", "Hidalgo", "2027-02-20T20:00:00", imageName="posters/abc.webp")
+    cases = [
+        ({"imageUrl": "../assets/bronco.webp"}, "assets/bronco.webp"),
+        ({"imageUrl": "https://cdn.example.com/bronco.jpg"}, "https://cdn.example.com/bronco.jpg"),
+        ({}, "assets/posters/abc.webp"),
+    ]
+    for extra, expected in cases:
+        feed = build_feeds([{**base, **extra}], ["doc0"], now=NOW)
+        assert feed["upcoming"]["events"][0]["imageUrl"] == expected
+
+
+def test_publish_skips_unchanged_and_deletes_stale_feeds():
+    db = FakeFirestore()
+    assert publish_feeds(db, EVENTS, DOC_IDS, now=NOW) == {"written": 5, "unchanged": 0, "deleted": 0}
+
+    db.reset_stats()
+    assert publish_feeds(db, EVENTS, DOC_IDS, now=NOW) == {"written": 0, "unchanged": 5, "deleted": 0}
+    assert db.stats.writes == 0
+    assert db.stats.round_trips == 2  # upcoming get + one get_all
+
+    # Intocable leaves the list: its city and month feeds go away
+    stats = publish_feeds(db, EVENTS[:2], DOC_IDS[:2], now=NOW)
+    assert stats == {"written": 1, "unchanged": 2, "deleted": 2}
+    assert not db.document("feeds/by-city-edinburg").get().exists
+    assert db.document("feeds/upcoming").get().to_dict()["count"] == 1
+
+
+def test_empty_or_unparseable_events_never_reach_the_feeds(tmp_path, monkeypatch):
+    db = FakeFirestore()
+    publish_feeds(db, EVENTS, DOC_IDS, now=NOW)
+    with pytest.raises(ValueError):
+        publish_feeds(db, [], [], now=NOW)
+    assert db.document("feeds/by-city-edinburg").get().exists
+
+    events_js = tmp_path / "events-data.js"
+    monkeypatch.setattr(sync_firestore_ci, "EVENTS_JS", events_js)
+    for broken in ('export const LOCAL_EVENTS = [{"artistName": "A",, }];', "export const LOCAL_EVENTS = [];"):
+        events_js.write_text(broken, encoding="utf-8")
+        with pytest.raises(ValueError):
+            sync_firestore_ci.load_events_from_js()
@@ -0,0 +1,45 @@
+"""SQLite event store: WAL mode, raw rows per run, merged upserts and per-run snapshots."""
+
+import event_store
+
+
+def _event(artist, venue, city, date, source="tixplug", **extra):
+    return {"artistName": artist, "venueName": venue, "venueCity": city, "eventDate": date,
+            "ticketUrl": f"https://example.com/{artist}", "source": source, **extra}
+
+
+def test_raw_rows_are_queryable_by_source_city_and_missing_venue(tmp_path):
+    conn = event_store.connect(tmp_path / "store.db")
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    run_id = event_store.start_run(conn, "20270101T000000")
+    event_store.record_raw_events(conn, run_id, [
+        _event("Bronco", "Payne Arena", "Hidalgo", "2027-02-20T20:00:00", source="paynearena"),
+        _event("Intocable", "Allen Event Center", "Allen", "2027-03-05T20:00:00"),
+        _event("Mystery", "", None, "2027-03-01T20:00:00"),
+    ])
+
+    assert [e["artistName"] for e in event_store.raw_events(conn, source="tixplug", city="Allen")] == ["Intocable"]
+    assert [e["artistName"] for e in event_store.raw_events(conn, source="tixplug", missing_venue=True)] == ["Mystery"]
+    assert event_store.raw_events(conn, source="ticketmaster") == []
+
+
+def test_upserts_keep_one_row_per_key_and_snapshot_each_run(tmp_path):
+    conn = event_store.connect(tmp_path / "store.db")
+    bronco = _event("Bronco", "Payne Arena", "Hidalgo", "2027-02-20T20:00:00")
+
+    first = event_store.start_run(conn, "20270101T000000")
+    assert event_store.upsert_events(conn, first, [bronco]) == {"events": 1, "newVersions": 1}
+
+    second = event_store.start_run(conn, "20270102T000000")
+    moved = {**bronco, "ticketUrl": "https://example.com/new"}
+    assert event_store.upsert_events(conn, second, [moved]) == {"events": 1, "newVersions": 1}
+
+    third = event_store.start_run(conn, "20270103T000000")
+    assert event_store.upsert_events(conn, third, [moved]) == {"events": 1, "newVersions": 0}
+
+    row = conn.execute("SELECT event_key, ticket_url, first_seen FROM events").fetchall()
+    assert [(r["event_key"], r["ticket_url"]) for r in row] == [("bronco_2027-02-20_paynearena", "https://example.com/new")]
+    assert event_store.previous_run_id(conn, second) == first
+    assert event_store.snapshot(conn, first)["bronco_2027-02-20_paynearena"]["ticketUrl"] == "https://example.com/Bronco"
+    assert event_store.stats(conn)["event_versions"] == 2
@@ -0,0 +1,113 @@
+"""Read/write budgets for the Firestore sync path, measured against the in-process fake."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import firestore_client  # noqa: E402
+import sync_firestore  # noqa: E402
+from firestore_client import FakeFirestore, NotFound  # noqa: E402
+from load_test_firestore_sync import run_load_test, use_fake  # noqa: E402
+
+N_EVENTS = 1_000
+
+
+def _reset_clients():
+    """Drop the injected client and sync_firestore's cached one, so later tests start clean."""
+    firestore_client.set_client(None)
+    sync_firestore._db = None
+    sync_firestore._initialized = False
+
+
+@pytest.fixture(scope="module")
+def phases() -> dict:
+    try:
+        yield {row["phase"]: row for row in run_load_test(N_EVENTS)}
+    finally:
+        _reset_clients()
+
+
+@pytest.fixture
+def fake_db() -> FakeFirestore:
+    db = FakeFirestore()
+    use_fake(db)
+    try:
+        yield db
+    finally:
+        _reset_clients()
+
+
+def test_initial_sync_budget(phases):
+    row = phases["sync (initial)"]
+    assert row["reads"] <= N_EVENTS
+    # One event document plus one slugs/{slug} pointer per event
+    assert row["writes"] == 2 * N_EVENTS
+    assert row["commits"] == 4
+    assert row["maxBatchSize"] <= 500
+
+
+def test_resync_budget(phases):
+    row = phases["sync (no changes)"]
+    assert row["reads"] <= N_EVENTS
+    assert row["writes"] <= N_EVENTS
+
+
+def test_mark_closed_only_touches_past_events(phases):
+    row = phases["mark_closed_events"]
+    assert row["writes"] == N_EVENTS // 10
+    assert row["reads"] == N_EVENTS // 10
+
+
+def test_scrape_log_is_single_write(phases):
+    assert phases["write_scrape_log"]["writes"] == 1
+    assert phases["write_scrape_log"]["roundTrips"] == 1
+
+
+def test_ci_sync_budget(phases):
+    row = phases["ci sync (initial)"]
+    assert row["reads"] <= N_EVENTS
+    assert row["writes"] == 2 * N_EVENTS
+
+
+def test_sync_writes_slug_lookup_keys(fake_db):
+    from load_test_firestore_sync import make_events
+
+    db = fake_db
+    events = make_events(6, past_fraction=0)
+    events[3]["artistName"] = events[0]["artistName"]  # Same artist, same venue (i % 3)
+    sync_firestore.sync_events_to_firestore(events)
+
+    doc_id = sync_firestore.generate_event_id(events[0])
+    doc = db.collection("events").document(doc_id).get().to_dict()
+    assert doc["slug"] == f"load-test-artist-0-payne-arena-{doc['dateKey']}"
+    assert (doc["artistSlug"], doc["venueSlug"]) == ("load-test-artist-0", "payne-arena")
+    assert doc["relatedByArtist"] == [sync_firestore.generate_event_id(events[3])]
+    assert doc["relatedByVenue"] == []  # The only other Payne Arena show is the same artist
+
+    pointer = db.collection("slugs").document(doc["slug"]).get().to_dict()
+    assert pointer["eventId"] == doc_id
+
+    # Unchanged slugs are not rewritten on the next sync
+    db.reset_stats()
+    sync_firestore.sync_events_to_firestore(events)
+    assert db.stats.writes == len(events)
+
+    # A rename that keeps the document id moves the pointer and drops the old one
+    events[0]["artistName"] = "LoadTest Artist 0"
+    sync_firestore.sync_events_to_firestore(events)
+    renamed = db.collection("events").document(doc_id).get().to_dict()
+    assert renamed["slug"] == f"loadtest-artist-0-payne-arena-{doc['dateKey']}"
+    assert db.collection("slugs").document(renamed["slug"]).get().to_dict()["eventId"] == doc_id
+    assert not db.collection("slugs").document(doc["slug"]).get().exists
+
+
+def test_fake_batch_update_requires_existing_doc():
+    db = FakeFirestore()
+    batch = db.batch()
+    batch.update(db.collection("events").document("missing"), {"isClosed": True})
+    with pytest.raises(NotFound):
+        batch.commit()
+    assert db.stats.writes == 0
@@ -0,0 +1,80 @@
+"""Gemini wrapper: lenient JSON parsing, streamed array elements, retries and call metrics."""
+
+import pytest
+
+from gemini_client import ArrayStreamParser, GeminiClient, parse_json, repair_json
+
+
+def test_parse_json_strips_fences_and_repairs_truncation():
+    assert parse_json('```json\n[{"name": "A"}]\n```') == ([{"name": "A"}], False)
+    assert parse_json('Here you go: {"caption": "hi"}') == ({"caption": "hi"}, False)
+
+    # Cut off mid-item: complete items survive, the partial one is dropped
+    truncated = '[{"name": "A", "features": ["x", "y"]}, {"name": "B, \\"the\\" best"}, {"name": "C", "ci'
+    assert repair_json(truncated) == [{"name": "A", "features": ["x", "y"]}, {"name": 'B, "the" best'}]
+    assert repair_json('{"caption": "Fire 🔥", "short_caption": "Fi') == {"caption": "Fire 🔥"}
+    with pytest.raises(ValueError):
+        repair_json("no json here")
+
+
+def test_array_stream_parser_emits_elements_as_they_complete():
+    parser = ArrayStreamParser()
+    chunks = ['```json\n[\n  {"name": "A", "tags": ["[x]", "{y}"]', '},\n  {"na', 'me": "B"}', ", 3, null", "\n]\n```"]
+
+    emitted = [parser.feed(chunk) for chunk in chunks]
+
+    assert emitted == [[], [{"name": "A", "tags": ["[x]", "{y}"]}], [{"name": "B"}], [3], [None]]
+    assert ArrayStreamParser().feed('{"caption": "not an array"}') == []
+
+
+def test_retries_transient_errors_and_records_metrics():
+    class Unavailable(Exception):
+        code = 503
+
+    client = GeminiClient(client=object(), backoff=0)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise Unavailable("busy")
+        return "ok", {"promptTokens": 10, "outputTokens": 5, "totalTokens": 15}
+
+    assert client._with_retries("caption", "m", flaky)[0] == "ok"
+    with pytest.raises(KeyError):
+        client._with_retries("bad", "m", lambda: {}["missing"])  # Not transient: no retry
+
+    metrics = client.metrics()
+    assert (metrics["calls"], metrics["failed"], metrics["retries"], metrics["totalTokens"]) == (2, 1, 1, 15)
+    assert "1 failed" in client.summary()
+
+
+def test_stream_failing_after_delivered_items_is_not_retried():
+    pytest.importorskip("google.genai")
+
+    class Unavailable(Exception):
+        code = 503
+
+    class Chunk:
+        usage_metadata = None
+
+        def __init__(self, text):
+            self.text = text
+
+    class Models:
+        calls = 0
+
+        def generate_content_stream(self, **kwargs):
+            Models.calls += 1
+            yield Chunk('[{"name": "A"}, ')
+            raise Unavailable("connection reset")
+
+    class FakeGenai:
+        models = Models()
+
+    delivered = []
+    client = GeminiClient(client=FakeGenai(), backoff=0)
+    with pytest.raises(RuntimeError, match="after 1 item"):
+        client.generate_json("prompt", model="m", on_item=delivered.append)
+
+    assert delivered == [{"name": "A"}] and Models.calls == 1
@@ -0,0 +1,51 @@
+"""Vendor spatial index: same-place detection, kNN queries, dedupe through research_venues."""
+
+import random
+
+import research_venues
+from geo_index import GeoIndex, entry_city, haversine_m
+
+PAYNE_ARENA = (26.2168, -98.1773)
+
+
+def test_haversine_is_in_meters():
+    assert abs(haversine_m(26.2034, -98.2300, 26.3017, -98.1633) - 12_760) < 100
+
+
+def test_find_duplicate_fuzzy_names_need_proximity_and_matching_numbers():
+    index = GeoIndex([
+        {"name": "Santa Fe Steakhouse & Cantina", "city": "McAllen", "lat": 26.2401, "lng": -98.2205},
+        {"name": "New Spot 41", "city": "McAllen", "lat": 26.2000, "lng": -98.2000},
+        {"name": "La Doble M", "address": "McAllen, TX"},  # dining entries carry no coordinates
+    ])
+
+    assert index.find_duplicate({"name": "Santa Fe Steakhouse and Cantina", "city": "", "lat": 26.2402, "lng": -98.2204})
+    assert index.find_duplicate({"name": "Santa Fe Steak House Cantina", "city": "Edinburg", "lat": 26.2402, "lng": -98.2204})
+    assert index.find_duplicate({"name": "Santa Fe Steakhouse Cantina", "city": "McAllen", "lat": 26.30, "lng": -98.16}) is None
+    assert index.find_duplicate({"name": "New Spot 49", "city": "McAllen", "lat": 26.2001, "lng": -98.2001}) is None
+    assert index.find_duplicate({"name": "la doble m", "city": "McAllen", "lat": 26.2, "lng": -98.2})["address"] == "McAllen, TX"
+    assert index.find_duplicate({"name": "La Doble M", "city": "Brownsville"}) is None
+    assert entry_city({"address": "704 E Griffin Pkwy, McAllen, TX 78501"}) == "mcallen"
+
+
+def test_nearest_matches_brute_force():
+    rng = random.Random(7)
+    vendors = [{"name": f"V{i}", "lat": 26.1 + rng.random() * 0.3, "lng": -98.4 + rng.random() * 0.4} for i in range(400)]
+    vendors.append({"name": "No coords"})
+    index = GeoIndex(vendors, cell_m=300)
+
+    expected = sorted(vendors[:-1], key=lambda v: haversine_m(*PAYNE_ARENA, v["lat"], v["lng"]))
+    nearest = index.nearest(*PAYNE_ARENA, k=8)
+    assert [v["name"] for _, v in nearest] == [v["name"] for v in expected[:8]]
+    assert all(d <= 1000 for d, _ in index.nearest(*PAYNE_ARENA, k=50, max_m=1000))
+    assert index.nearest(10.0, 10.0, k=3)  # Far outside the grid still finds something
+
+
+def test_filter_duplicates_dedupes_against_site_and_itself():
+    existing = [{"name": "Nonna's", "city": "McAllen", "lat": 26.19, "lng": -98.23}]
+    new = [
+        {"name": "Nonnas", "city": "", "lat": 26.1901, "lng": -98.2301},
+        {"name": "Taqueria El Pato", "city": "Hidalgo", "lat": 0, "lng": 0},
+        {"name": "Taquería el Pato", "city": "Hidalgo", "lat": 0, "lng": 0},
+    ]
+    assert [e["name"] for e in research_venues.filter_duplicates(new, existing)] == ["Taqueria El Pato"]
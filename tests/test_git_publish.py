@@ -0,0 +1,80 @@
+"""Manifest-scoped git publishing: no-op runs skip git, only recorded paths are committed, failed pushes recover."""
+
+import subprocess
+
+import pytest
+
+import git_publish
+
+
+def _git(cwd, *args):
+    return subprocess.run(["git", "-C", str(cwd), *args], check=True, capture_output=True, text=True).stdout
+
+
+def _repo(tmp_path, monkeypatch):
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "test@example.com")
+    remote, work = tmp_path / "remote.git", tmp_path / "work"
+    subprocess.run(["git", "init", "--quiet", "--bare", "-b", "main", str(remote)], check=True)
+    subprocess.run(["git", "init", "--quiet", "-b", "main", str(work)], check=True)
+    (work / "events.html").write_text("old\n")
+    (work / "stale.html").write_text("stale\n")
+    _git(work, "add", ".")
+    _git(work, "commit", "--quiet", "-m", "init")
+    _git(work, "remote", "add", "origin", str(remote))
+    _git(work, "push", "--quiet", "origin", "main")
+    return remote, work
+
+
+def test_manifest_records_unique_relative_paths(tmp_path):
+    manifest = tmp_path / "publish_manifest.json"
+    git_publish.start_run(manifest)
+    git_publish.record([tmp_path / "js" / "events-data.js"], manifest, repo_dir=tmp_path)
+    assert git_publish.record([tmp_path / "js" / "events-data.js", "events.html"], manifest, repo_dir=tmp_path) == 2
+    assert git_publish.load(manifest)["paths"] == ["js/events-data.js", "events.html"]
+
+
+def test_empty_manifest_never_runs_git(tmp_path):
+    # tmp_path is not a repository: any git call would fail
+    assert git_publish.publish([], "msg", tmp_path) == {"status": "noop", "files": 0}
+
+
+def test_publish_commits_only_manifest_paths(tmp_path, monkeypatch):
+    remote, work = _repo(tmp_path, monkeypatch)
+    (work / "events.html").write_text("new\n")
+    (work / "stale.html").unlink()
+    (work / "unrelated.txt").write_text("leave me alone\n")
+
+    result = git_publish.publish(["events.html", "stale.html", "never-written.html"], "update", work)
+
+    assert result == {"status": "pushed", "files": 2}
+    assert _git(remote, "show", "--name-status", "--format=", "main").split() == ["M", "events.html", "D", "stale.html"]
+    assert "unrelated.txt" in _git(work, "status", "--porcelain")
+
+    # Rewritten but byte-identical: nothing to commit
+    (work / "events.html").write_text("new\n")
+    assert git_publish.publish(["events.html"], "update", work)["status"] == "noop"
+
+
+def test_unpublished_paths_carry_over_and_unpushed_commits_are_pushed(tmp_path, monkeypatch):
+    remote, work = _repo(tmp_path, monkeypatch)
+    manifest = tmp_path / "publish_manifest.json"
+    git_publish.start_run(manifest)
+    git_publish.record(["events.html"], manifest, repo_dir=work)
+    (work / "events.html").write_text("new\n")
+
+    # Committed, then the push fails: the run never marks the manifest published
+    _git(work, "remote", "set-url", "origin", str(tmp_path / "missing.git"))
+    with pytest.raises(subprocess.CalledProcessError):
+        git_publish.publish(git_publish.load(manifest)["paths"], "update", work)
+    _git(work, "remote", "set-url", "origin", str(remote))
+
+    # Next run writes nothing new, but inherits the path and pushes the stranded commit
+    assert git_publish.start_run(manifest) == 1
+    result = git_publish.publish(git_publish.load(manifest)["paths"], "update", work)
+    assert result == {"status": "pushed", "files": 0}
+    assert _git(remote, "show", "main:events.html") == "new\n"
+
+    git_publish.mark_published(manifest)
+    assert git_publish.start_run(manifest) == 0
@@ -0,0 +1,87 @@
+"""Offline replay of the scraper fixtures through http_replay."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+
+import http_replay
+import scrape_paynearena
+import scrape_ticketmaster
+import scrape_tixplug
+
+
+def run_tixplug() -> list[dict]:
+    products = scrape_tixplug.fetch_all_products()
+    return [e for e in (scrape_tixplug.process_product(p) for p in products) if e]
+
+
+def test_replay_serves_all_sources(scrapers_cassette):
+    with http_replay.use_cassette(scrapers_cassette) as adapter:
+        tixplug = run_tixplug()
+        payne = scrape_paynearena.parse_events(scrape_paynearena.fetch_page(scrape_paynearena.URL))
+        tm = scrape_ticketmaster.fetch_venue_events(scrape_ticketmaster.VENUES[0], "test-key")
+        poster = requests.get(tixplug[0]["imageUrl"], timeout=5)
+
+    assert len(tixplug) == 3
+    assert tixplug[0]["venueName"] == "Citrus Live"
+    assert [e["artistName"] for e in payne] == ["Reik", "Kodak Black", "Emerson, Lake & Palmer"]
+    assert len(tm) == 3
+    assert poster.headers["Content-Type"] == "image/jpeg"
+    assert poster.content[:2] == b"\xff\xd8"
+    assert adapter.misses == []
+
+
+def test_unrecorded_request_fails_like_offline(scrapers_cassette):
+    with http_replay.use_cassette(scrapers_cassette) as adapter:
+        with pytest.raises(requests.ConnectionError):
+            requests.get("https://example.com/not-recorded", timeout=5)
+    assert adapter.misses == ["GET https://example.com/not-recorded"]
+
+
+@pytest.mark.parametrize("factor", [10, 100])
+def test_scaled_catalogs(scrapers_cassette, factor):
+    with http_replay.use_cassette(scrapers_cassette, scale=factor) as adapter:
+        tixplug = run_tixplug()
+        payne = scrape_paynearena.parse_events(scrape_paynearena.fetch_page(scrape_paynearena.URL))
+        tm = scrape_ticketmaster.fetch_venue_events(scrape_ticketmaster.VENUES[0], "test-key")
+
+    assert len(tixplug) == 3 * factor
+    assert len({e["ticketUrl"] for e in tixplug}) == 3 * factor
+    assert all(e["imageUrl"] for e in tixplug)
+    assert len({e["artistName"] for e in payne}) == 3 * factor
+    assert len({e["tmEventId"] for e in tm}) == 3 * factor
+    assert adapter.misses == []
+
+
+def test_record_then_replay(tmp_path):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps({"path": self.path.split("?")[0]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", '"abc"')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/feed?page=2&apikey=secret"
+    cassette = tmp_path / "recorded.json"
+    try:
+        with http_replay.use_cassette(cassette, mode="record"):
+            live = requests.get(url, timeout=5).json()
+    finally:
+        server.shutdown()
+
+    assert "secret" not in cassette.read_text(encoding="utf-8")
+    with http_replay.use_cassette(cassette):
+        replayed = requests.get(url, timeout=5)
+    assert replayed.json() == live
+    assert replayed.headers["ETag"] == '"abc"'
@@ -0,0 +1,94 @@
+"""Streaming poster fetch: size cap, ETag revalidation, revalidation interval and downscaled JPEG decode."""
+
+import io
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from PIL import Image
+
+import image_fetch
+import update_dtxent
+from poster_store import MAX_EDGE, PosterStore
+
+
+def _jpeg(size, color="red") -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", size, color).save(out, "JPEG")
+    return out.getvalue()
+
+
+@pytest.fixture
+def image_server():
+    """Serves /poster.jpg with an ETag (honoring If-None-Match) and counts full responses."""
+    state = {"body": _jpeg((3000, 4500)), "etag": '"v1"', "full": 0, "requests": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["requests"] += 1
+            if self.headers.get("If-None-Match") == state["etag"]:
+                self.send_response(304)
+                self.end_headers()
+                return
+            state["full"] += 1
+            self.send_response(200)
+            self.send_header("Content-Type", "image/jpeg")
+            self.send_header("Content-Length", str(len(state["body"])))
+            self.send_header("ETag", state["etag"])
+            self.end_headers()
+            self.wfile.write(state["body"])
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}/poster.jpg"
+    yield state
+    server.shutdown()
+
+
+def test_fetch_revalidates_and_stores_downscaled_poster(tmp_path, image_server):
+    store = PosterStore(tmp_path / "posters")
+    index = {}
+    url = image_server["url"]
+
+    result = image_fetch.fetch(url, index)
+    assert result["status"] == "fetched" and result["bytes"] == len(image_server["body"])
+    with result["file"] as fp:
+        name = store.put_file(fp, result["hash"], "poster.jpg", url)
+    with Image.open(tmp_path / name) as poster:
+        assert max(poster.size) == MAX_EDGE
+    assert index[url].pop("checkedAt") > 0
+    assert index[url] == {"etag": '"v1"', "lastModified": None, "hash": result["hash"]}
+
+    # Unchanged on the server: 304, no body transferred
+    again = image_fetch.fetch(url, index, conditional=store.has(index[url]["hash"]))
+    assert again == {"status": "not_modified", "hash": result["hash"]}
+    assert image_server["full"] == 1
+
+    # Poster replaced upstream under the same URL
+    image_server.update(body=_jpeg((400, 600), "blue"), etag='"v2"')
+    changed = image_fetch.fetch(url, index)
+    changed["file"].close()
+    assert changed["status"] == "fetched" and changed["hash"] != result["hash"]
+
+
+def test_fetch_enforces_size_limit(image_server):
+    with pytest.raises(image_fetch.ImageTooLarge):
+        image_fetch.fetch(image_server["url"], {}, max_bytes=1024)
+
+
+def test_recently_checked_posters_are_reused_without_a_request(tmp_path, image_server, monkeypatch):
+    store = PosterStore(tmp_path / "posters")
+    index = {}
+    url = image_server["url"]
+    name = update_dtxent.download_image(store, index, url, "poster.jpg")
+    assert image_server["requests"] == 1
+
+    assert update_dtxent.download_image(store, index, url, "poster.jpg") == name
+    assert image_server["requests"] == 1  # Fresh: no request at all
+
+    monkeypatch.setattr(image_fetch, "REVALIDATE_AFTER", 0)
+    assert update_dtxent.download_image(store, index, url, "poster.jpg") == name
+    assert (image_server["requests"], image_server["full"]) == (2, 1)  # Stale: a 304 revalidation
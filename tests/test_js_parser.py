@@ -0,0 +1,63 @@
+"""Array scanning and in-place regeneration of JS data files."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+import js_parser
+
+EVENTS_DATA = Path(__file__).resolve().parent.parent / "js" / "events-data.js"
+
+
+def test_array_span_ignores_brackets_in_strings_and_comments():
+    content = (
+        'export const LOCAL_EVENTS = [\n'
+        '    {tags: [\'a]\', "b"]}, // ] trailing\n'
+        '    /* ]; */ {x: `]`},\n'
+        '];\n'
+        'export const LOCAL_CLUBS = [];\n'
+    )
+    start, end = js_parser.find_js_array_span(content, "LOCAL_EVENTS")
+    assert content[end:].startswith(";\nexport const LOCAL_CLUBS")
+
+
+def test_extract_handles_closing_sequence_inside_strings():
+    content = (
+        'export const LOCAL_EVENTS = [\n'
+        '    {artistName: "Live ];-) [Reunion]", eventName: "Say \\"];\\" twice",},\n'
+        '];\n'
+    )
+    events = js_parser.extract_js_array(content, "LOCAL_EVENTS")
+    assert events == [{"artistName": "Live ];-) [Reunion]", "eventName": 'Say "];" twice'}]
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    target = tmp_path / "events-data.js"
+    shutil.copy(EVENTS_DATA, target)
+    return target
+
+
+def test_write_replaces_only_the_named_array(data_file):
+    before = js_parser.load_events_data(data_file)
+    new_events = [{"artistName": "Closing ]; Bracket", "eventDate": "2027-01-01T20:00:00"}]
+
+    assert js_parser.write_js_arrays(data_file, {"LOCAL_EVENTS": new_events}) is True
+
+    after = js_parser.load_events_data(data_file)
+    assert after["events"] == new_events
+    for key in ("clubs", "restaurants", "dining", "hotels"):
+        assert after[key] == before[key]
+    assert list(data_file.parent.iterdir()) == [data_file]
+
+
+def test_identical_output_skips_write(data_file):
+    events = js_parser.load_events_data(data_file)["events"]
+    js_parser.write_js_arrays(data_file, {"LOCAL_EVENTS": events}, {"Sources": "tixplug.com"})
+    written = data_file.read_bytes()
+    mtime = data_file.stat().st_mtime_ns
+
+    assert js_parser.write_js_arrays(data_file, {"LOCAL_EVENTS": events}, {"Sources": "tixplug.com"}) is False
+    assert data_file.read_bytes() == written
+    assert data_file.stat().st_mtime_ns == mtime
@@ -0,0 +1,51 @@
+"""Content-addressed posters: skip-if-known, cross-name dedupe, changed posters, GC."""
+
+import io
+
+from PIL import Image
+
+from poster_store import PosterStore
+
+
+def _jpeg(color) -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", (40, 60), color).save(out, "JPEG")
+    return out.getvalue()
+
+
+def test_same_bytes_under_two_names_are_stored_once(tmp_path):
+    store = PosterStore(tmp_path / "assets" / "posters")
+    first = store.put(_jpeg("red"), "payne-bronco.jpg", "https://a.example/bronco.jpg")
+    second = store.put(_jpeg("red"), "bronco-tour.jpg", "https://b.example/bronco.jpg")
+
+    assert first == second and first.startswith("posters/") and first.endswith(".webp")
+    assert store.stats == {"known": 0, "deduplicated": 1, "converted": 1}
+    assert store.save() and not store.save()
+
+    reopened = PosterStore(tmp_path / "assets" / "posters")
+    assert reopened.lookup("payne-bronco.jpg", "https://a.example/bronco.jpg") == first
+    assert reopened.lookup("payne-bronco.jpg", "https://a.example/bronco-v2.jpg") is None
+
+    # A new flyer under an old name gets a new object
+    assert reopened.put(_jpeg("blue"), "payne-bronco.jpg", "https://a.example/bronco-v2.jpg") != first
+
+
+def test_gc_reports_and_prunes_orphans(tmp_path):
+    assets = tmp_path / "assets"
+    store = PosterStore(assets / "posters")
+    live = store.put(_jpeg("red"), "live.jpg")
+    dead = store.put(_jpeg("green"), "dead.jpg")
+    store.save()
+    (assets / "old-flyer.jpg").write_bytes(_jpeg("black"))
+    (assets / "dtxent-logo.png").write_bytes(b"png")
+    (tmp_path / "index.html").write_text('<img src="assets/dtxent-logo.png">')
+
+    report = store.gc({live}, site_dir=tmp_path)
+    assert report["orphanPosters"] == [dead.split("/")[1]]
+    assert report["legacyAssets"] == ["old-flyer.jpg"]
+    assert report["pruned"] == []
+
+    report = store.gc({live}, prune=True, site_dir=tmp_path)
+    assert not (assets / dead).exists() and (assets / live).exists()
+    assert (assets / "old-flyer.jpg").exists()  # legacy files only go with legacy=True
+    assert set(PosterStore(assets / "posters").index["names"]) == {"live.jpg"}
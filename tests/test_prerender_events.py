@@ -0,0 +1,68 @@
+"""Static event pages: slug parity with helpers.toSlug, incremental rebuilds, pruning."""
+
+from datetime import datetime
+
+from prerender_events import prerender, to_slug
+
+NOW = datetime(2027, 1, 15, 12, 0)
+
+
+def _events():
+    return [
+        {"artistName": "Café Tacvba", "venueName": "Payne Arena", "venueCity": "Hidalgo",
+         "eventDate": "2027-03-01T20:00:00", "ticketUrl": "https://example.com/a", "isPublished": True},
+        {"artistName": "Café Tacvba", "venueName": "Payne Arena", "venueCity": "Hidalgo",
+         "eventDate": "2027-03-02T20:00:00", "ticketUrl": "https://example.com/b", "isPublished": True},
+        {"artistName": "Draft", "venueName": "Payne Arena", "eventDate": "2027-04-01T20:00:00",
+         "isPublished": False},
+    ]
+
+
+def _run(tmp_path, events, now=NOW):
+    return prerender(events, tmp_path / "events", tmp_path / "events.html", tmp_path / "sitemap.xml", now=now)
+
+
+def test_to_slug_folds_accents_like_helpers():
+    assert to_slug("Café Tacvba & Ñandú") == "cafe-tacvba-nandu"
+    assert to_slug("  --Emerson, Lake & Palmer--") == "emerson-lake-palmer"
+
+
+def test_renders_published_pages_index_and_sitemap(tmp_path):
+    stats = _run(tmp_path, _events())
+
+    assert stats["rendered"] == 2
+    page = (tmp_path / "events" / "cafe-tacvba-payne-arena-2027-03-01.html").read_text()
+    assert "More <span class=\"text-highlight\">Café Tacvba</span> Shows" in page
+    assert "/events/cafe-tacvba-payne-arena-2027-03-02" in page
+    assert not (tmp_path / "events" / "draft-payne-arena-2027-04-01.html").exists()
+
+    sitemap = (tmp_path / "sitemap.xml").read_text()
+    assert "https://dtxent.com/events/cafe-tacvba-payne-arena-2027-03-02" in sitemap
+    assert "https://dtxent.com/events/cafe-tacvba</loc>" in sitemap
+    assert "March 2027" in (tmp_path / "events.html").read_text()
+
+
+def test_rebuild_only_touches_changed_pages(tmp_path):
+    events = _events()
+    _run(tmp_path, events)
+
+    stats = _run(tmp_path, events)
+    assert (stats["rendered"], stats["skipped"], stats["paths"]) == (0, 2, [])
+
+    events[1]["ticketUrl"] = "https://example.com/b2"
+    stats = _run(tmp_path, events)
+    # The changed event and the page that lists it under "More shows"
+    assert (stats["rendered"], stats["skipped"]) == (2, 0)
+
+    stats = _run(tmp_path, events[:1])
+    assert stats["deleted"] == 1
+    assert not (tmp_path / "events" / "cafe-tacvba-payne-arena-2027-03-02.html").exists()
+
+
+def test_event_passing_rerenders_its_page(tmp_path):
+    events = _events()[:1]
+    _run(tmp_path, events)
+    stats = _run(tmp_path, events, now=datetime(2027, 3, 2, 12, 0))
+    assert stats["rendered"] == 1
+    page = (tmp_path / "events" / "cafe-tacvba-payne-arena-2027-03-01.html").read_text()
+    assert "This event has already taken place." in page
@@ -0,0 +1,74 @@
+"""Research batch mode: job-file matrices, shared client, consolidated dedupe across jobs."""
+
+import threading
+
+import pytest
+
+import research_venues
+from gemini_client import GeminiClient
+from response_cache import ResponseCache
+
+
+def test_load_jobs_expands_and_dedupes_matrices(tmp_path):
+    jobs_file = tmp_path / "jobs.yaml"
+    jobs_file.write_text(
+        "concurrency: 2\n"
+        "top: 5\n"
+        "jobs:\n"
+        "  - categories: [restaurants, hotels]\n"
+        "    locations: ['Hidalgo, TX', 'McAllen, TX']\n"
+        "  - category: hotels\n"
+        "    location: 'McAllen, TX'\n"
+        "  - categories: [clubs]\n"
+        "    locations: ['South Padre Island, TX']\n"
+        "    radius: 10\n"
+    )
+    jobs, settings = research_venues.load_jobs(jobs_file)
+
+    assert settings == {"concurrency": 2}
+    assert len(jobs) == 5
+    assert jobs[-1] == {"category": "clubs", "location": "South Padre Island, TX", "radius": 10, "top": 5}
+
+    jobs_file.write_text("jobs:\n  - categories: [spas]\n    locations: [Hidalgo]\n")
+    with pytest.raises(ValueError):
+        research_venues.load_jobs(jobs_file)
+
+
+def test_run_batch_shares_one_client_and_consolidates(tmp_path, monkeypatch):
+    responses = {
+        ("restaurants", "Hidalgo, TX"): [
+            {"name": "Taqueria El Pato", "city": "Hidalgo", "confidence_score": 0.9},
+            {"name": "Santa Fe Steakhouse & Cantina", "city": "McAllen", "confidence_score": 0.9},  # on the site
+        ],
+        ("restaurants", "McAllen, TX"): [
+            {"name": "taqueria el pato ", "city": "Hidalgo", "confidence_score": 0.8},  # seen in another job
+            {"name": "Nonna's", "city": "McAllen", "confidence_score": 0.7},
+        ],
+        ("hotels", "Hidalgo, TX"): [{"name": "Hidalgo Inn", "city": "Hidalgo", "stars": 3, "confidence_score": 0.2}],
+        ("hotels", "McAllen, TX"): [],
+    }
+    clients, calls = [], []
+    lock = threading.Lock()
+
+    def fake_search(category, location, radius, top, cache=None, client=None):
+        with lock:
+            calls.append((category, location, client))
+        return [dict(r) for r in responses[(category, location)]]
+
+    monkeypatch.setattr(research_venues, "make_client",
+                        lambda: clients.append(GeminiClient(client=object())) or clients[-1])
+    monkeypatch.setattr(research_venues, "search_vendors", fake_search)
+
+    jobs = research_venues.expand_matrix(["restaurants", "hotels"], ["Hidalgo, TX", "McAllen, TX"])
+    report = research_venues.run_batch(jobs, cache=ResponseCache(tmp_path), concurrency=4, rate_limit=None)
+
+    assert len(clients) == 1 and {c for _, _, c in calls} == {clients[0]}
+    restaurants = report["results"]["LOCAL_RESTAURANTS"]
+    existing = report["existing"]["LOCAL_RESTAURANTS"]
+    assert [(r["id"], r["name"]) for r in restaurants] == [
+        (f"food-{existing + 1}", "Taqueria El Pato"),
+        (f"food-{existing + 2}", "Nonna's"),
+    ]
+    assert report["results"]["LOCAL_HOTELS"] == []  # below the confidence threshold
+    assert [j["new"] for j in report["jobs"]] == [1, 1, 0, 0]
+    assert report["gemini"]["calls"] == 0  # fake_search bypasses the client
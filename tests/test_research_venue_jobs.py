@@ -0,0 +1,40 @@
+"""Research jobs derived from LOCAL_EVENTS venues: weighting, windowing, stale-only scheduling."""
+
+from datetime import datetime
+
+import research_venues
+from response_cache import ResponseCache
+
+NOW = datetime(2026, 5, 1, 12, 0)
+
+EVENTS = [
+    {"artistName": "A", "eventDate": "2026-05-03T20:00:00", "venueName": "Payne Arena", "venueCity": "Hidalgo", "venueState": "TX"},
+    {"artistName": "B", "eventDate": "2026-05-10T20:00:00", "venueName": "payne arena ", "venueCity": "Hidalgo", "venueState": "TX",
+     "dates": [{"eventDate": "2026-05-10T20:00:00"}, {"eventDate": "2026-05-11T20:00:00"}, {"eventDate": "2026-07-01T20:00:00"}]},
+    {"artistName": "C", "eventDate": "2026-05-20T21:00:00", "venueName": "Cine El Rey", "venueCity": "McAllen", "venueState": "TX"},
+    {"artistName": "D", "eventDate": "2026-04-20T21:00:00", "venueName": "Past Hall", "venueCity": "McAllen", "venueState": "TX"},
+    {"artistName": "E", "eventDate": "2026-05-05T21:00:00", "venueName": "", "venueCity": ""},
+]
+
+
+def test_venue_targets_are_unique_and_weighted_by_upcoming_shows():
+    targets = research_venues.venue_targets(EVENTS, days=30, now=NOW)
+
+    assert [(t["venueName"], t["upcoming"]) for t in targets] == [("Payne Arena", 3), ("Cine El Rey", 1)]
+    assert research_venues.venue_targets(EVENTS, days=5, now=NOW)[0]["upcoming"] == 1
+
+
+def test_only_stale_venue_research_is_scheduled(tmp_path):
+    cache = ResponseCache(tmp_path, ttl_seconds=3600)
+    targets = research_venues.venue_targets(EVENTS, now=NOW)
+    fresh = {"category": "restaurants", "location": "Payne Arena, Hidalgo, TX", "radius": 10, "top": 10}
+    cache.put(research_venues.search_cache_key(**fresh), [])
+
+    jobs = research_venues.venue_jobs(targets, ["restaurants", "hotels"], cache)
+
+    assert [(j["category"], j["location"]) for j in jobs] == [
+        ("hotels", "Payne Arena, Hidalgo, TX"),
+        ("restaurants", "Cine El Rey, McAllen, TX"),
+        ("hotels", "Cine El Rey, McAllen, TX"),
+    ]
+    assert len(research_venues.venue_jobs(targets, ["restaurants", "hotels"], cache, max_jobs=2)) == 2
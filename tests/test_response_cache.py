@@ -0,0 +1,60 @@
+"""Response cache: fingerprints, TTL, LRU eviction, refresh bypass, blobs; research search reuse."""
+
+import os
+import time
+
+import research_venues
+from response_cache import ResponseCache, fingerprint
+
+
+def test_fingerprint_is_order_independent():
+    assert fingerprint(model="m", top=10, location="Hidalgo") == fingerprint(location="Hidalgo", top=10, model="m")
+    assert fingerprint(model="m", top=10) != fingerprint(model="m", top=5)
+
+
+def test_ttl_lru_and_refresh(tmp_path):
+    cache = ResponseCache(tmp_path, ttl_seconds=60, max_entries=2)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    old = time.time() - 30
+    os.utime(tmp_path / "b.json", (old, old))
+    assert cache.get("a") == [1]
+
+    cache.put("c", [3])  # b is least recently used
+    assert not (tmp_path / "b.json").exists()
+    assert cache.stats["evicted"] == 1
+
+    expired = ResponseCache(tmp_path, ttl_seconds=0)
+    time.sleep(0.01)
+    assert expired.get("a") is None and expired.stats["expired"] == 1
+
+    refreshing = ResponseCache(tmp_path, refresh=True)
+    assert refreshing.get("c") is None
+    assert "0 hit(s), 1 miss(es)" in refreshing.summary()
+
+
+def test_blobs_are_content_addressed_and_evicted_with_their_entries(tmp_path):
+    cache = ResponseCache(tmp_path, max_entries=1)
+    first = cache.put_blob(b"png-1", ".png")
+    assert cache.put_blob(b"png-1", ".png") == first and first.endswith(".png")
+    cache.put("a", {"blob": first}, meta={"blobs": [first]})
+    old = time.time() - 30
+    os.utime(tmp_path / "a.json", (old, old))
+
+    second = cache.put_blob(b"png-2", ".png")
+    cache.put("b", {"blob": second}, meta={"blobs": [second]})
+
+    assert not cache.blob_path(first).exists()
+    assert cache.blob_path(second).read_bytes() == b"png-2"
+
+
+def test_search_vendors_answers_repeat_queries_from_cache(tmp_path):
+    cache = ResponseCache(tmp_path)
+    key = research_venues.search_cache_key("restaurants", "Hidalgo, TX", radius=15, top=5)
+    assert key != research_venues.search_cache_key("restaurants", "Hidalgo, TX", radius=25, top=5)
+    cache.put(key, [{"name": "Taqueria", "city": "Hidalgo"}])
+
+    # google-genai isn't needed (or imported) for a cache hit
+    results = research_venues.search_vendors("restaurants", "Hidalgo, TX", radius=15, top=5, cache=cache)
+    assert results == [{"name": "Taqueria", "city": "Hidalgo"}]
+    assert cache.stats["hits"] == 1
@@ -0,0 +1,95 @@
+"""Social calendar: slot planning, history dedupe, queued generation with resume."""
+
+import json
+from datetime import datetime
+
+import generate_social_post as social
+import social_calendar
+from event_keys import event_id
+from gemini_client import GeminiClient
+from response_cache import ResponseCache
+
+NOW = datetime(2026, 10, 1, 8, 0)
+FAR = {"artistName": "Far", "eventDate": "2026-10-30T20:00:00", "venueName": "Payne Arena"}
+SOON = {"artistName": "Soon", "eventDate": "2026-10-11T20:00:00", "venueName": "Payne Arena"}
+NEXT_WEEK = {"artistName": "Next", "eventDate": "2026-10-04T20:00:00", "venueName": "Payne Arena"}
+LATER = {"artistName": "Later", "eventDate": "2026-12-20T20:00:00", "venueName": "Payne Arena"}
+
+
+def _plan(history=None):
+    slots, stats = social_calendar.plan_calendar([FAR, SOON, NEXT_WEEK, LATER], weeks=4, history=history, now=NOW)
+    return [(s["event"]["artistName"], s["kind"], s["postAt"]) for s in slots], stats
+
+
+def test_plan_schedules_each_kind_inside_the_window():
+    slots, stats = _plan()
+
+    assert slots == [
+        ("Soon", "announcement", "2026-10-01T09:00"),  # Announcement date already passed: post ASAP
+        ("Next", "reminder", "2026-10-01T12:00"),
+        ("Next", "day-of", "2026-10-04T09:00"),
+        ("Soon", "reminder", "2026-10-08T12:00"),
+        ("Far", "announcement", "2026-10-09T10:00"),
+        ("Soon", "day-of", "2026-10-11T09:00"),
+        ("Far", "reminder", "2026-10-27T12:00"),
+    ]
+    assert ("Next", "announcement") not in {(a, k) for a, k, _ in slots}  # Too close: reminder goes first
+    assert stats == {"events": 3, "slots": 7, "covered": 0}  # Far's day-of and LATER are past the horizon
+
+
+def test_show_past_its_reminder_time_still_gets_announced():
+    two_days_out = {"artistName": "Close", "eventDate": "2026-10-03T20:00:00", "venueName": "Payne Arena"}
+    slots, _ = social_calendar.plan_calendar([two_days_out], weeks=1, now=NOW)
+
+    assert [(s["kind"], s["postAt"]) for s in slots] == [
+        ("announcement", "2026-10-01T09:00"),  # The reminder time already passed, so announce now
+        ("day-of", "2026-10-03T09:00"),
+    ]
+
+def test_plan_skips_posts_already_in_history():
+    history = [
+        {"platform": "twitter", "events": [event_id(FAR), event_id(SOON)], "post": {}},  # A daily post
+        {"platform": "instagram", "kind": "reminder", "events": [event_id(FAR)], "post": {}},
+    ]
+    slots, stats = _plan(history)
+
+    assert {(a, k) for a, k, _ in slots if a in ("Far", "Soon")} == {("Soon", "reminder"), ("Soon", "day-of")}
+    assert stats["covered"] == 3
+
+
+def test_failed_jobs_are_retried_on_resume_from_the_cache(tmp_path, monkeypatch):
+    calls, fail, garbled = [], {"Far:twitter"}, {"Far:instagram"}
+
+    def fake_caption(events, platform, client, angle=None):
+        job = f"{events[0]['artistName']}:{platform}"
+        calls.append(job)
+        if job in fail:
+            raise RuntimeError("quota")
+        if job in garbled and angle == "reminder":
+            return {"caption": "raw model text", "short_caption": "", "hashtags": [], "fallback": True}
+        return {"caption": f"{angle} {job}", "short_caption": "", "hashtags": []}
+
+    monkeypatch.setattr(social, "generate_post_text", fake_caption)
+    slots, _ = social_calendar.plan_calendar([FAR], weeks=5, now=NOW)
+    manifest_path = tmp_path / "calendar.json"
+    run = lambda: social_calendar.run_calendar(
+        slots, ["twitter", "instagram"], manifest_path, client=GeminiClient(client=object()),
+        cache=ResponseCache(tmp_path / "cache"), concurrency=3, rate_limit=None, with_images=False)
+
+    first = run()
+    assert len(calls) == 6 and len(first["failed"]) == 4  # Three quota errors and one fallback caption
+    assert json.loads(manifest_path.read_text()) == first
+    assert {s["status"] for s in first["slots"]} == {"partial", "pending"}
+
+    fail.clear()
+    garbled.clear()
+    calls.clear()
+    resumed = run()
+    assert sorted(calls) == ["Far:instagram"] + ["Far:twitter"] * 3  # Good instagram captions came from the cache
+    assert resumed["failed"] == [] and {s["status"] for s in resumed["slots"]} == {"done"}
+    assert resumed["slots"][0]["posts"]["twitter"]["caption"].startswith("announcement")
+
+    history = tmp_path / "history.jsonl"
+    assert social_calendar.record_history(resumed, history) == 6
+    assert social_calendar.record_history(resumed, history) == 0
+    assert social_calendar.plan_calendar([FAR], weeks=5, history=social.load_history(history), now=NOW)[0] == []
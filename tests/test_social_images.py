@@ -0,0 +1,42 @@
+"""Promo image derivatives: focus-centered crops, letterboxing, size caps, manifest."""
+
+import json
+
+from PIL import Image, ImageDraw
+
+import social_images
+
+
+def _poster(path):
+    img = Image.new("RGB", (800, 800), (20, 10, 40))
+    draw = ImageDraw.Draw(img)
+    for x in range(560, 760, 12):  # Busy "subject" in the upper right
+        draw.line((x, 60, x + 40, 260), fill="white", width=3)
+    img.save(path)
+    return path
+
+
+def test_focus_and_crop_follow_the_subject(tmp_path):
+    with Image.open(_poster(tmp_path / "poster.png")) as img:
+        fx, fy = social_images.find_focus(img)
+    assert fx > 0.7 and fy < 0.3
+
+    # Crops of a square keep one full side and slide toward the subject, clamped to the edges
+    assert social_images.crop_box((800, 800), (1080, 1350), (fx, fy)) == (160, 0, 800, 800)
+    assert social_images.crop_box((800, 800), (1600, 900), (fx, fy)) == (0, 0, 800, 450)
+    assert social_images.crop_box((800, 800), (1600, 900), (0.5, 0.5)) == (0, 175, 800, 625)
+
+
+def test_derivatives_are_sized_capped_and_listed(tmp_path):
+    source = _poster(tmp_path / "2026-10-19_image.png")
+
+    manifest = social_images.build_derivatives(source, max_bytes=40_000, workers=2)
+
+    assert json.loads((tmp_path / "2026-10-19_images.json").read_text()) == manifest
+    assert len(manifest["files"]) == len(social_images.RENDITIONS) * len(social_images.FORMATS)
+    for f in manifest["files"]:
+        with Image.open(tmp_path / f["file"]) as img:
+            assert img.size == (f["width"], f["height"]) and img.format == f["format"]
+        assert f["bytes"] == (tmp_path / f["file"]).stat().st_size <= 40_000
+    modes = {(f["platform"], f["name"]): f["mode"] for f in manifest["files"]}
+    assert modes[("instagram", "portrait")] == "crop" and modes[("story", "vertical")] == "pad"
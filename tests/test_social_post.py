@@ -0,0 +1,121 @@
+"""Social posts: captions and image generated concurrently on one client, cached per lineup, with history."""
+
+import threading
+import time
+
+import generate_social_post as social
+from event_keys import event_id
+from gemini_client import GeminiClient
+from response_cache import ResponseCache
+
+EVENTS = [{"artistName": "A", "eventDate": "2027-01-01T20:00:00", "venueName": "Payne Arena"}]
+
+
+def test_all_platforms_and_image_run_concurrently_on_one_client(monkeypatch):
+    client = GeminiClient(client=object())
+    seen_clients, lock = set(), threading.Lock()
+
+    def fake_caption(events, platform, c):
+        with lock:
+            seen_clients.add(id(c))
+        time.sleep(0.2)
+        return {"caption": f"{platform} caption", "short_caption": "", "hashtags": []}
+
+    def fake_image(events, c):
+        with lock:
+            seen_clients.add(id(c))
+        time.sleep(0.2)
+        return b"png"
+
+    monkeypatch.setattr(social, "generate_post_text", fake_caption)
+    monkeypatch.setattr(social, "generate_promo_image", fake_image)
+
+    start = time.monotonic()
+    posts, image = social.generate_posts(EVENTS, social.MULTI_PLATFORMS, client)
+    elapsed = time.monotonic() - start
+
+    assert sorted(posts) == sorted(social.MULTI_PLATFORMS) and image == b"png"
+    assert seen_clients == {id(client)}
+    assert elapsed < 0.6  # Five 0.2s calls in parallel, not 1s in sequence
+
+
+def test_slow_calls_time_out_and_failures_are_skipped(monkeypatch):
+    def fake_caption(events, platform, c):
+        if platform == "tiktok":
+            raise RuntimeError("blocked")
+        return {"caption": platform, "short_caption": "", "hashtags": []}
+
+    monkeypatch.setattr(social, "generate_post_text", fake_caption)
+    monkeypatch.setattr(social, "generate_promo_image", lambda events, c: time.sleep(1) or b"late")
+
+    posts, image = social.generate_posts(EVENTS, ["twitter", "tiktok"], GeminiClient(client=object()), timeout=0.2)
+
+    assert list(posts) == ["twitter"] and image is None
+
+
+def test_cached_lineups_skip_generation_until_regenerate(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_caption(events, platform, c):
+        calls.append(platform)
+        return {"caption": f"{platform} #{len(calls)}", "short_caption": "", "hashtags": []}
+
+    def fake_image(events, c):
+        calls.append("image")
+        return b"png"
+
+    monkeypatch.setattr(social, "generate_post_text", fake_caption)
+    monkeypatch.setattr(social, "generate_promo_image", fake_image)
+    client = GeminiClient(client=object())
+
+    first = social.generate_posts(EVENTS, ["twitter", "instagram"], client, cache=ResponseCache(tmp_path))
+    again = social.generate_posts(EVENTS, ["twitter", "instagram"], client, cache=ResponseCache(tmp_path))
+    assert again == first and len(calls) == 3
+
+    # A different lineup or platform misses; --regenerate bypasses the cache
+    social.generate_posts(EVENTS, ["facebook"], client, with_image=False, cache=ResponseCache(tmp_path))
+    fresh, _ = social.generate_posts(EVENTS, ["twitter"], client, with_image=False,
+                                     cache=ResponseCache(tmp_path, refresh=True))
+    assert calls[3:] == ["facebook", "twitter"] and fresh["twitter"] != first[0]["twitter"]
+
+
+def test_fallback_captions_are_not_cached_and_filler_keys_are_dated(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_caption(events, platform, c):
+        calls.append(platform)
+        return {"caption": "raw model text", "short_caption": "", "hashtags": [], "fallback": True}
+
+    monkeypatch.setattr(social, "generate_post_text", fake_caption)
+    client = GeminiClient(client=object())
+    for _ in range(2):
+        posts, _ = social.generate_posts(EVENTS, ["twitter"], client, with_image=False,
+                                         cache=ResponseCache(tmp_path))
+        assert posts["twitter"]["caption"] == "raw model text"
+    assert calls == ["twitter", "twitter"]
+
+    class Tomorrow(social.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return super().now(tz) + social.timedelta(days=1)
+
+    today = social.caption_key([], "twitter")
+    assert social.caption_key([], "instagram") == today
+    monkeypatch.setattr(social, "datetime", Tomorrow)
+    assert social.caption_key([], "twitter") != today
+
+
+def test_history_lists_distinct_variants_per_lineup(tmp_path):
+    path = tmp_path / "history.jsonl"
+    ids = [event_id(e) for e in EVENTS]
+    post = lambda caption: {"caption": caption, "short_caption": caption}
+    social.append_history([
+        {"generatedAt": "2026-10-01T09:00", "platform": "twitter", "events": ids, "post": post("v1")},
+        {"generatedAt": "2026-10-02T09:00", "platform": "twitter", "events": ids, "post": post("v1")},  # Cache hit
+        {"generatedAt": "2026-10-03T09:00", "platform": "twitter", "events": ids, "post": post("v2")},
+        {"generatedAt": "2026-10-03T09:00", "platform": "instagram", "events": ids, "post": post("ig")},
+        {"generatedAt": "2026-10-04T09:00", "platform": "twitter", "events": ["other"], "post": post("x")},
+    ], path)
+
+    variants = social.find_variants(social.load_history(path), EVENTS, "twitter")
+    assert [v["post"]["caption"] for v in variants] == ["v1", "v2"]
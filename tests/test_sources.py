@@ -0,0 +1,104 @@
+"""Source registry: concurrent collection from config, statuses, cache policy, rate limits, abstract fetch."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+import http_replay
+import sources
+
+
+@pytest.fixture
+def source_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(sources, "TMP_DIR", tmp_path / ".tmp")
+    manual = tmp_path / "manual.json"
+    manual.write_text(json.dumps([
+        {"_comment": "ignored"},
+        {"artistName": "Manual Act", "eventDate": "2027-01-01T20:00:00", "venueName": "Citrus Live"},
+        {"artistName": "Draft", "eventDate": "2027-01-02T20:00:00", "isPublished": False},
+    ]))
+    entries = json.loads(sources.CONFIG_FILE.read_text(encoding="utf-8"))["sources"]
+    for entry in entries:
+        if entry["type"] == "manual":
+            entry["file"] = str(manual)  # absolute path wins over SCRIPT_DIR
+        entry["rateLimit"] = None
+    return entries
+
+
+def test_collects_all_configured_sources(source_config, scrapers_cassette, monkeypatch):
+    monkeypatch.setenv("TM_API_KEY", "test-key")
+    with http_replay.use_cassette(scrapers_cassette) as adapter:
+        events, statuses = asyncio.run(sources.collect(sources.build_sources(source_config)))
+
+    assert {s["name"]: (s["status"], s["eventsFound"]) for s in statuses} == {
+        "manual": ("success", 1), "paynearena": ("success", 3), "tixplug": ("success", 3), "ticketmaster": ("success", 3),
+    }
+    # Config order is preserved, so manual entries keep dedupe precedence
+    assert events[0]["artistName"] == "Manual Act" and events[0]["source"] == "manual"
+    assert [e["source"] for e in events[1:4]] == ["paynearena"] * 3
+    assert len(json.loads((sources.TMP_DIR / "tixplug_events.json").read_text(encoding="utf-8"))) == 3
+    assert adapter.misses == []
+
+
+def test_missing_key_skips_and_fresh_cache_is_reused(source_config, monkeypatch):
+    monkeypatch.delenv("TM_API_KEY", raising=False)
+    monkeypatch.setattr("scrape_ticketmaster.load_api_key", lambda: "")
+    tm = [e for e in source_config if e["type"] == "ticketmaster"]
+    _, statuses = asyncio.run(sources.collect(sources.build_sources(tm)))
+    assert statuses[0]["status"] == "skipped"
+
+    cached = {**tm[0], "name": "tixplug", "type": "tixplug", "cacheTtlMinutes": 60}
+    sources.TMP_DIR.mkdir(parents=True, exist_ok=True)
+    (sources.TMP_DIR / "tixplug_events.json").write_text(json.dumps([{"artistName": "Cached"}]))
+    events, statuses = asyncio.run(sources.collect(sources.build_sources([cached])))  # no cassette: network unused
+    assert (events, statuses[0]["status"]) == ([{"artistName": "Cached"}], "cached")
+
+
+def test_rate_limiter_spaces_calls():
+    async def burst():
+        limiter = sources.RateLimiter(50)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.wait() for _ in range(6)))
+        return time.monotonic() - start
+
+    assert asyncio.run(burst()) >= 0.09
+
+
+def test_sources_must_implement_fetch():
+    class Incomplete(sources.Source):
+        type = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete({"name": "incomplete"})
+
+
+def test_source_skipped_midway_contributes_no_events():
+    class Flaky(sources.Source):
+        type = "flaky"
+
+        async def fetch(self):
+            yield {"artistName": "Early"}
+            raise sources.SourceUnavailable("quota exhausted")
+
+    events, statuses = asyncio.run(sources.collect([Flaky({"name": "flaky"})]))
+
+    assert events == []
+    assert (statuses[0]["status"], statuses[0]["eventsFound"]) == ("skipped", 0)
+
+
+def test_undated_events_sort_after_dated_ones(tmp_path, monkeypatch):
+    monkeypatch.setattr(sources, "TMP_DIR", tmp_path)
+
+    class Unordered(sources.Source):
+        type = "unordered"
+
+        async def fetch(self):
+            for event in ({"artistName": "TBA Show"}, {"artistName": "B", "eventDate": "2027-02-01"},
+                          {"artistName": "A", "eventDate": "2027-01-01"}):
+                yield event
+
+    events, _ = asyncio.run(sources.collect([Unordered({"name": "unordered"})]))
+
+    assert [e["artistName"] for e in events] == ["A", "B", "TBA Show"]
@@ -0,0 +1,45 @@
+"""Near-venue vendor lists: nearest-first lists, venue resolution, incremental refresh."""
+
+import venue_vendors
+
+TABLE = [
+    {"name": "Payne Arena", "city": "Hidalgo", "state": "TX", "lat": 26.1108, "lng": -98.2464},
+    {"name": "Cameron County Amphitheater", "city": "South Padre Island", "state": "TX", "lat": 26.075, "lng": -97.158},
+]
+EVENTS = [
+    {"artistName": "A", "venueName": "Payne Arena", "venueCity": "Hidalgo"},
+    {"artistName": "B", "venueName": "Payne Arena", "venueCity": "Hidalgo"},
+    {"artistName": "C", "venueName": "Cameron County Amphitheater", "venueCity": ""},
+    {"artistName": "D", "venueName": "Somewhere New", "venueCity": "Mission"},
+]
+ARRAYS = {
+    "LOCAL_RESTAURANTS": [
+        {"id": "food-far", "lat": 26.30, "lng": -98.20},
+        {"id": "food-near", "lat": 26.12, "lng": -98.24},
+    ],
+    "DINING_RESTAURANTS": [{"id": "dining-no-coords", "address": "McAllen, TX"}],
+    "LOCAL_HOTELS": [{"id": "hotel-spi", "lat": 26.09, "lng": -97.16}],
+    "LOCAL_CLUBS": [],
+}
+
+
+def test_lists_are_nearest_first_and_capped():
+    entries, stats = venue_vendors.build_venue_vendors(EVENTS, ARRAYS, TABLE, k=1, max_m=50_000)
+
+    payne = next(e for e in entries if e["venueName"] == "Payne Arena")
+    assert [vid for vid, _ in payne["restaurants"]] == ["food-near"]
+    assert payne["hotels"] == []  # South Padre is ~110 km away
+    spi = next(e for e in entries if e["venueName"] == "Cameron County Amphitheater")
+    assert spi["hotels"][0][0] == "hotel-spi" and spi["hotels"][0][1] < 2_000
+    assert stats["unresolved"] == ["Somewhere New (Mission)"]
+
+
+def test_unchanged_venues_are_reused_and_vendor_changes_recompute():
+    first, _ = venue_vendors.build_venue_vendors(EVENTS, ARRAYS, TABLE)
+    again, stats = venue_vendors.build_venue_vendors(EVENTS, ARRAYS, TABLE, previous=first)
+    assert again == first and (stats["recomputed"], stats["reused"]) == (0, 2)
+
+    moved = {**ARRAYS, "LOCAL_HOTELS": [{"id": "hotel-hidalgo", "lat": 26.11, "lng": -98.25}]}
+    updated, stats = venue_vendors.build_venue_vendors(EVENTS, moved, TABLE, previous=first)
+    assert stats["recomputed"] == 2
+    assert next(e for e in updated if e["venueName"] == "Payne Arena")["hotels"][0][0] == "hotel-hidalgo"